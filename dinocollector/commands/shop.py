@@ -70,10 +70,13 @@ class Shop(MixinMeta):
         user_conf.has_dinocoins -= price
         user_conf.has_spent_dinocoins += price
         user_conf.current_inventory_upgrade_level += 1
+        conf.economy.spend(price)
+        conf.economy.upgrades_bought += 1
         
         # Calculate new size for display
         new_size = conf.base_inventory_size + (user_conf.current_inventory_upgrade_level * conf.inventory_per_upgrade)
         
+        user_conf.touch()
         self.save()
         
         await ctx.send(f"🎉 Upgrade successful! Your inventory size is now **{new_size}**. Remaining coins: {user_conf.has_dinocoins}")
@@ -112,7 +115,10 @@ class Shop(MixinMeta):
         user_conf.has_dinocoins -= price
         user_conf.has_spent_dinocoins += price
         user_conf.has_lure = True
+        conf.economy.spend(price)
+        conf.economy.lures_bought += 1
         
+        user_conf.touch()
         self.save()
         
         # Achievements
@@ -195,7 +195,11 @@ class User(MixinMeta):
             user_conf.total_dinocoins_earned += reward
             # Increment sold count
             user_conf.explorer_logs_sold += 1
+            conf.economy.earn(reward)
+            conf.economy.log_revenue += reward
+            conf.economy.logs_sold += 1
             
+            user_conf.touch()
             self.save()
             
             await msg.edit(content=f"You sold your Explorer Log for {reward} DinoCoins!", view=None)
@@ -349,10 +353,12 @@ class User(MixinMeta):
         
         # We need to be careful about indices shifting if we pop them one by one.
         # Better to collect the objects first.
+        user_conf.ensure_dino_ids()
         for i in to_sell_indices:
             dino = user_conf.current_dino_inv[i]
             total_value += dino.get("value", 0)
             dinos_to_remove.append(dino)
+        uids_to_sell = {dino["uid"] for dino in dinos_to_remove}
 
         count = len(dinos_to_remove)
         
@@ -401,40 +407,43 @@ class User(MixinMeta):
         
         if view.confirmed:
             # Process Sale
-            # Remove items. Since objects are references, we can remove them from the list.
-            # But removing from list while iterating is tricky.
-            # Rebuild the list excluding the sold ones.
-            
-            # Create a new list for inventory
-            new_inv = []
-            # We can't just use "if dino not in dinos_to_remove" because of duplicates.
-            # We need to remove specific instances.
-            
-            # Let's use a set of indices to keep
-            indices_to_sell = set(to_sell_indices)
-            for i, dino in enumerate(user_conf.current_dino_inv):
-                if i not in indices_to_sell:
-                    new_inv.append(dino)
-            
-            # Calculate Bonus
-            bonus_amount = 0
-            bonus_percent = 0
-            
-            if conf.buddy_bonus_enabled and user_conf.buddy_dino:
-                rarity = user_conf.buddy_dino_rarity.lower()
-                bonus_percent = buddy_bonuses.get(rarity, 0)
-                if bonus_percent > 0:
-                    bonus_amount = math.ceil(total_value * (bonus_percent / 100))
-            
-            final_total = total_value + bonus_amount
+            # Match by uid rather than index, the inventory may have changed while confirming.
+            # Nothing below awaits before the save, so no other command can run in between.
+            new_inv = [dino for dino in user_conf.current_dino_inv if dino.get("uid") not in uids_to_sell]
+            sold_all = len(user_conf.current_dino_inv) - len(new_inv) == len(uids_to_sell)
+                
+            if sold_all:
+                # Calculate Bonus
+                bonus_amount = 0
+                bonus_percent = 0
+                    
+                if conf.buddy_bonus_enabled and user_conf.buddy_dino:
+                    rarity = user_conf.buddy_dino_rarity.lower()
+                    bonus_percent = buddy_bonuses.get(rarity, 0)
+                    if bonus_percent > 0:
+                        bonus_amount = math.ceil(total_value * (bonus_percent / 100))
+                    
+                final_total = total_value + bonus_amount
 
-            user_conf.current_dino_inv = new_inv
-            user_conf.has_dinocoins += final_total
-            user_conf.total_dinocoins_earned += final_total
-            user_conf.total_ever_sold += count
-            user_conf.buddy_bonus_total_gained += bonus_amount
-            
-            self.save()
+                user_conf.current_dino_inv = new_inv
+                user_conf.has_dinocoins += final_total
+                user_conf.total_dinocoins_earned += final_total
+                user_conf.total_ever_sold += count
+                user_conf.buddy_bonus_total_gained += bonus_amount
+                conf.economy.earn(final_total)
+                conf.economy.sale_revenue += total_value
+                conf.economy.buddy_bonus_paid += bonus_amount
+                conf.economy.dinos_sold += count
+                    
+                user_conf.touch()
+                self.save()
+
+            if not sold_all:
+                embed.title = "Sale Failed"
+                embed.description = "Your inventory changed before the sale was confirmed. No dinos were sold, please try again."
+                embed.color = discord.Color.red()
+                await msg.edit(embed=embed, view=None)
+                return
             
             # Economy Achievements
             if user_conf.total_dinocoins_earned >= 1000:
@@ -521,6 +530,7 @@ class User(MixinMeta):
         # Remove from inventory
         user_conf.current_dino_inv.pop(idx)
         
+        user_conf.touch()
         self.save()
         
         modifier = dino.get("modifier", "Normal")
@@ -554,6 +564,7 @@ class User(MixinMeta):
         user_conf.buddy_dino_rarity = ""
         user_conf.buddy_name = ""
         
+        user_conf.touch()
         self.save()
         
         await ctx.send("Your buddy has been returned to your inventory.")
@@ -575,6 +586,7 @@ class User(MixinMeta):
             
         # Set nickname
         user_conf.buddy_name = name
+        user_conf.touch()
         self.save()
         
         await ctx.send(f"Your buddy has been renamed to **{name}**!")
@@ -644,6 +656,8 @@ class User(MixinMeta):
         user_conf.has_lure = False
         user_conf.last_lure_use = now
         user_conf.total_lures_used += 1
+        conf.economy.lures_used += 1
+        user_conf.touch()
         self.save()
 
         # Trigger Spawn
@@ -667,6 +681,7 @@ class User(MixinMeta):
             # Refund Lure if something breaks
             user_conf.has_lure = True
             user_conf.last_lure_use = 0 # Reset cooldown
+            user_conf.touch()
             self.save()
             await ctx.send("The lure failed to attract anything. (Lure returned)")
 
@@ -709,8 +724,14 @@ class User(MixinMeta):
             await ctx.send(f"Invalid dino ID for you. Please choose between 1 and {len(sender_conf.current_dino_inv)}.")
             return
             
+        # Trades are committed by uid, not position, in case the inventories change before acceptance
+        sender_conf.ensure_dino_ids()
+        recipient_conf.ensure_dino_ids()
+
         dino_to_give = sender_conf.current_dino_inv[s_idx]
+        give_uid = dino_to_give["uid"]
         dino_to_receive = None
+        receive_uid = None
         price = 0
 
         # Validate Trade Type Specifics
@@ -745,6 +766,7 @@ class User(MixinMeta):
                 return
             
             dino_to_receive = recipient_conf.current_dino_inv[r_idx]
+            receive_uid = dino_to_receive["uid"]
 
         # Send Trade Request
         embed = discord.Embed(title="Trade Request", color=discord.Color.gold())
@@ -769,35 +791,70 @@ class User(MixinMeta):
         await view.wait()
         
         if view.confirmed:
-            # Re-validate EVERYTHING
-            if dino_to_give not in sender_conf.current_dino_inv:
-                await ctx.send(f"Trade failed: {ctx.author.display_name} no longer has the dino they offered!")
-                return
+            # Re-validate and commit against dino uids, captures/sales while the view was open
+            # may have shifted inventory positions. Nothing below awaits before the save, so
+            # no other command can run in between.
+            error = None
+            s_idx = sender_conf.find_dino(give_uid)
+            r_idx = recipient_conf.find_dino(receive_uid) if receive_uid else -1
+            recipient_inv_size = conf.base_inventory_size + (recipient_conf.current_inventory_upgrade_level * conf.inventory_per_upgrade)
 
-            if trade_type == "free" or trade_type == "coin":
-                recipient_inv_size = conf.base_inventory_size + (recipient_conf.current_inventory_upgrade_level * conf.inventory_per_upgrade)
-                if len(recipient_conf.current_dino_inv) >= recipient_inv_size:
-                    await ctx.send(f"Trade failed: {user.display_name}'s inventory is full!")
-                    return
-            
-            if trade_type == "coin":
-                if recipient_conf.has_dinocoins < price:
-                    await ctx.send(f"Trade failed: {user.display_name} does not have enough coins!")
-                    return
-            
-            if trade_type == "dino":
-                if dino_to_receive not in recipient_conf.current_dino_inv:
-                    await ctx.send(f"Trade failed: {user.display_name} no longer has the requested dino!")
-                    return
+            if s_idx < 0:
+                error = f"Trade failed: {ctx.author.display_name} no longer has the dino they offered!"
+            elif trade_type in ["free", "coin"] and len(recipient_conf.current_dino_inv) >= recipient_inv_size:
+                error = f"Trade failed: {user.display_name}'s inventory is full!"
+            elif trade_type == "coin" and recipient_conf.has_dinocoins < price:
+                error = f"Trade failed: {user.display_name} does not have enough coins!"
+            elif trade_type == "dino" and r_idx < 0:
+                error = f"Trade failed: {user.display_name} no longer has the requested dino!"
+
+            if not error:
+                # Execute Trade
+                dino_to_give = sender_conf.current_dino_inv.pop(s_idx)
+                if trade_type == "dino":
+                    dino_to_receive = recipient_conf.current_dino_inv.pop(r_idx)
+                    sender_conf.current_dino_inv.append(dino_to_receive)
+
+                    # Update Log for Sender (since they received a dino)
+                    already_in_log_s = any(d.get("name") == dino_to_receive["name"] for d in sender_conf.explorer_log)
+                    if not already_in_log_s:
+                        sender_conf.explorer_log.append({"name": dino_to_receive["name"]})
+                        sender_conf.explorer_log.sort(key=lambda x: x["name"])
+                recipient_conf.current_dino_inv.append(dino_to_give)
+
+                # Update Log for Recipient
+                already_in_log = any(d.get("name") == dino_to_give["name"] for d in recipient_conf.explorer_log)
+                if not already_in_log:
+                    recipient_conf.explorer_log.append({"name": dino_to_give["name"]})
+                    recipient_conf.explorer_log.sort(key=lambda x: x["name"])
+
+                # Transfer Funds
+                if trade_type == "coin":
+                    recipient_conf.has_dinocoins -= price
+                    recipient_conf.has_spent_dinocoins += price
+                    sender_conf.has_dinocoins += price
+                    sender_conf.total_dinocoins_earned += price
+                    conf.economy.spend(price)
+                    conf.economy.earn(price)
+                    conf.economy.trade_coin_volume += price
+
+                # Update Stats
+                if trade_type == "free":
+                    sender_conf.total_gifts_given += 1
+                    recipient_conf.total_gifts_received += 1
+                sender_conf.total_ever_traded += 1
+                recipient_conf.total_ever_traded += 1
+
+                sender_conf.touch()
+                recipient_conf.touch()
+                self.save()
+
+            if error:
+                await ctx.send(error)
+                return
 
-            # Execute Trade
-            sender_conf.current_dino_inv.remove(dino_to_give)
-            recipient_conf.current_dino_inv.append(dino_to_give)
-            
             # Achievements
             if trade_type == "free":
-                sender_conf.total_gifts_given += 1
-                recipient_conf.total_gifts_received += 1
                 await self.check_achievement(sender_conf, "first_gift", ctx)
                 await self.check_achievement(recipient_conf, "receive_gift", ctx)
                 if sender_conf.total_gifts_given >= 5:
@@ -810,28 +867,6 @@ class User(MixinMeta):
             else:
                 await self.check_achievement(sender_conf, "first_trade", ctx)
             
-            if trade_type == "dino":
-                recipient_conf.current_dino_inv.remove(dino_to_receive)
-                sender_conf.current_dino_inv.append(dino_to_receive)
-                
-                # Update Log for Sender (since they received a dino)
-                assert dino_to_receive is not None  # for type checker
-                already_in_log_s = any(d.get("name") == dino_to_receive["name"] for d in sender_conf.explorer_log)
-                if not already_in_log_s:
-                    sender_conf.explorer_log.append({"name": dino_to_receive["name"]})
-                    sender_conf.explorer_log.sort(key=lambda x: x["name"])
-
-            # Transfer Funds
-            if trade_type == "coin":
-                recipient_conf.has_dinocoins -= price
-                recipient_conf.has_spent_dinocoins += price
-                sender_conf.has_dinocoins += price
-                sender_conf.total_dinocoins_earned += price
-            
-            # Update Stats
-            sender_conf.total_ever_traded += 1
-            recipient_conf.total_ever_traded += 1
-            
             # Trade milestone achievements
             if sender_conf.total_ever_traded >= 10:
                 await self.check_achievement(sender_conf, "trade_10", ctx)
@@ -842,14 +877,6 @@ class User(MixinMeta):
             if recipient_conf.total_ever_traded >= 25:
                 await self.check_achievement(recipient_conf, "trade_25", ctx)
             
-            # Update Log for Recipient
-            already_in_log = any(d.get("name") == dino_to_give["name"] for d in recipient_conf.explorer_log)
-            if not already_in_log:
-                recipient_conf.explorer_log.append({"name": dino_to_give["name"]})
-                recipient_conf.explorer_log.sort(key=lambda x: x["name"])
-
-            self.save()
-            
             embed.title = "Trade Successful"
             embed.color = discord.Color.green()
             embed.clear_fields()
@@ -882,6 +909,7 @@ class User(MixinMeta):
             
         conf = self.db.get_conf(ctx.guild)
         user_conf = conf.get_user(user)
+        snapshot = self.stats_cache.get(ctx.guild.id, user.id, user_conf)
         
         embed = discord.Embed(title=f"DinoCollector Stats: {user.display_name}", color=discord.Color.blue())
         embed.set_thumbnail(url=user.display_avatar.url)
@@ -892,7 +920,7 @@ class User(MixinMeta):
         
         # Inventory
         current_inv_size = conf.base_inventory_size + (user_conf.current_inventory_upgrade_level * conf.inventory_per_upgrade)
-        embed.add_field(name="🎒 Inventory", value=f"{len(user_conf.current_dino_inv)}/{current_inv_size}", inline=True)
+        embed.add_field(name="🎒 Inventory", value=f"{snapshot.inventory_count}/{current_inv_size}", inline=True)
         
         # Stats
         embed.add_field(name="🦖 Total Caught", value=f"{user_conf.total_ever_claimed}", inline=True)
@@ -912,15 +940,10 @@ class User(MixinMeta):
         embed.add_field(name="🥇 First Catch", value=f"{first_dino}\n{first_time_str}", inline=True)
         
         # Buddy Dino
-        if user_conf.buddy_dino:
-            b_mod = user_conf.buddy_dino.get("modifier", "Normal")
-            b_name = user_conf.buddy_dino.get("name", "Unknown")
-            b_rarity = user_conf.buddy_dino.get("rarity", "Common").title()
-            buddy_str = f"{b_mod} {b_name}\n({b_rarity})"
-        else:
-            buddy_str = "None"
-            
-        embed.add_field(name="🦕 Buddy", value=buddy_str, inline=True)
+        embed.add_field(name="🦕 Buddy", value=snapshot.buddy_str, inline=True)
+
+        # Explorer Log
+        embed.add_field(name="📖 Explorer Log", value=f"{snapshot.log_caught}/{snapshot.log_total} ({snapshot.log_percent:.0f}%)", inline=True)
 
         # Explorer Logs Sold
         embed.add_field(name="📚 Logs Sold", value=f"{user_conf.explorer_logs_sold}", inline=True)
@@ -1018,29 +1041,41 @@ class User(MixinMeta):
             pass
         
         if view.confirmed:
-            # Re-check balance just in case
-            if user_conf.has_dinocoins < dinocoins_to_deduct:
-                await ctx.send("Transaction failed: Insufficient funds (balance changed).")
-                return
+            # Hold the user's lock across the bank call so the deduct/refund pair can't interleave with another conversion
+            async with self.user_locks.acquire(ctx.guild.id, ctx.author.id):
+                # Re-check balance just in case
+                if user_conf.has_dinocoins < dinocoins_to_deduct:
+                    await ctx.send("Transaction failed: Insufficient funds (balance changed).")
+                    return
+                    
+                user_conf.has_dinocoins -= dinocoins_to_deduct
+                user_conf.has_spent_dinocoins += dinocoins_to_deduct
+                user_conf.total_converted_dinocoin += dinocoins_to_deduct
+                conf.economy.spend(dinocoins_to_deduct)
+                conf.economy.total_converted += dinocoins_to_deduct
+                conf.economy.conversions += 1
+                user_conf.touch()
+                self.save()
                 
-            user_conf.has_dinocoins -= dinocoins_to_deduct
-            user_conf.has_spent_dinocoins += dinocoins_to_deduct
-            user_conf.total_converted_dinocoin += dinocoins_to_deduct
-            self.save()
-            
+                try:
+                    await bank.deposit_credits(ctx.author, currency_to_receive)
+                except Exception as e:
+                    # Refund if bank fails
+                    user_conf.has_dinocoins += dinocoins_to_deduct
+                    user_conf.has_spent_dinocoins -= dinocoins_to_deduct
+                    user_conf.total_converted_dinocoin -= dinocoins_to_deduct
+                    conf.economy.spend(-dinocoins_to_deduct)
+                    conf.economy.total_converted -= dinocoins_to_deduct
+                    conf.economy.conversions -= 1
+                    user_conf.touch()
+                    self.save()
+                    await ctx.send(f"Transaction failed during bank deposit: {e}")
+                    return
+
+            await ctx.send(f"Successfully converted **{dinocoins_to_deduct}** DinoCoins into **{currency_to_receive} {currency_name}**!")
+
             # Achievement for first conversion
             await self.check_achievement(user_conf, "convert_first", ctx)
-            
-            try:
-                await bank.deposit_credits(ctx.author, currency_to_receive)
-                await ctx.send(f"Successfully converted **{dinocoins_to_deduct}** DinoCoins into **{currency_to_receive} {currency_name}**!")
-            except Exception as e:
-                # Refund if bank fails
-                user_conf.has_dinocoins += dinocoins_to_deduct
-                user_conf.has_spent_dinocoins -= dinocoins_to_deduct
-                user_conf.total_converted_dinocoin -= dinocoins_to_deduct
-                self.save()
-                await ctx.send(f"Transaction failed during bank deposit: {e}")
         else:
             await ctx.send("Conversion cancelled.")
 
@@ -1089,24 +1124,29 @@ class User(MixinMeta):
         await view.wait()
         
         if view.confirmed:
-            # Re-check balance just in case
-            try:
-                current_balance = await bank.get_balance(ctx.author)
-            except Exception as e:
-                await msg.edit(content=f"Transaction failed: Could not verify balance: {e}", view=None)
-                return
+            async with self.user_locks.acquire(ctx.guild.id, ctx.author.id):
+                # Re-check balance just in case
+                try:
+                    current_balance = await bank.get_balance(ctx.author)
+                except Exception as e:
+                    await msg.edit(content=f"Transaction failed: Could not verify balance: {e}", view=None)
+                    return
                 
-            if current_balance < amount:
-                await msg.edit(content="Transaction failed: Insufficient funds (balance changed).", view=None)
-                return
+                if current_balance < amount:
+                    await msg.edit(content="Transaction failed: Insufficient funds (balance changed).", view=None)
+                    return
                 
-            try:
-                await bank.withdraw_credits(ctx.author, amount)
-                user_conf.has_dinocoins += dinocoins_to_receive
-                user_conf.total_dinocoins_earned += dinocoins_to_receive
-                self.save()
-                await msg.edit(content=f"Successfully invested **{amount} {currency_name}** for **{dinocoins_to_receive}** DinoCoins!", view=None)
-            except Exception as e:
-                await msg.edit(content=f"Transaction failed during bank withdrawal: {e}", view=None)
+                try:
+                    await bank.withdraw_credits(ctx.author, amount)
+                    user_conf.has_dinocoins += dinocoins_to_receive
+                    user_conf.total_dinocoins_earned += dinocoins_to_receive
+                    conf.economy.earn(dinocoins_to_receive)
+                    conf.economy.investments += 1
+                    conf.economy.currency_invested += amount
+                    user_conf.touch()
+                    self.save()
+                    await msg.edit(content=f"Successfully invested **{amount} {currency_name}** for **{dinocoins_to_receive}** DinoCoins!", view=None)
+                except Exception as e:
+                    await msg.edit(content=f"Transaction failed during bank withdrawal: {e}", view=None)
         else:
             await msg.edit(content="Investment cancelled.", view=None)
@@ -0,0 +1,108 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+import discord
+
+log = logging.getLogger("red.dinocollector.cleanup")
+
+# Discord refuses bulk deletes for messages older than 14 days.
+# Keep a small safety margin so a message doesn't age out mid-request.
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+BULK_DELETE_MAX_BATCH = 100
+
+
+class CleanupQueue:
+    """Collects spawn messages per channel and deletes them in batches.
+
+    Messages are queued with a due time instead of each spawn keeping its own
+    sleeping task. `flush` groups everything that is due by channel and uses
+    `channel.delete_messages` (one REST call per 100 messages). Only messages
+    too old for the bulk endpoint fall back to single deletes.
+    """
+
+    def __init__(self):
+        # channel_id -> [(message_id, due_timestamp)]
+        self.pending: Dict[int, List[Tuple[int, float]]] = {}
+        # Stats
+        self.bulk_calls = 0
+        self.single_calls = 0
+        self.deleted = 0
+
+    def add(self, message: discord.Message, delay: float = 0) -> None:
+        due = time.time() + delay
+        self.pending.setdefault(message.channel.id, []).append((message.id, due))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.pending.values())
+
+    def pop_due(self, now: float = None, force: bool = False) -> Dict[int, List[int]]:
+        """Remove and return every due message id grouped by channel."""
+        now = now or time.time()
+        due: Dict[int, List[int]] = {}
+        for channel_id in list(self.pending.keys()):
+            entries = self.pending[channel_id]
+            ready = [mid for mid, when in entries if force or when <= now]
+            if not ready:
+                continue
+            remaining = [(mid, when) for mid, when in entries if not (force or when <= now)]
+            if remaining:
+                self.pending[channel_id] = remaining
+            else:
+                del self.pending[channel_id]
+            due[channel_id] = ready
+        return due
+
+    async def flush(self, bot, cog=None, force: bool = False) -> None:
+        """Delete every due message. Pass force=True to flush regardless of due time (unload)."""
+        due = self.pop_due(force=force)
+        for channel_id, message_ids in due.items():
+            channel = bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            # Cleanup may have been toggled off since the message was queued
+            if cog is not None and channel.guild:
+                conf = cog.db.get_conf(channel.guild)
+                if not conf.message_cleanup_enabled:
+                    continue
+            await self.delete_from_channel(channel, message_ids)
+
+    async def delete_from_channel(self, channel: discord.TextChannel, message_ids: List[int]) -> None:
+        cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+        recent = []
+        old = []
+        for mid in message_ids:
+            if discord.utils.snowflake_time(mid) > cutoff:
+                recent.append(mid)
+            else:
+                old.append(mid)
+
+        for i in range(0, len(recent), BULK_DELETE_MAX_BATCH):
+            chunk = recent[i:i + BULK_DELETE_MAX_BATCH]
+            if len(chunk) == 1:
+                # Bulk endpoint requires at least 2 ids
+                old.extend(chunk)
+                continue
+            try:
+                await channel.delete_messages([discord.Object(id=mid) for mid in chunk])
+                self.bulk_calls += 1
+                self.deleted += len(chunk)
+            except discord.Forbidden:
+                # Bulk delete needs Manage Messages, the bot can always delete its own messages
+                old.extend(chunk)
+            except discord.NotFound as e:
+                # The channel is gone, so are its messages
+                log.debug(f"Bulk delete failed in channel {channel.id}: {e}")
+            except discord.HTTPException as e:
+                # A bad id or a server error fails the whole batch, delete them one at a time instead
+                log.debug(f"Bulk delete failed in channel {channel.id}, deleting individually: {e}")
+                old.extend(chunk)
+
+        for mid in old:
+            try:
+                await channel.get_partial_message(mid).delete()
+                self.single_calls += 1
+                self.deleted += 1
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                pass
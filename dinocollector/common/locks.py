@@ -0,0 +1,45 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Tuple
+from weakref import WeakValueDictionary
+
+
+class UserLocks:
+    """Per-user asyncio locks for operations that span awaits.
+
+    Only code that awaits between reading and writing a user's data needs one
+    (a bank call in dcconvert/dcinvest). Multi-user operations take every lock
+    they need in ascending user id order, so two of them over the same pair of
+    users can never deadlock. Operations on unrelated users never wait on each other.
+
+    Locks are held in a WeakValueDictionary, so a lock nobody holds or waits on
+    is dropped instead of accumulating one per user forever.
+    """
+
+    def __init__(self):
+        self._locks: "WeakValueDictionary[Tuple[int, int], asyncio.Lock]" = WeakValueDictionary()
+
+    def get(self, guild_id: int, user_id: int) -> asyncio.Lock:
+        key = (guild_id, user_id)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    def locked(self, guild_id: int, user_id: int) -> bool:
+        lock = self._locks.get((guild_id, user_id))
+        return lock is not None and lock.locked()
+
+    @asynccontextmanager
+    async def acquire(self, guild_id: int, *user_ids: int):
+        locks = [self.get(guild_id, uid) for uid in sorted(set(user_ids))]
+        acquired = []
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
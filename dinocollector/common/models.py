@@ -1,11 +1,17 @@
 from typing import List, Dict
+from uuid import uuid4
 import discord
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from . import Base
 from ..databases.constants import DEFAULT_DISALLOWED_NAMES
 
 
+def new_dino_uid() -> str:
+    """Stable id for a dino instance so trades and sales don't depend on list positions."""
+    return uuid4().hex[:12]
+
+
 class User(Base):
     # User Dino Information
     current_dino_inv: List[dict] = Field(default_factory=list)
@@ -33,11 +39,109 @@ class User(Base):
     last_lure_use: float = 0.0
     total_lures_used: int = 0
     total_legendary_caught: int = 0
+
+    # In-memory change counter used to invalidate cached stats snapshots (not persisted)
+    _version: int = PrivateAttr(default=0)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def touch(self) -> None:
+        """Mark this user as modified. Call after any change to inventory, coins, log, buddy or achievements."""
+        self._version += 1
+
+    def ensure_dino_ids(self) -> None:
+        """Give dinos caught before ids existed a uid."""
+        for dino in self.current_dino_inv:
+            if "uid" not in dino:
+                dino["uid"] = new_dino_uid()
+
+    def find_dino(self, uid: str) -> int:
+        """Index of the dino with this uid, or -1 if it's no longer in the inventory."""
+        for i, dino in enumerate(self.current_dino_inv):
+            if dino.get("uid") == uid:
+                return i
+        return -1
         
     # Removed current_inventory_size property to enforce use of GuildSettings.inventory_per_upgrade
     # Calculation: base_inventory_size + (current_inventory_upgrade_level * conf.inventory_per_upgrade)
 
 
+# EconomyStats fields that are sums of per-user counters
+ECONOMY_DERIVED_FIELDS = (
+    "coins_in_circulation", "total_earned", "total_spent", "total_converted", "dinos_sold",
+    "buddy_bonus_paid", "upgrades_bought", "lures_used", "achievements_unlocked", "logs_sold",
+)
+
+
+class EconomyStats(Base):
+    """Guild-wide running economy totals, updated at each mutation site.
+
+    The first group mirrors sums of per-user counters and can be rebuilt from
+    `conf.users` with `from_users`. The second group only exists here.
+    """
+    # Derivable from users
+    coins_in_circulation: int = 0   # sum of has_dinocoins
+    total_earned: int = 0           # sum of total_dinocoins_earned
+    total_spent: int = 0            # sum of has_spent_dinocoins
+    total_converted: int = 0        # sum of total_converted_dinocoin
+    dinos_sold: int = 0
+    buddy_bonus_paid: int = 0
+    upgrades_bought: int = 0
+    lures_used: int = 0
+    achievements_unlocked: int = 0
+    logs_sold: int = 0
+
+    # Running only
+    sale_revenue: int = 0
+    achievement_rewards: int = 0
+    log_revenue: int = 0
+    lures_bought: int = 0
+    conversions: int = 0
+    investments: int = 0
+    currency_invested: int = 0
+    trade_coin_volume: int = 0
+    last_verified: float = 0.0
+
+    def earn(self, amount: int) -> None:
+        self.coins_in_circulation += amount
+        self.total_earned += amount
+
+    def spend(self, amount: int) -> None:
+        self.coins_in_circulation -= amount
+        self.total_spent += amount
+
+    def remove_user(self, user: "User") -> None:
+        """Drop a user's contribution when their data is reset."""
+        for name, value in self.user_totals(user).items():
+            setattr(self, name, getattr(self, name) - value)
+
+    @staticmethod
+    def user_totals(user: "User") -> Dict[str, int]:
+        return {
+            "coins_in_circulation": user.has_dinocoins,
+            "total_earned": user.total_dinocoins_earned,
+            "total_spent": user.has_spent_dinocoins,
+            "total_converted": user.total_converted_dinocoin,
+            "dinos_sold": user.total_ever_sold,
+            "buddy_bonus_paid": user.buddy_bonus_total_gained,
+            "upgrades_bought": user.current_inventory_upgrade_level,
+            "lures_used": user.total_lures_used,
+            "achievements_unlocked": len(user.achievement_log),
+            "logs_sold": user.explorer_logs_sold,
+        }
+
+    @classmethod
+    def from_users(cls, users: List["User"]) -> Dict[str, int]:
+        """Recompute the derivable totals from scratch. Slow on large guilds, run it off-loop."""
+        totals = {name: 0 for name in ECONOMY_DERIVED_FIELDS}
+        for user in users:
+            for name, value in cls.user_totals(user).items():
+                totals[name] += value
+        return totals
+
+
 class GuildSettings(Base):
     users: Dict[int, User] = Field(default_factory=dict)
     game_is_enabled: bool = False
@@ -79,6 +183,9 @@ class GuildSettings(Base):
     # Blacklist Settings
     blacklisted_users: List[int] = Field(default_factory=list)
 
+    # Running economy totals for the dcset economy dashboard
+    economy: EconomyStats = Field(default_factory=EconomyStats)
+
     def get_user(self, user: discord.User | int) -> User:
         uid = user if isinstance(user, int) else user.id
         return self.users.setdefault(uid, User())
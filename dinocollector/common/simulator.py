@@ -0,0 +1,339 @@
+"""Offline Monte Carlo economy simulator for tuning DinoCollector settings.
+
+Mirrors the draws made by `select_random_creature` (rarity tier, creature,
+base value, modifier group, modifier) but does them in bulk with NumPy so
+millions of spawns and thousands of player-days finish in seconds.
+
+Everything in here is synchronous and returns plain dicts so it can be sent
+to a process pool with `loop.run_in_executor`.
+"""
+import math
+
+import numpy as np
+
+from ..databases.achievements import achievement_library
+from ..databases.creatures import creature_library
+from ..databases.gameinfo import (
+    buddy_bonuses,
+    get_effective_rarity,
+    mod_chance,
+    modifier_effect_group,
+    rarity_chances,
+)
+
+# Achievements that can be derived from catch/coin totals alone
+CATCH_MILESTONES = {"catch_10": 10, "catch_50": 50, "catch_100": 100, "catch_500": 500, "catch_1000": 1000}
+EARN_MILESTONES = {"earn_1000": 1000, "earn_10000": 10000, "earn_50000": 50000}
+SELL_MILESTONES = {"sell_50": 50, "sell_100": 100, "sell_250": 250}
+LOG_MILESTONES = {"log_25_percent": 25, "log_50_percent": 50, "log_75_percent": 75, "log_100_percent": 100}
+MODIFIER_ACHIEVEMENTS = {
+    "first_shiny": "shiny",
+    "first_corrupted": "corrupted",
+    "first_aberrant": "aberrant",
+    "first_muscular": "muscular",
+    "first_sickly": "sickly",
+    "first_withered": "withered",
+    "first_young": "young",
+    "first_irradiated": "irradiated",
+}
+RARITY_ACHIEVEMENTS = {"first_legendary": "legendary", "first_super_rare": "super_rare", "first_event": "event"}
+
+# Seconds between spawn_loop ticks in tasks/__init__.py
+SPAWN_TICK = 60
+
+
+def default_settings(conf=None) -> dict:
+    """Build a settings dict from a GuildSettings (or the module defaults)."""
+    settings = {
+        "rarity_chances": dict(rarity_chances),
+        "mod_chance": list(mod_chance),
+        "buddy_bonuses": dict(buddy_bonuses),
+        "buddy_rarity": "",
+        "spawn_mode": "time",
+        "spawn_interval": 300,
+        "spawn_chance": 5,
+        "spawn_cooldown": 30,
+        "spawn_fail_chance": 15,
+        "messages_per_day": 500,
+        "active_players": 10,
+        "price_upgrade": 500,
+        "maximum_upgrade_amount": 23,
+        "explorer_log_value": 7500,
+        "event_mode_enabled": False,
+        "event_active_type": "",
+    }
+    if conf is not None:
+        for key in (
+            "spawn_mode", "spawn_interval", "spawn_chance", "spawn_cooldown", "spawn_fail_chance",
+            "price_upgrade", "maximum_upgrade_amount", "explorer_log_value",
+            "event_mode_enabled", "event_active_type",
+        ):
+            settings[key] = getattr(conf, key)
+        if not conf.buddy_bonus_enabled:
+            settings["buddy_bonuses"] = {k: 0 for k in buddy_bonuses}
+    return settings
+
+
+def log_required_names() -> set:
+    """Creature names `dclog sell` requires, every non-event species whether or not it can spawn."""
+    return {
+        creature["name"] for creature in creature_library.values()
+        if creature.get("version") != "event" and creature.get("rarity") != "event"
+    }
+
+
+def spawns_per_day(settings: dict) -> float:
+    """Expected guild-wide spawns per day for the configured spawn mode."""
+    chance = max(settings["spawn_chance"], 0) / 100
+    if chance <= 0:
+        return 0.0
+    if settings["spawn_mode"] == "message":
+        cap = 86400 / max(settings["spawn_cooldown"], 1)
+        return min(settings["messages_per_day"] * chance, cap)
+    # Time mode: wait out the interval (rounded up to a loop tick), then roll once per tick
+    wait = math.ceil(settings["spawn_interval"] / SPAWN_TICK) * SPAWN_TICK
+    gap = wait + SPAWN_TICK * (1 - chance) / chance
+    return 86400 / gap
+
+
+def build_tables(settings: dict) -> dict:
+    """Flatten the creature library into arrays the vectorized draws can index."""
+    keys = []
+    for k, v in creature_library.items():
+        version = v.get("version", "core")
+        if version in ["core", "asa", "boss"]:
+            keys.append(k)
+        elif settings["event_mode_enabled"] and version == settings["event_active_type"]:
+            keys.append(k)
+
+    by_rarity = {}
+    for idx, k in enumerate(keys):
+        by_rarity.setdefault(get_effective_rarity(creature_library[k]), []).append(idx)
+    rarities = list(by_rarity.keys())
+    weights = np.array([settings["rarity_chances"].get(r, 0) for r in rarities], dtype=np.float64)
+
+    modifiers = []
+    modifier_values = []
+    group_slices = []
+    for group in modifier_effect_group:
+        start = len(modifiers)
+        modifiers.extend(group.keys())
+        modifier_values.extend(group.values())
+        group_slices.append((start, len(group)))
+
+    return {
+        "keys": keys,
+        "rarities": rarities,
+        "rarity_p": weights / weights.sum(),
+        "members": [np.array(by_rarity[r], dtype=np.int64) for r in rarities],
+        "value_min": np.array([creature_library[k]["value"][0] for k in keys], dtype=np.int64),
+        "value_max": np.array([creature_library[k]["value"][1] for k in keys], dtype=np.int64),
+        "stored_rarity": [creature_library[k]["rarity"] for k in keys],
+        "modifiers": modifiers,
+        "modifier_values": np.array(modifier_values, dtype=np.int64),
+        "group_start": np.array([s for s, _ in group_slices], dtype=np.int64),
+        "group_size": np.array([n for _, n in group_slices], dtype=np.int64),
+        "group_p": np.array(settings["mod_chance"], dtype=np.float64) / sum(settings["mod_chance"]),
+    }
+
+
+def draw_spawns(rng: np.random.Generator, tables: dict, n: int):
+    """Vectorized `select_random_creature`. Returns (creature, rarity tier, modifier, value) arrays."""
+    tier = rng.choice(len(tables["rarities"]), size=n, p=tables["rarity_p"])
+    creature = np.empty(n, dtype=np.int64)
+    for t, members in enumerate(tables["members"]):
+        mask = tier == t
+        count = int(mask.sum())
+        if count:
+            creature[mask] = members[rng.integers(0, len(members), size=count)]
+
+    base = rng.integers(tables["value_min"][creature], tables["value_max"][creature] + 1)
+
+    group = rng.choice(len(tables["group_p"]), size=n, p=tables["group_p"])
+    modifier = tables["group_start"][group] + rng.integers(0, tables["group_size"][group])
+    value = np.maximum(base + tables["modifier_values"][modifier], 1)
+    return creature, tier, modifier, value
+
+
+def simulate_spawns(settings: dict, n: int = 1_000_000, seed: int = None) -> dict:
+    """Distribution summary of n spawns."""
+    rng = np.random.default_rng(seed)
+    tables = build_tables(settings)
+    _, tier, modifier, value = draw_spawns(rng, tables, n)
+
+    tier_counts = np.bincount(tier, minlength=len(tables["rarities"]))
+    mod_counts = np.bincount(modifier, minlength=len(tables["modifiers"]))
+    return {
+        "spawns": n,
+        "mean_value": float(value.mean()),
+        "p50_value": float(np.percentile(value, 50)),
+        "p95_value": float(np.percentile(value, 95)),
+        "rarity_rates": {r: float(c) / n for r, c in zip(tables["rarities"], tier_counts)},
+        "modifier_rates": {m: float(c) / n for m, c in zip(tables["modifiers"], mod_counts)},
+    }
+
+
+def simulate_players(settings: dict, players: int = 1000, days: int = 30, seed: int = None) -> dict:
+    """Simulate `players` players over `days` days, each catching their share of guild spawns.
+
+    Players are assumed to sell everything they catch and put all coins toward upgrades.
+    """
+    rng = np.random.default_rng(seed)
+    tables = build_tables(settings)
+    n_creatures = len(tables["keys"])
+
+    per_day = spawns_per_day(settings)
+    catch_rate = per_day * (1 - settings["spawn_fail_chance"] / 100) / max(settings["active_players"], 1)
+    escape_rate = per_day * (settings["spawn_fail_chance"] / 100) / max(settings["active_players"], 1)
+
+    # Catches per player-day, flattened so player p day d lives at p * days + d
+    counts = rng.poisson(catch_rate, size=players * days)
+    total = int(counts.sum())
+    day_id = np.repeat(np.arange(players * days), counts)
+    player_id = day_id // days
+
+    creature, tier, modifier, value = draw_spawns(rng, tables, total)
+
+    bonus_pct = settings["buddy_bonuses"].get(settings["buddy_rarity"], 0) if settings["buddy_rarity"] else 0
+    daily_coins = np.bincount(day_id, weights=value, minlength=players * days) * (1 + bonus_pct / 100)
+    daily_coins = daily_coins.reshape(players, days)
+    cum_coins = daily_coins.cumsum(axis=1)
+    cum_catches = counts.reshape(players, days).cumsum(axis=1)
+    total_catches = cum_catches[:, -1]
+    total_coins = cum_coins[:, -1]
+
+    # Position of each catch within its player's history
+    player_start = np.concatenate(([0], np.cumsum(np.bincount(player_id, minlength=players))[:-1]))
+    position = np.arange(total) - player_start[player_id]
+
+    # First catch position of every (player, species); sentinel when never caught
+    sentinel = np.iinfo(np.int64).max
+    first = np.full(players * n_creatures, sentinel, dtype=np.int64)
+    np.minimum.at(first, player_id * n_creatures + creature, position)
+    first = first.reshape(players, n_creatures)
+    caught = first != sentinel
+
+    # Explorer log sale needs every non-event species by name (see dclog sell), including
+    # seasonal ones that can't spawn outside their event, which makes the log impossible
+    pool_names = [creature_library[k]["name"] for k in tables["keys"]]
+    required_names = log_required_names()
+    unspawnable = required_names - set(pool_names)
+    if unspawnable:
+        completion_pos = np.full(players, -1, dtype=np.int64)
+    else:
+        column = {name: j for j, name in enumerate(sorted(required_names))}
+        first_required = np.full((players, len(column)), sentinel, dtype=np.int64)
+        for i, name in enumerate(pool_names):
+            j = column.get(name)
+            if j is not None:
+                first_required[:, j] = np.minimum(first_required[:, j], first[:, i])
+        completion_pos = np.where(
+            (first_required != sentinel).all(axis=1), first_required.max(axis=1), -1
+        )
+    completed = completion_pos >= 0
+    completion_day = (cum_catches <= completion_pos[:, None]).sum(axis=1) + 1
+
+    # Upgrades affordable from sales alone
+    max_upgrades = settings["maximum_upgrade_amount"]
+    price = max(settings["price_upgrade"], 1)
+    affordable = np.minimum(total_coins // price, max_upgrades)
+    first_upgrade_day = np.where(cum_coins[:, -1] >= price, (cum_coins < price).sum(axis=1) + 1, -1)
+    max_cost = price * max_upgrades
+    max_upgrade_day = np.where(cum_coins[:, -1] >= max_cost, (cum_coins < max_cost).sum(axis=1) + 1, -1)
+
+    # Achievement unlock rates
+    unlocks = {}
+    for aid, need in CATCH_MILESTONES.items():
+        unlocks[aid] = float((total_catches >= need).mean())
+    for aid, need in SELL_MILESTONES.items():
+        unlocks[aid] = float((total_catches >= need).mean())
+    for aid, need in EARN_MILESTONES.items():
+        unlocks[aid] = float((total_coins >= need).mean())
+    species_pct = caught.sum(axis=1) / len(creature_library) * 100
+    for aid, need in LOG_MILESTONES.items():
+        unlocks[aid] = float((species_pct >= need).mean())
+    for aid, mod in MODIFIER_ACHIEVEMENTS.items():
+        if mod in tables["modifiers"]:
+            hit = np.zeros(players, dtype=bool)
+            hit[player_id[modifier == tables["modifiers"].index(mod)]] = True
+            unlocks[aid] = float(hit.mean())
+    stored = np.array(tables["stored_rarity"])[creature] if total else np.array([], dtype=str)
+    for aid, rarity in RARITY_ACHIEVEMENTS.items():
+        hit = np.zeros(players, dtype=bool)
+        hit[player_id[stored == rarity]] = True
+        unlocks[aid] = float(hit.mean())
+    unlocks["escaped_10"] = float((rng.poisson(escape_rate * days, size=players) >= 10).mean())
+    unlocks = {aid: rate for aid, rate in unlocks.items() if aid in achievement_library}
+
+    def _median_day(days_arr):
+        done = days_arr[days_arr > 0]
+        return float(np.median(done)) if done.size else None
+
+    return {
+        "players": players,
+        "days": days,
+        "spawns_per_day": per_day,
+        "catches_per_player_day": catch_rate,
+        "coins_per_player_day": float(daily_coins.mean()),
+        "guild_coin_inflow_per_day": float(daily_coins.mean()) * settings["active_players"],
+        "log_completable": not unspawnable,
+        "log_unspawnable": sorted(unspawnable),
+        "log_complete_rate": float(completed.mean()),
+        "log_complete_median_day": _median_day(np.where(completed, completion_day, -1)),
+        "upgrades_affordable_mean": float(affordable.mean()),
+        "first_upgrade_median_day": _median_day(first_upgrade_day),
+        "max_upgrade_rate": float((max_upgrade_day > 0).mean()),
+        "max_upgrade_median_day": _median_day(max_upgrade_day),
+        "achievement_rates": unlocks,
+    }
+
+
+def run_simulation(settings: dict, spawns: int, players: int, days: int, seed: int = None) -> dict:
+    """Process pool entry point."""
+    return {
+        "settings": settings,
+        "spawn": simulate_spawns(settings, n=spawns, seed=seed),
+        "economy": simulate_players(settings, players=players, days=days, seed=seed),
+    }
+
+
+def format_summary(result: dict) -> str:
+    """Render a simulation result as a monospace table."""
+    spawn = result["spawn"]
+    eco = result["economy"]
+
+    def _fmt_day(day):
+        return "never" if day is None else f"day {day:.0f}"
+
+    lines = [
+        f"{'Spawns simulated':<28}{spawn['spawns']:>14,}",
+        f"{'Mean spawn value':<28}{spawn['mean_value']:>14.1f}",
+        f"{'p50 / p95 value':<28}{spawn['p50_value']:>7.0f} /{spawn['p95_value']:>5.0f}",
+        f"{'Spawns per day':<28}{eco['spawns_per_day']:>14.1f}",
+        f"{'Catches / player-day':<28}{eco['catches_per_player_day']:>14.2f}",
+        f"{'Coins / player-day':<28}{eco['coins_per_player_day']:>14.1f}",
+        f"{'Guild coin inflow / day':<28}{eco['guild_coin_inflow_per_day']:>14.1f}",
+    ]
+    if eco["log_completable"]:
+        lines += [
+            f"{'Log completed':<28}{eco['log_complete_rate']:>13.1%}",
+            f"{'Log complete (median)':<28}{_fmt_day(eco['log_complete_median_day']):>14}",
+        ]
+    else:
+        lines.append(f"{'Log completed':<27}{'not completable':>15}")
+        lines.append(f"  ({len(eco['log_unspawnable'])} required species can't spawn with these settings)")
+    lines += [
+        f"{'Upgrades affordable (mean)':<28}{eco['upgrades_affordable_mean']:>14.1f}",
+        f"{'First upgrade (median)':<28}{_fmt_day(eco['first_upgrade_median_day']):>14}",
+        f"{'Max upgrades reached':<28}{eco['max_upgrade_rate']:>13.1%}",
+        f"{'Max upgrades (median)':<28}{_fmt_day(eco['max_upgrade_median_day']):>14}",
+        "",
+        "Rarity rates:",
+    ]
+    for rarity, rate in spawn["rarity_rates"].items():
+        lines.append(f"  {rarity:<26}{rate:>13.2%}")
+    lines.append("")
+    lines.append(f"Achievement unlock rates ({eco['players']:,} players, {eco['days']} days):")
+    for aid, rate in eco["achievement_rates"].items():
+        lines.append(f"  {achievement_library[aid]['name'][:26]:<26}{rate:>13.1%}")
+    return "\n".join(lines)
@@ -0,0 +1,108 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from ..databases.achievements import achievement_library
+from ..databases.creatures import creature_library
+
+
+@dataclass
+class StatsSnapshot:
+    """Everything `dcstats` and `StatsView` derive from a user's raw lists."""
+
+    version: int
+    inventory_count: int
+    rarity_counts: Dict[str, int]
+    modifiers: set
+    log_caught: int
+    log_total: int
+    buddy_str: str
+    achievements_unlocked: int
+    achievements_total: int
+    # Unlocked (by unlock time) then locked, ready for pagination
+    achievement_entries: List[dict] = field(default_factory=list)
+
+    @property
+    def log_percent(self) -> float:
+        if not self.log_total:
+            return 0.0
+        return (self.log_caught / self.log_total) * 100
+
+
+def build_snapshot(user_conf) -> StatsSnapshot:
+    rarity_counts: Dict[str, int] = {}
+    modifiers = set()
+    for dino in user_conf.current_dino_inv:
+        rarity = dino.get("rarity", "").lower()
+        rarity_counts[rarity] = rarity_counts.get(rarity, 0) + 1
+        modifiers.add(dino.get("modifier", "").lower())
+
+    if user_conf.buddy_dino:
+        b_mod = user_conf.buddy_dino.get("modifier", "Normal")
+        b_name = user_conf.buddy_dino.get("name", "Unknown")
+        b_rarity = user_conf.buddy_dino.get("rarity", "Common").title()
+        buddy_str = f"{b_mod} {b_name}\n({b_rarity})"
+    else:
+        buddy_str = "None"
+
+    unlocked_log = user_conf.achievement_log
+    unlocked_ids = {ach["id"] for ach in unlocked_log if ach["id"] in achievement_library}
+
+    entries = []
+    for ach in sorted(unlocked_log, key=lambda x: x["timestamp"]):
+        if ach["id"] in achievement_library:
+            data = achievement_library[ach["id"]]
+            entries.append({"type": "unlocked", "name": data["name"], "text": data["description"]})
+    for ach_id, data in achievement_library.items():
+        if ach_id not in unlocked_ids:
+            hint = data.get("hint", "Keep playing to unlock this achievement.")
+            entries.append({"type": "locked", "name": "???", "text": f"Hint: {hint}"})
+
+    return StatsSnapshot(
+        version=user_conf.version,
+        inventory_count=len(user_conf.current_dino_inv),
+        rarity_counts=rarity_counts,
+        modifiers=modifiers,
+        log_caught=len(user_conf.explorer_log),
+        log_total=len(creature_library),
+        buddy_str=buddy_str,
+        achievements_unlocked=len(unlocked_ids),
+        achievements_total=len(achievement_library),
+        achievement_entries=entries,
+    )
+
+
+class StatsCache:
+    """Per-user stats snapshots, rebuilt only when the user's version counter moves.
+
+    Every mutation of a user calls `User.touch()`, so a stale snapshot is detected
+    by comparing versions. The user object itself is also compared so a reset user
+    (a brand new `User()` starting back at version 0) never matches an old entry.
+    """
+
+    def __init__(self):
+        # (guild_id, user_id) -> (user object, snapshot)
+        self.entries: Dict[Tuple[int, int], Tuple[object, StatsSnapshot]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id: int, user_id: int, user_conf) -> StatsSnapshot:
+        key = (guild_id, user_id)
+        cached = self.entries.get(key)
+        if cached is not None:
+            owner, snapshot = cached
+            if owner is user_conf and snapshot.version == user_conf.version:
+                self.hits += 1
+                return snapshot
+
+        self.misses += 1
+        snapshot = build_snapshot(user_conf)
+        self.entries[key] = (user_conf, snapshot)
+        return snapshot
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
@@ -3,6 +3,7 @@ import logging
 import discord
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor
 
 from redbot.core import commands, bank
 from redbot.core.bot import Red
@@ -10,7 +11,10 @@ from redbot.core.data_manager import cog_data_path
 
 from .abc import CompositeMetaClass
 from .commands import Commands
-from .common.models import DB
+from .common.models import DB, EconomyStats, ECONOMY_DERIVED_FIELDS
+from .common.cleanup import CleanupQueue
+from .common.stats_cache import StatsCache
+from .common.locks import UserLocks
 from .listeners import Listeners
 from .tasks import TaskLoops
 from .main_helper import MainHelper
@@ -52,6 +56,9 @@ class DinoCollector(
         super().__init__(bot)
         self.bot: Red = bot
         self.db: DB = DB()
+        self.cleanup_queue = CleanupQueue()
+        self.stats_cache = StatsCache()
+        self.user_locks = UserLocks()
 
         # States
         self._saving = False
@@ -82,7 +89,15 @@ class DinoCollector(
         reward = ach_data["reward"]
         user_conf.has_dinocoins += reward
         user_conf.total_dinocoins_earned += reward
+
+        guild = getattr(messageable, "guild", None)
+        if guild:
+            economy = self.db.get_conf(guild).economy
+            economy.earn(reward)
+            economy.achievement_rewards += reward
+            economy.achievements_unlocked += 1
         
+        user_conf.touch()
         self.save()
         
         # Notify
@@ -109,12 +124,15 @@ class DinoCollector(
         """Retroactively check for achievements."""
         conf = self.db.get_conf(ctx.guild)
         user_conf = conf.get_user(user)
+        snapshot = self.stats_cache.get(ctx.guild.id, user.id, user_conf)
         
         newly_unlocked = []
         
         # Helper to check if unlocked
+        unlocked_ids = {a.get("id") for a in user_conf.achievement_log}
+
         def is_unlocked(aid):
-            return any(a.get("id") == aid for a in user_conf.achievement_log)
+            return aid in unlocked_ids
             
         # 1. First Catch
         if not is_unlocked("first_capture"):
@@ -124,13 +142,13 @@ class DinoCollector(
         # 2. Corrupted Hunter
         if not is_unlocked("first_corrupted"):
             # Check inventory
-            has_corrupted = any(d.get("modifier", "").lower() == "corrupted" for d in user_conf.current_dino_inv)
+            has_corrupted = "corrupted" in snapshot.modifiers
             if has_corrupted:
                 newly_unlocked.append("first_corrupted")
                 
         # 3. Shiny Hunter
         if not is_unlocked("first_shiny"):
-            has_shiny = any(d.get("modifier", "").lower() == "shiny" for d in user_conf.current_dino_inv)
+            has_shiny = "shiny" in snapshot.modifiers
             if has_shiny:
                 newly_unlocked.append("first_shiny")
                 
@@ -161,7 +179,7 @@ class DinoCollector(
         # 10. Hoarder (Full Inventory)
         if not is_unlocked("full_inventory"):
             current_size = conf.base_inventory_size + (user_conf.current_inventory_upgrade_level * conf.inventory_per_upgrade)
-            if len(user_conf.current_dino_inv) >= current_size:
+            if snapshot.inventory_count >= current_size:
                 newly_unlocked.append("full_inventory")
                 
         # 11. Maxed Out (Max Upgrade) & Milestone Upgrades
@@ -216,37 +234,37 @@ class DinoCollector(
         
         # 20. Living Legend (First Legendary)
         if not is_unlocked("first_legendary"):
-            has_legendary = any(d.get("rarity", "").lower() == "legendary" for d in user_conf.current_dino_inv)
+            has_legendary = "legendary" in snapshot.rarity_counts
             if has_legendary:
                 newly_unlocked.append("first_legendary")
                 
         # 21. Super Collector (First Super Rare)
         if not is_unlocked("first_super_rare"):
-            has_super_rare = any(d.get("rarity", "").lower() == "super_rare" for d in user_conf.current_dino_inv)
+            has_super_rare = "super_rare" in snapshot.rarity_counts
             if has_super_rare:
                 newly_unlocked.append("first_super_rare")
                 
         # 22. Festive Spirit (First Event)
         if not is_unlocked("first_event"):
-            has_event = any(d.get("rarity", "").lower() == "event" for d in user_conf.current_dino_inv)
+            has_event = "event" in snapshot.rarity_counts
             if has_event:
                 newly_unlocked.append("first_event")
                 
         # 23. Strange Discovery (First Aberrant)
         if not is_unlocked("first_aberrant"):
-            has_aberrant = any(d.get("modifier", "").lower() == "aberrant" for d in user_conf.current_dino_inv)
+            has_aberrant = "aberrant" in snapshot.modifiers
             if has_aberrant:
                 newly_unlocked.append("first_aberrant")
                 
         # 24. Gym Enthusiast (First Muscular)
         if not is_unlocked("first_muscular"):
-            has_muscular = any(d.get("modifier", "").lower() == "muscular" for d in user_conf.current_dino_inv)
+            has_muscular = "muscular" in snapshot.modifiers
             if has_muscular:
                 newly_unlocked.append("first_muscular")
                 
         # 25. Nurturing Soul (First Sickly)
         if not is_unlocked("first_sickly"):
-            has_sickly = any(d.get("modifier", "").lower() == "sickly" for d in user_conf.current_dino_inv)
+            has_sickly = "sickly" in snapshot.modifiers
             if has_sickly:
                 newly_unlocked.append("first_sickly")
         
@@ -288,10 +306,8 @@ class DinoCollector(
         # === NEW ACHIEVEMENTS (16) ===
         
         # Explorer Log Achievements
-        total_species = len(creature_library)
-        caught_species = len(user_conf.explorer_log)
-        if total_species > 0:
-            percentage = (caught_species / total_species) * 100
+        if snapshot.log_total > 0:
+            percentage = snapshot.log_percent
             if not is_unlocked("log_25_percent") and percentage >= 25:
                 newly_unlocked.append("log_25_percent")
             if not is_unlocked("log_50_percent") and percentage >= 50:
@@ -303,15 +319,15 @@ class DinoCollector(
         
         # Missing Modifier Achievements
         if not is_unlocked("first_withered"):
-            has_withered = any(d.get("modifier", "").lower() == "withered" for d in user_conf.current_dino_inv)
+            has_withered = "withered" in snapshot.modifiers
             if has_withered:
                 newly_unlocked.append("first_withered")
         if not is_unlocked("first_young"):
-            has_young = any(d.get("modifier", "").lower() == "young" for d in user_conf.current_dino_inv)
+            has_young = "young" in snapshot.modifiers
             if has_young:
                 newly_unlocked.append("first_young")
         if not is_unlocked("first_irradiated"):
-            has_irradiated = any(d.get("modifier", "").lower() == "irradiated" for d in user_conf.current_dino_inv)
+            has_irradiated = "irradiated" in snapshot.modifiers
             if has_irradiated:
                 newly_unlocked.append("first_irradiated")
         
@@ -366,9 +382,13 @@ class DinoCollector(
                 user_conf.has_dinocoins += reward
                 user_conf.total_dinocoins_earned += reward
                 total_reward += reward
+                conf.economy.earn(reward)
+                conf.economy.achievement_rewards += reward
+                conf.economy.achievements_unlocked += 1
                 
                 description += f"**{ach_data['name']}** (+{reward} coins)\n"
                 
+            user_conf.touch()
             self.save()
             
             embed = discord.Embed(
@@ -387,6 +407,7 @@ class DinoCollector(
     async def initialize(self) -> None:
         await self.bot.wait_until_red_ready()
         self.db = await asyncio.to_thread(DB.from_file, cog_data_path(self) / "dinocollectordb.json")
+        self.stats_cache.clear()
         log.info("Config loaded")
 
     async def cog_check(self, ctx: commands.Context) -> bool:
@@ -827,10 +848,12 @@ class DinoCollector(
             name="💰 Economy & Shop",
             value=(
                 "`displayshop` - View shop settings\n"
+                "`economy [verify]` - Guild economy dashboard\n"
                 "`conversion` - Toggle currency conversion\n"
                 "`convertrate <rate>` - Set conversion rate\n"
                 "`buddybonus` - Toggle buddy bonus\n"
-                "`logprice <amount>` - Set log value"
+                "`logprice <amount>` - Set log value\n"
+                "`simulate [key=value ...]` - Run the economy simulator"
             ),
             inline=False
         )
@@ -930,6 +953,7 @@ class DinoCollector(
         
         if view.confirmed:
             if user_id in conf.users:
+                conf.economy.remove_user(conf.users[user_id])
                 del conf.users[user_id]
                 self.save()
                 await msg.edit(content=f"User data for **{user_name}** has been completely reset.", view=None)
@@ -970,6 +994,7 @@ class DinoCollector(
             
             if added_count > 0:
                 user_conf.explorer_log.sort(key=lambda x: x["name"])
+                user_conf.touch()
                 self.save()
                 await ctx.send(f"Added {added_count} dinos to **{user_name}**'s explorer log. It is now full.")
             else:
@@ -1175,6 +1200,13 @@ class DinoCollector(
         embed.add_field(name="Spawn Cooldown", value=f"{conf.spawn_cooldown}s", inline=True)
         embed.add_field(name="Last Spawn", value=last_spawn_str, inline=True)
         embed.add_field(name="Allowed Channels", value=channels, inline=False)
+
+        cache = self.stats_cache
+        embed.add_field(
+            name="Stats Cache",
+            value=f"Hits: {cache.hits} | Misses: {cache.misses} | Hit Rate: {cache.hit_rate:.0%}",
+            inline=False
+        )
         
         await ctx.send(embed=embed)
 
@@ -1222,6 +1254,89 @@ class DinoCollector(
         
         await ctx.send(embed=embed)
 
+    @dcset.group(name="economy", invoke_without_command=True)
+    async def dcset_economy(self, ctx: commands.Context):
+        """View the guild-wide DinoCoin economy dashboard."""
+        conf = self.db.get_conf(ctx.guild)
+        eco = conf.economy
+        
+        embed = discord.Embed(title="📊 DinoCollector Economy", color=discord.Color.gold())
+        
+        embed.add_field(name="💰 In Circulation", value=f"{eco.coins_in_circulation:,}", inline=True)
+        embed.add_field(name="📈 Total Earned", value=f"{eco.total_earned:,}", inline=True)
+        embed.add_field(name="📉 Total Spent", value=f"{eco.total_spent:,}", inline=True)
+        
+        embed.add_field(
+            name="Income",
+            value=(
+                f"Sales: {eco.sale_revenue:,} ({eco.dinos_sold:,} dinos)\n"
+                f"Buddy Bonus: {eco.buddy_bonus_paid:,}\n"
+                f"Achievements: {eco.achievement_rewards:,} ({eco.achievements_unlocked:,} unlocked)\n"
+                f"Explorer Logs: {eco.log_revenue:,} ({eco.logs_sold:,} sold)"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Sinks",
+            value=(
+                f"Upgrades Bought: {eco.upgrades_bought:,}\n"
+                f"Lures Bought: {eco.lures_bought:,}\n"
+                f"Lures Used: {eco.lures_used:,}\n"
+                f"Trade Coin Volume: {eco.trade_coin_volume:,}"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Currency Exchange",
+            value=(
+                f"Converted Out: {eco.total_converted:,} DC ({eco.conversions:,}x)\n"
+                f"Invested In: {eco.currency_invested:,} ({eco.investments:,}x)"
+            ),
+            inline=False
+        )
+        
+        verified = f"<t:{int(eco.last_verified)}:R>" if eco.last_verified else "Never"
+        embed.add_field(name="Last Verified", value=verified, inline=False)
+        embed.set_footer(text=f"Use {ctx.clean_prefix}dcset economy verify to check these totals against user data.")
+        
+        await ctx.send(embed=embed)
+
+    @dcset_economy.command(name="verify")
+    async def dcset_economy_verify(self, ctx: commands.Context, apply: bool = False):
+        """Rebuild the economy totals from user data and report any drift.
+        
+        Pass `True` to overwrite the running totals with the rebuilt values.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        
+        async with ctx.typing():
+            rebuilt = await asyncio.to_thread(EconomyStats.from_users, list(conf.users.values()))
+        
+        drift = []
+        for name in ECONOMY_DERIVED_FIELDS:
+            current = getattr(conf.economy, name)
+            if current != rebuilt[name]:
+                drift.append(f"{name}: {current:,} → {rebuilt[name]:,}")
+        
+        if not drift:
+            conf.economy.last_verified = time.time()
+            self.save()
+            await ctx.send(f"✅ Economy totals match user data across {len(conf.users)} users.")
+            return
+        
+        lines = "\n".join(drift)
+        if apply:
+            for name in ECONOMY_DERIVED_FIELDS:
+                setattr(conf.economy, name, rebuilt[name])
+            conf.economy.last_verified = time.time()
+            self.save()
+            await ctx.send(f"Economy totals rebuilt from {len(conf.users)} users:\n```\n{lines}\n```")
+        else:
+            await ctx.send(
+                f"⚠️ Economy totals differ from user data:\n```\n{lines}\n```\n"
+                f"Run `{ctx.clean_prefix}dcset economy verify True` to apply the rebuilt values."
+            )
+
     @dcset.command(name="buddybonus")
     async def dcset_buddybonus(self, ctx: commands.Context, status: str = None):
         """Toggle buddy bonus on or off."""
@@ -1263,6 +1378,94 @@ class DinoCollector(
         
         await ctx.send(f"Explorer Log value has been set to **{amount} DinoCoins**.")
 
+    @dcset.command(name="simulate")
+    async def dcset_simulate(self, ctx: commands.Context, *, options: str = ""):
+        """Run a Monte Carlo simulation of the economy with this server's settings.
+
+        Any setting can be overridden with `key=value` pairs to test changes before applying them.
+
+        Keys:
+        `players`, `days`, `spawns`, `active` (players sharing spawns), `seed`,
+        `interval`, `chance`, `fail`, `mode`, `messages` (per day, message mode),
+        `upgrade`, `maxupgrades`, `logvalue`, `buddy` (buddy rarity),
+        `mod` (e.g. 70,20,10), or any rarity name (e.g. `legendary=10`).
+
+        Example:
+        [p]dcset simulate days=60 interval=600 legendary=10
+        """
+        try:
+            from .common.simulator import default_settings, format_summary, run_simulation
+        except ImportError:
+            await ctx.send("The simulator requires `numpy`. Please install it with `[p]pipinstall numpy`.")
+            return
+
+        conf = self.db.get_conf(ctx.guild)
+        settings = default_settings(conf)
+        run = {"spawns": 1_000_000, "players": 1000, "days": 30, "seed": None}
+        keymap = {
+            "interval": "spawn_interval",
+            "chance": "spawn_chance",
+            "fail": "spawn_fail_chance",
+            "messages": "messages_per_day",
+            "active": "active_players",
+            "upgrade": "price_upgrade",
+            "maxupgrades": "maximum_upgrade_amount",
+            "logvalue": "explorer_log_value",
+        }
+
+        for token in options.split():
+            key, sep, value = token.partition("=")
+            key = key.lower()
+            try:
+                if not sep:
+                    raise ValueError
+                if key in run:
+                    run[key] = int(value)
+                elif key in keymap:
+                    settings[keymap[key]] = int(value)
+                elif key == "mode" and value.lower() in ["message", "time"]:
+                    settings["spawn_mode"] = value.lower()
+                elif key == "buddy" and value.lower() in settings["buddy_bonuses"]:
+                    settings["buddy_rarity"] = value.lower()
+                elif key == "mod":
+                    settings["mod_chance"] = [int(v) for v in value.split(",")]
+                    if len(settings["mod_chance"]) != 3:
+                        raise ValueError
+                elif key in settings["rarity_chances"]:
+                    settings["rarity_chances"][key] = int(value)
+                else:
+                    raise ValueError
+            except ValueError:
+                await ctx.send(f"Invalid option `{token}`. See `{ctx.prefix}help dcset simulate` for valid keys.")
+                return
+
+        # Keep runs bounded so one admin can't tie up the host
+        run["spawns"] = max(1000, min(run["spawns"], 10_000_000))
+        run["players"] = max(1, min(run["players"], 10_000))
+        run["days"] = max(1, min(run["days"], 365))
+
+        async with ctx.typing():
+            loop = asyncio.get_running_loop()
+            pool = ProcessPoolExecutor(max_workers=1)
+            try:
+                result = await loop.run_in_executor(
+                    pool, run_simulation, settings, run["spawns"], run["players"], run["days"], run["seed"]
+                )
+            except Exception as e:
+                log.exception("Economy simulation failed", exc_info=e)
+                await ctx.send(f"Simulation failed: {e}")
+                return
+            finally:
+                pool.shutdown(wait=False)
+
+        embed = discord.Embed(title="📊 Economy Simulation", color=discord.Color.blue())
+        embed.description = f"```\n{format_summary(result)}\n```"
+        embed.set_footer(
+            text=f"Mode: {settings['spawn_mode']} | Interval: {settings['spawn_interval']}s | "
+                 f"Chance: {settings['spawn_chance']}% | Active players: {settings['active_players']}"
+        )
+        await ctx.send(embed=embed)
+
     @dcset.command()
     async def spawn(self, ctx: commands.Context):
         """Spawn a random dino for testing purposes."""
@@ -1540,6 +1743,8 @@ class DinoCollector(
 
         conf = self.db.get_conf(ctx.guild)
         user_conf = conf.get_user(user)
+        old_balance = user_conf.has_dinocoins
+        old_earned = user_conf.total_dinocoins_earned
         
         if amount.startswith("+"):
             # Add
@@ -1567,7 +1772,11 @@ class DinoCollector(
             user_conf.has_dinocoins = value
             user_conf.total_dinocoins_earned += value
             action = "Set"
+
+        conf.economy.coins_in_circulation += user_conf.has_dinocoins - old_balance
+        conf.economy.total_earned += user_conf.total_dinocoins_earned - old_earned
             
+        user_conf.touch()
         self.save()
         
         await ctx.send(f"{action} **{abs(value)}** DinoCoins for {user.display_name}. New Balance: {user_conf.has_dinocoins}")
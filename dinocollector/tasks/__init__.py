@@ -22,12 +22,29 @@ class TaskLoops(metaclass=CompositeMetaClass):
     def __init__(self, bot):
         super().__init__()
         self.spawn_loop.start()
+        self.cleanup_loop.start()
         log.debug("Spawn loop started")
 
     async def cog_unload(self):
         self.spawn_loop.cancel()
+        self.cleanup_loop.cancel()
+        # Don't leave spawn messages behind when the cog goes away
+        try:
+            await self.cleanup_queue.flush(self.bot, self, force=True)
+        except Exception as e:
+            log.error(f"Failed to flush cleanup queue on unload: {e}")
         await super().cog_unload()
 
+    @tasks.loop(seconds=10)
+    async def cleanup_loop(self):
+        await self.bot.wait_until_red_ready()
+        if not self.cleanup_queue.pending:
+            return
+        try:
+            await self.cleanup_queue.flush(self.bot, self)
+        except Exception as e:
+            log.error(f"Cleanup flush failed: {e}")
+
     @tasks.loop(seconds=60)
     async def spawn_loop(self):
         await self.bot.wait_until_red_ready()
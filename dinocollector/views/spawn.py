@@ -3,6 +3,7 @@ import time
 import random
 import asyncio
 from ..databases.creatures import creature_library
+from ..common.models import new_dino_uid
 
 class SpawnView(discord.ui.View):
     def __init__(self, cog, creature_data):
@@ -64,6 +65,7 @@ class SpawnView(discord.ui.View):
                 
                 # Update stats
                 user_conf.total_escaped += 1
+                user_conf.touch()
                 self.cog.save()
                 
                 # Escaped achievement
@@ -98,6 +100,7 @@ class SpawnView(discord.ui.View):
             # (conf and user_conf already fetched above)
             
             # Update Inventory
+            self.creature_data["uid"] = new_dino_uid()
             user_conf.current_dino_inv.append(self.creature_data)
             
             # Update Explorer Log (Pokedex)
@@ -116,6 +119,7 @@ class SpawnView(discord.ui.View):
                 user_conf.first_dino_ever_caught = self.creature_data["name"]
                 user_conf.first_dino_caught_timestamp = str(time.time())
                 
+            user_conf.touch()
             self.cog.save()
             
             # Always show captured message
@@ -191,30 +195,19 @@ class SpawnView(discord.ui.View):
 
             # Schedule cleanup if enabled
             if conf.message_cleanup_enabled:
-                asyncio.create_task(self.delayed_cleanup(interaction.message))
-
-    async def delayed_cleanup(self, message):
-        await asyncio.sleep(60)
-        try:
-            conf = self.cog.db.get_conf(message.guild)
-            if conf.message_cleanup_enabled:
-                await message.delete()
-        except (discord.NotFound, discord.HTTPException):
-            pass
+                self.cog.cleanup_queue.add(interaction.message, delay=60)
 
     async def on_timeout(self):
-        await asyncio.sleep(30)
         if self.message:
             conf = self.cog.db.get_conf(self.message.guild)
             
-            # If cleanup is enabled, delete regardless of state
+            # If cleanup is enabled, queue for batched deletion regardless of state
             if conf.message_cleanup_enabled:
-                try:
-                    await self.message.delete()
-                except (discord.NotFound, discord.HTTPException):
-                    pass
+                self.cog.cleanup_queue.add(self.message, delay=30)
                 return
 
+            await asyncio.sleep(30)
+
             # If cleanup disabled, handle "Too Slow" case
             if not self.captured:
                 # Update the message
@@ -1,7 +1,6 @@
 import discord
 import math
 from redbot.core import commands
-from ..databases.achievements import achievement_library
 
 class StatsView(discord.ui.View):
     def __init__(self, ctx: commands.Context, target: discord.Member, cog, stats_embed: discord.Embed):
@@ -48,36 +47,11 @@ class StatsView(discord.ui.View):
         conf = self.cog.db.get_conf(self.ctx.guild)
         user_conf = conf.get_user(self.target)
         
-        unlocked_log = user_conf.achievement_log
-        total_achievements = len(achievement_library)
-        unlocked_ids = {ach["id"] for ach in unlocked_log if ach["id"] in achievement_library}
-        unlocked_count = len(unlocked_ids)
-        
-        # Build combined list: unlocked first (sorted by unlock time), then locked
-        achievement_entries = []
-        
-        # Unlocked achievements (sorted by timestamp)
-        if unlocked_log:
-            sorted_log = sorted(unlocked_log, key=lambda x: x["timestamp"])
-            for ach in sorted_log:
-                ach_id = ach["id"]
-                if ach_id in achievement_library:
-                    data = achievement_library[ach_id]
-                    achievement_entries.append({
-                        "type": "unlocked",
-                        "name": data["name"],
-                        "text": data["description"]
-                    })
-        
-        # Locked achievements
-        for ach_id, data in achievement_library.items():
-            if ach_id not in unlocked_ids:
-                hint = data.get("hint", "Keep playing to unlock this achievement.")
-                achievement_entries.append({
-                    "type": "locked",
-                    "name": "???",
-                    "text": f"Hint: {hint}"
-                })
+        # Combined list (unlocked first by unlock time, then locked) comes prebuilt from the stats cache
+        snapshot = self.cog.stats_cache.get(self.ctx.guild.id, self.target.id, user_conf)
+        total_achievements = snapshot.achievements_total
+        unlocked_count = snapshot.achievements_unlocked
+        achievement_entries = snapshot.achievement_entries
         
         # Paginate with 15 entries per page
         per_page = 15
@@ -1,10 +1,19 @@
+import asyncio
 from abc import ABC, ABCMeta, abstractmethod
 from pathlib import Path
 
 from discord.ext.commands.cog import CogMeta
 from redbot.core.bot import Red
 
+from .common.catch_history import CatchHistory
+from .common.catch_log import CatchLog
+from .common.derby import Derby
+from .common.edit_coalescer import EditCoalescer
 from .common.models import DB
+from .common.permissions import PermissionCache
+from .common.scheduler import SessionScheduler
+from .common.view_registry import ViewRegistry
+from .common.world_records import WorldRecords
 
 
 class CompositeMetaClass(CogMeta, ABCMeta):
@@ -18,8 +27,23 @@ class MixinMeta(ABC):
         self.bot: Red
         self.db: DB
         self.data_path: Path
-        self.debug_log: list
+        self.debug_log: CatchLog
+        self.scheduler: SessionScheduler
+        self.edits: EditCoalescer
+        self.permissions: PermissionCache
+        self.active_views: ViewRegistry
+        self.derbies: dict[int, Derby]
+        self.world_records: WorldRecords
+        self.history: CatchHistory
 
     @abstractmethod
     def save(self) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def request_world_rebuild(self) -> asyncio.Task:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild_world_records(self) -> int:
+        raise NotImplementedError
@@ -1,7 +1,9 @@
 from ..abc import CompositeMetaClass
 from .admin_commands import Admin
+from .derby_commands import Derbies
+from .journal_commands import Journal
 from .user_commands import User
 
 
-class Commands(Admin, User, metaclass=CompositeMetaClass):
+class Commands(Admin, Derbies, Journal, User, metaclass=CompositeMetaClass):
     """Subclass all command classes"""
@@ -1,13 +1,24 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from io import BytesIO
 import json
+import logging
+import os
+import time
 from zoneinfo import ZoneInfo, available_timezones
 
 import discord
 from redbot.core import bank, commands
 
 from ..abc import MixinMeta
+from ..common import catch_log
+from ..common.catch_history import MAX_HISTORY_CATCHES, MIN_HISTORY_CATCHES
+from ..common.edit_coalescer import MAX_EDIT_INTERVAL, MIN_EDIT_INTERVAL
+from ..common.templates import TEMPLATES
+
+log = logging.getLogger("red.greenacresfishing.admin")
+
 
 async def is_admin(ctx: commands.Context) -> bool:
     """Check if user is a bot admin, bot owner, or has Manage Server permission.
@@ -291,6 +302,8 @@ class ClearUserConfirmView(discord.ui.View):
         
         if self.target.id in conf.users:
             del conf.users[self.target.id]
+            conf.invalidate_indexes()
+            self.cog.request_world_rebuild()
             self.cog.save()
             
             embed = discord.Embed(
@@ -358,6 +371,8 @@ class WipeUsersConfirmModal(discord.ui.Modal, title="⚠️ FINAL CONFIRMATION")
         
         # Wipe all users
         conf.users.clear()
+        conf.invalidate_indexes()
+        self.view.cog.request_world_rebuild()
         self.view.cog.save()
         
         # Update embed
@@ -700,10 +715,11 @@ class FishSetupView(discord.ui.View):
     
     def get_game_time_embed(self) -> discord.Embed:
         """Generate game time preview embed."""
-        from .helper_functions import get_game_calendar, get_game_time_of_day
+        from .helper_functions import get_environment
         
-        calendar = get_game_calendar(self.cog.db, self.ctx.guild)
-        time_of_day = get_game_time_of_day(self.cog.db, self.ctx.guild)
+        env = get_environment(self.cog.db, self.ctx.guild)
+        calendar = env['calendar']
+        time_of_day = env['time_of_day']
         tz = ZoneInfo(self.conf.timezone)
         real_now = datetime.now(tz)
         
@@ -1093,11 +1109,12 @@ class Admin(MixinMeta):
     @fishset.command(name="gametime", aliases=["gt"])
     async def show_game_time(self, ctx: commands.Context):
         """Show the current game time, day, season, and year."""
-        from .helper_functions import get_game_calendar, get_game_time_of_day
+        from .helper_functions import get_environment
         
         conf = self.db.get_conf(ctx.guild)
-        calendar = get_game_calendar(self.db, ctx.guild)
-        time_of_day = get_game_time_of_day(self.db, ctx.guild)
+        env = get_environment(self.db, ctx.guild)
+        calendar = env['calendar']
+        time_of_day = env['time_of_day']
         
         # Get real-world time for comparison
         tz = ZoneInfo(conf.timezone)
@@ -1244,7 +1261,7 @@ class Admin(MixinMeta):
         total_fisherfolk = len(conf.users)
         
         # Total fish caught by all users ever
-        total_fish_caught = sum(user.total_fish_ever_caught for user in conf.users.values())
+        total_fish_caught = conf.boards.total("total_fish_ever_caught")
         
         embed = discord.Embed(
             title="🎣 Greenacres Fishing - Server Stats",
@@ -1361,6 +1378,212 @@ class Admin(MixinMeta):
         
         await ctx.send(f"✅ Conversion rate updated: **{new_rate_text}** (was {old_rate_text})")
 
+    @fishset.command(name="editrate")
+    @commands.check(is_admin)
+    async def set_edit_rate(self, ctx: commands.Context, seconds: float = None, channel: discord.TextChannel = None):
+        """Set how often fishing messages may be edited per channel.
+        
+        Automatic fishing updates in one channel are merged and sent at most once
+        per interval, which keeps busy channels clear of Discord rate limits.
+        Button clicks still update instantly.
+        
+        Examples:
+        - `fishset editrate` - Show current intervals and edit stats
+        - `fishset editrate 1.5` - Server default of 1.5 seconds
+        - `fishset editrate 3 #fishing` - Override for one channel
+        - `fishset editrate 0 #fishing` - Remove a channel override
+        """
+        conf = self.db.get_conf(ctx.guild)
+        
+        if seconds is None:
+            stats = self.edits.stats()
+            embed = discord.Embed(
+                title="🎣 Fishing Message Edit Pacing",
+                color=discord.Color.blue()
+            )
+            embed.add_field(
+                name="Server Default",
+                value=f"⏱️ {conf.edit_interval:g}s between edits per channel",
+                inline=False
+            )
+            if conf.channel_edit_intervals:
+                overrides = []
+                for channel_id, interval in conf.channel_edit_intervals.items():
+                    ch = ctx.guild.get_channel(channel_id)
+                    name = ch.mention if ch else f"`{channel_id}`"
+                    overrides.append(f"{name}: {interval:g}s")
+                embed.add_field(name="Channel Overrides", value="\n".join(overrides), inline=False)
+            embed.add_field(
+                name="Edit Stats (all servers, since load)",
+                value=(
+                    f"📨 Submitted: **{stats['submitted']:,}**\n"
+                    f"👆 Via interaction: **{stats['via_interaction']:,}**\n"
+                    f"✏️ Message edits: **{stats['sent']:,}** in **{stats['flushes']:,}** paced flushes\n"
+                    f"🗑️ Dropped frames: **{stats['dropped']:,}** ({stats['drop_rate']:.1%})\n"
+                    f"⏳ Pending: **{stats['pending']:,}**\n"
+                    f"❌ Failed edits: **{stats['errors']:,}**"
+                ),
+                inline=False
+            )
+            await ctx.send(embed=embed)
+            return
+        
+        if channel is not None and seconds == 0:
+            if conf.channel_edit_intervals.pop(channel.id, None) is None:
+                await ctx.send(f"❌ {channel.mention} has no edit rate override.")
+                return
+            self.save()
+            await ctx.send(f"✅ {channel.mention} now uses the server default of {conf.edit_interval:g}s.")
+            return
+        
+        if not MIN_EDIT_INTERVAL <= seconds <= MAX_EDIT_INTERVAL:
+            await ctx.send(f"❌ Interval must be between {MIN_EDIT_INTERVAL:g} and {MAX_EDIT_INTERVAL:g} seconds.")
+            return
+        
+        if channel is None:
+            conf.edit_interval = seconds
+            self.save()
+            await ctx.send(f"✅ Fishing messages will be edited at most every **{seconds:g}s** per channel.")
+        else:
+            conf.channel_edit_intervals[channel.id] = seconds
+            self.save()
+            await ctx.send(f"✅ Fishing messages in {channel.mention} will be edited at most every **{seconds:g}s**.")
+
+    @fishset.command(name="menus")
+    @commands.check(is_admin)
+    async def set_menu_limit(self, ctx: commands.Context, limit: int = None):
+        """Set how many fishing menus one user can have open at once.
+        
+        Opening a menu past the limit closes that user's oldest menu in this server.
+        Use `0` for no limit.
+        
+        Examples:
+        - `fishset menus` - Show the limit, open menus and template cache stats
+        - `fishset menus 3` - Allow three open menus per user
+        """
+        conf = self.db.get_conf(ctx.guild)
+        
+        if limit is None:
+            counts = self.active_views.counts()
+            embed = discord.Embed(
+                title="🎣 Open Fishing Menus",
+                description=(
+                    f"Limit: **{conf.max_views_per_user or 'None'}** per user in this server\n"
+                    f"Open (all servers): **{len(self.active_views):,}** menus "
+                    f"for **{self.active_views.users():,}** users\n"
+                    f"Closed by the limit since load: **{self.active_views.evicted:,}**"
+                ),
+                color=discord.Color.blue()
+            )
+            if counts:
+                embed.add_field(
+                    name="By Menu",
+                    value="\n".join(f"{name}: {count:,}" for name, count in list(counts.items())[:15]),
+                    inline=False
+                )
+            stats = TEMPLATES.stats()
+            embed.add_field(
+                name="Menu Templates (since load)",
+                value=(
+                    f"📄 Cached: **{stats['embeds']:,}** embeds, **{stats['options']:,}** option lists\n"
+                    f"✅ Hits: **{stats['hits']:,}** ({stats['hit_rate']:.1%})\n"
+                    f"🔨 Builds: **{stats['misses']:,}**"
+                ),
+                inline=False
+            )
+            await ctx.send(embed=embed)
+            return
+        
+        if limit < 0:
+            await ctx.send("❌ Limit can't be negative.")
+            return
+        
+        conf.max_views_per_user = limit
+        self.save()
+        if limit:
+            await ctx.send(f"✅ Users can now have **{limit}** fishing menus open at once.")
+        else:
+            await ctx.send("✅ Users can now have any number of fishing menus open.")
+
+    @fishset.command(name="worldrecords")
+    @commands.check(is_admin)
+    async def toggle_world_records(self, ctx: commands.Context):
+        """Toggle whether this server takes part in the World Records.
+        
+        The World Records leaderboard is shared by every server the bot is in and
+        shows the record holders' names and their server's name. Off by default.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        conf.world_records_public = not conf.world_records_public
+        self.save()
+        # Add or drop this server's records
+        self.request_world_rebuild()
+        if conf.world_records_public:
+            await ctx.send("✅ This server's records now count toward the World Records, with names shown to all servers.")
+        else:
+            await ctx.send("✅ This server no longer takes part in the World Records.")
+
+    @fishset.group(name="history", invoke_without_command=True)
+    @commands.check(is_admin)
+    async def fish_history(self, ctx: commands.Context):
+        """Show the catch history settings.
+        
+        When catch history is on, every landed fish is recorded so players can
+        use `journal` and admins `journal server`. History is kept in its own
+        file per server, not in the main config.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        embed = discord.Embed(
+            title="📖 Catch History",
+            description=(
+                f"Status: **{'On' if conf.catch_history_enabled else 'Off'}**\n"
+                f"Keeps: **{conf.catch_history_days or 'Unlimited'}** days, "
+                f"newest **{conf.catch_history_max:,}** catches\n"
+                f"On disk: **{self.history.size(ctx.guild.id) / 1024:,.0f} KiB**"
+            ),
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="fishset history toggle | fishset history retention <days> [max_catches]")
+        await ctx.send(embed=embed)
+
+    @fish_history.command(name="toggle")
+    @commands.check(is_admin)
+    async def fish_history_toggle(self, ctx: commands.Context):
+        """Turn catch history on or off. Turning it off keeps what was recorded."""
+        conf = self.db.get_conf(ctx.guild)
+        conf.catch_history_enabled = not conf.catch_history_enabled
+        self.save()
+        status = "on" if conf.catch_history_enabled else "off"
+        await ctx.send(f"✅ Catch history is now **{status}**.")
+
+    @fish_history.command(name="retention")
+    @commands.check(is_admin)
+    async def fish_history_retention(self, ctx: commands.Context, days: int, max_catches: int = None):
+        """Set how long catches are kept, and optionally how many.
+        
+        Use `0` days to keep catches until the catch limit is reached.
+        Older catches are dropped the next time the history file is trimmed.
+        
+        Examples:
+        - `fishset history retention 30` - Keep 30 days of catches
+        - `fishset history retention 0 100000` - Keep the newest 100,000 catches
+        """
+        if days < 0:
+            await ctx.send("❌ Days can't be negative.")
+            return
+        if max_catches is not None and not MIN_HISTORY_CATCHES <= max_catches <= MAX_HISTORY_CATCHES:
+            await ctx.send(f"❌ Keep between {MIN_HISTORY_CATCHES:,} and {MAX_HISTORY_CATCHES:,} catches.")
+            return
+        conf = self.db.get_conf(ctx.guild)
+        conf.catch_history_days = days
+        if max_catches is not None:
+            conf.catch_history_max = max_catches
+        self.save()
+        await ctx.send(
+            f"✅ Keeping **{days or 'unlimited'}** days of catches, "
+            f"newest **{conf.catch_history_max:,}** at most."
+        )
+
     @fishset.group(name="channel", invoke_without_command=True)
     @commands.check(is_admin)
     async def fish_channel(self, ctx: commands.Context):
@@ -1379,11 +1602,10 @@ class Admin(MixinMeta):
         Once any channel is added, commands will only work in allowed channels.
         """
         conf = self.db.get_conf(ctx.guild)
-        if channel.id in conf.allowed_channels:
+        if not conf.allow_channel(channel.id):
             await ctx.send(f"❌ {channel.mention} is already in the allowed channels list.")
             return
         
-        conf.allowed_channels.append(channel.id)
         self.save()
         await ctx.send(f"✅ {channel.mention} added to allowed channels.")
 
@@ -1395,11 +1617,10 @@ class Admin(MixinMeta):
         If all channels are removed, the game can be played anywhere again.
         """
         conf = self.db.get_conf(ctx.guild)
-        if channel.id not in conf.allowed_channels:
+        if not conf.disallow_channel(channel.id):
             await ctx.send(f"❌ {channel.mention} is not in the allowed channels list.")
             return
         
-        conf.allowed_channels.remove(channel.id)
         self.save()
         
         if not conf.allowed_channels:
@@ -1445,6 +1666,16 @@ class Admin(MixinMeta):
                 inline=False
             )
         
+        stats = self.permissions.stats()
+        embed.add_field(
+            name="Admin Check Cache (all servers, since load)",
+            value=(
+                f"👥 Cached members: **{stats['entries']:,}**\n"
+                f"✅ Hits: **{stats['hits']:,}** ({stats['hit_rate']:.1%})\n"
+                f"🔍 Misses: **{stats['misses']:,}**"
+            ),
+            inline=False
+        )
         embed.set_footer(text=f"Total: {len(conf.allowed_channels)} channel(s)")
         await ctx.send(embed=embed)
     @fishset.command(name="fpset")
@@ -1478,11 +1709,8 @@ class Admin(MixinMeta):
                 await ctx.send("❌ Invalid amount. Use a number after the `+` sign.")
                 return
             
-            user_data.total_fishpoints += add_amount
-            
-            # Update most_fishpoints_ever if new total is higher
-            if user_data.total_fishpoints > user_data.most_fishpoints_ever:
-                user_data.most_fishpoints_ever = user_data.total_fishpoints
+            # Also raises most_fishpoints_ever if the new total is higher
+            user_data.add_fishpoints(add_amount)
             
             self.save()
             
@@ -1500,7 +1728,7 @@ class Admin(MixinMeta):
                 await ctx.send("❌ Invalid amount. Use a number after the `-` sign.")
                 return
             
-            user_data.total_fishpoints = max(0, user_data.total_fishpoints - sub_amount)
+            user_data.set_stat("total_fishpoints", max(0, user_data.total_fishpoints - sub_amount))
             # most_fishpoints_ever stays unchanged
             
             self.save()
@@ -1523,11 +1751,11 @@ class Admin(MixinMeta):
                 await ctx.send("❌ FishPoints cannot be negative. Use `0` for zero or `-number` to subtract.")
                 return
             
-            user_data.total_fishpoints = new_amount
+            user_data.set_stat("total_fishpoints", new_amount)
             
             # Update most_fishpoints_ever if new amount is higher
             if new_amount > user_data.most_fishpoints_ever:
-                user_data.most_fishpoints_ever = new_amount
+                user_data.set_stat("most_fishpoints_ever", new_amount)
             
             self.save()
             
@@ -1641,31 +1869,187 @@ class Admin(MixinMeta):
     
     @fishset.command(name="debugdownload")
     @commands.is_owner()
-    async def debug_download(self, ctx: commands.Context):
-        """Download the fishing debug log.
+    async def debug_download(self, ctx: commands.Context, *, filters: str = ""):
+        """Download the fishing debug log as a CSV file.
         
-        The log contains detailed information about all catches 
+        The log contains detailed information about the most recent catches 
         made while debug mode was enabled for users.
         Note: Log is stored in memory and will be cleared on cog reload.
+        
+        Filters (all optional, combine freely):
+        `user=<id or mention>`, `fish=<fish_id>`, `trophy=weight|length|token|perfect` (commas for any of),
+        `since=<duration>`, `until=<duration>` (e.g. `since=2h until=30m`), `format=json`
+        
+        Examples:
+            [p]fishset debugdownload
+            [p]fishset debugdownload user=@User trophy=token,perfect since=1d
         """
-        if not self.debug_log:
-            await ctx.send("❌ No debug log entries. Debug mode must be enabled for at least one user who has caught fish.")
+        try:
+            query, fmt = parse_debug_filters(filters)
+        except ValueError as e:
+            await ctx.send(f"❌ Invalid filter `{e}`. See `{ctx.prefix}help fishset debugdownload` for valid filters.")
+            return
+        
+        records = self.debug_log.query(**query)
+        if not records:
+            await ctx.send("❌ No debug log entries match. Debug mode must be enabled for at least one user who has caught fish.")
             return
         
         try:
-            # Create BytesIO buffer with formatted JSON
-            buffer = BytesIO()
-            formatted_json = json.dumps(self.debug_log, indent=2)
-            buffer.write(formatted_json.encode('utf-8'))
-            buffer.seek(0)  # Reset to beginning for reading
-            
+            if fmt == "json":
+                content = json.dumps([record.to_dict() for record in records], indent=2)
+            else:
+                content = catch_log.to_csv(records)
             await ctx.send(
-                f"📊 Fishing debug log ({len(self.debug_log):,} entries):", 
-                file=discord.File(buffer, filename="fishing_debug_export.json")
+                f"📊 Fishing debug log ({len(records):,} of {len(self.debug_log):,} entries):", 
+                file=discord.File(BytesIO(content.encode("utf-8")), filename=f"fishing_debug_export.{fmt}")
             )
         except Exception as e:
             await ctx.send(f"❌ Error creating debug log: {e}")
     
+    @fishset.command(name="debugstats")
+    @commands.is_owner()
+    async def debug_stats(self, ctx: commands.Context, *, filters: str = ""):
+        """Summarize the fishing debug log.
+        
+        Shows catch counts, size percentiles (as a share of each species' max),
+        a weight distribution and trophy rates. Takes the same filters as `debugdownload`.
+        
+        Examples:
+            [p]fishset debugstats
+            [p]fishset debugstats fish=largemouth_bass since=6h
+        """
+        try:
+            query, _ = parse_debug_filters(filters)
+        except ValueError as e:
+            await ctx.send(f"❌ Invalid filter `{e}`. See `{ctx.prefix}help fishset debugstats` for valid filters.")
+            return
+        
+        records = self.debug_log.query(**query)
+        if not records:
+            await ctx.send("❌ No debug log entries match.")
+            return
+        
+        summary = catch_log.summarize(records)
+        log_stats = self.debug_log.stats()
+        embed = discord.Embed(title="📊 Debug Catch Summary", color=discord.Color.blue())
+        embed.description = (
+            f"**{summary['count']:,}** catches by **{summary['users']}** users\n"
+            f"<t:{int(summary['first'])}:f> → <t:{int(summary['last'])}:f>"
+        )
+        embed.add_field(
+            name="Size Percentiles (% of max)",
+            value="\n".join(
+                f"p{q}: ⚖️ {summary['weight_pct'][q]:.0%}  📏 {summary['length_pct'][q]:.0%}"
+                for q in (50, 90, 99)
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Trophies",
+            value=(
+                f"🏆 Tokens: **{summary['token_rate']:.2%}**\n"
+                f"⭐ Perfect: **{summary['perfect_rate']:.2%}**"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Top Species",
+            value="\n".join(f"{name}: {count:,}" for name, count in summary["species"]),
+            inline=False
+        )
+        peak = max(summary["weight_histogram"]) or 1
+        bars = "\n".join(
+            f"{i * 10:>3}-{i * 10 + 10:<3}% {'█' * round(count / peak * 20):<20} {count:,}"
+            for i, count in enumerate(summary["weight_histogram"])
+        )
+        embed.add_field(name="Weight Distribution", value=f"```\n{bars}\n```", inline=False)
+        embed.set_footer(
+            text=f"Buffer {log_stats['size']:,}/{log_stats['capacity']:,} | "
+                 f"sampling {log_stats['sample_rate']:.0%} ({log_stats['skipped']:,} of {log_stats['seen']:,} skipped)"
+        )
+        await ctx.send(embed=embed)
+    
+    @fishset.command(name="debugsample")
+    @commands.is_owner()
+    async def debug_sample(self, ctx: commands.Context, rate: float = None):
+        """Set the share of debug catches that get logged.
+        
+        `1` logs every catch, `0.1` logs one in ten. Lower rates let debug mode stay on
+        for many users in busy servers. Resets to 1 on cog reload.
+        
+        Examples:
+            [p]fishset debugsample - Show the current rate
+            [p]fishset debugsample 0.25 - Log a quarter of debug catches
+        """
+        if rate is None:
+            await ctx.send(f"Debug catches are logged at a **{self.debug_log.sample_rate:.0%}** sample rate.")
+            return
+        if not 0 < rate <= 1:
+            await ctx.send("❌ Sample rate must be greater than 0 and at most 1.")
+            return
+        self.debug_log.sample_rate = rate
+        await ctx.send(f"✅ Debug catches will now be logged at a **{rate:.0%}** sample rate.")
+    
+    @fishset.command(name="debugreplay")
+    @commands.is_owner()
+    async def debug_replay(self, ctx: commands.Context, user: discord.User = None, repeat: int = 1):
+        """Replay the newest traced debug catch and check it reproduces.
+        
+        Fishing sessions started while debug mode is on record every random draw.
+        The replay re-runs them from the session's seed through the current
+        fishing mechanics. A mismatch means the mechanics or fish data changed
+        since the catch. `repeat` times the replay over several runs.
+        
+        Examples:
+            [p]fishset debugreplay
+            [p]fishset debugreplay @User 1000
+        """
+        from ..common.replay import first_mismatch, replay
+        
+        records = self.debug_log.query(user_id=user.id if user else None)
+        record = next((r for r in reversed(records) if r.trace is not None), None)
+        if record is None:
+            await ctx.send("❌ No traced debug catches. Sessions are traced when they start with debug mode on.")
+            return
+        
+        repeat = max(1, min(repeat, 10_000))
+        start = time.perf_counter()
+        for _ in range(repeat):
+            results = replay(record.seed, record.trace)
+        elapsed = (time.perf_counter() - start) / repeat
+        
+        mismatch = first_mismatch(results)
+        if mismatch is None:
+            outcome = f"✅ All **{len(results)}** draws reproduced."
+        else:
+            step = results[mismatch]
+            outcome = (
+                f"❌ Step {mismatch + 1}/{len(results)} (`{step.step}`) diverged:\n"
+                f"expected `{step.expected}`, got `{step.actual}`"
+            )
+        await ctx.send(
+            f"🔁 **{record.fish_name}** caught by {record.user_name} "
+            f"<t:{int(record.timestamp)}:R> (seed `{record.seed}`)\n"
+            f"{outcome}\n"
+            f"⏱️ {elapsed * 1000:.3f} ms per replay over {repeat:,} run(s)"
+        )
+    
+    @fishset.command(name="worldrebuild")
+    @commands.is_owner()
+    async def world_rebuild(self, ctx: commands.Context):
+        """Rebuild the World Records boards from every server's records.
+        
+        The boards are kept up to date as records are set, so this is only
+        needed if the world records file was lost or edited by hand. The scan
+        runs in the background without blocking the bot.
+        """
+        async with ctx.typing():
+            start = time.perf_counter()
+            entries = await asyncio.shield(self.request_world_rebuild())
+            elapsed = time.perf_counter() - start
+        await ctx.send(f"✅ Rebuilt the World Records: **{entries:,}** entries in {elapsed:.2f}s")
+    
     @fishset.command(name="debugclear")
     @commands.is_owner()
     async def debug_clear(self, ctx: commands.Context):
@@ -1677,10 +2061,168 @@ class Admin(MixinMeta):
             await ctx.send("❌ No debug log entries to clear.")
             return
         
-        entry_count = len(self.debug_log)
-        self.debug_log.clear()
+        entry_count = self.debug_log.clear()
         await ctx.send(f"✅ Debug log cleared ({entry_count:,} entries removed).")
 
+    @fishset.command(name="simulate", aliases=["sim"])
+    @commands.check(is_admin)
+    async def simulate_catches(self, ctx: commands.Context, *, options: str = ""):
+        """Simulate millions of casts and report catch rates, trophy rates and FishPoints per hour.
+        
+        Without options, your own location, gear, luck and the server's current season
+        and weather are used. Override anything with `key=value`, use commas to build a grid.
+        
+        Keys:
+        `location`, `season`, `weather`, `bait`, `rod` (or `none`), `luck` (0-9),
+        `casts` (per grid point), `reaction` (seconds per click), `seed`
+        
+        The simulated player never makes a mistake, so rates are best-case.
+        Results come as a table and a CSV with one row per grid point.
+        
+        Example:
+        [p]fishset simulate location=ocean season=winter bait=spoons luck=0,9
+        """
+        try:
+            from ..common.simulator import DEFAULT_REACTION_TIME, format_table, simulate_point, to_csv
+        except ImportError:
+            await ctx.send("❌ The simulator requires `numpy`. Please install it with `[p]pipinstall numpy`.")
+            return
+        from ..common.weather import WeatherType
+        from ..databases.items import LURES_DATABASE, RODS_DATABASE
+        from ..views.fishing_view import FISHING_LOCATIONS
+        from .helper_functions import Season, calculate_gear_luck_bonus, get_environment
+        
+        conf = self.db.get_conf(ctx.guild)
+        user_data = conf.get_user(ctx.author)
+        env = get_environment(self.db, ctx.guild)
+        equipped_rod = user_data.get_equipped_rod()
+        equipped_lure = user_data.get_equipped_lure()
+        
+        seasons = {s.value.lower(): s.value for s in Season}
+        weathers = {w.name_str.lower(): w.name_str for w in WeatherType}
+        baits = {lure["bait_id"]: lure["bait_id"] for lure in LURES_DATABASE.values()}
+        rods = {rod_id: rod_id for rod_id in RODS_DATABASE}
+        rods["none"] = None
+        
+        rod_id = equipped_rod.get("rod_id", "") if equipped_rod else None
+        rod_water = RODS_DATABASE.get(rod_id, {}).get("water_type") if rod_id else None
+        grid = {
+            "location": ["ocean" if rod_water == "saltwater" else "pond"],
+            "season": [env["season"]],
+            "weather": [env["weather"]["type"]],
+            "bait": [equipped_lure.get("lure_id", "") if equipped_lure else "breadballs"],
+            "rod": [rod_id],
+            "luck": [calculate_gear_luck_bonus(user_data)],
+        }
+        choices = {
+            "location": {loc: loc for loc in FISHING_LOCATIONS},
+            "season": seasons,
+            "weather": weathers,
+            "bait": baits,
+            "rod": rods,
+        }
+        run = {"casts": 1_000_000, "reaction": DEFAULT_REACTION_TIME, "seed": None}
+        
+        for token in options.split():
+            key, sep, value = token.partition("=")
+            key = key.lower()
+            try:
+                if not sep or not value:
+                    raise ValueError
+                if key in choices:
+                    grid[key] = [choices[key][v] for v in value.lower().split(",")]
+                elif key == "luck":
+                    grid[key] = [int(v) for v in value.split(",")]
+                    if any(not 0 <= v <= 9 for v in grid[key]):
+                        raise ValueError
+                elif key in ("casts", "seed"):
+                    run[key] = int(value)
+                elif key == "reaction":
+                    run[key] = float(value)
+                else:
+                    raise ValueError
+            except (ValueError, KeyError):
+                await ctx.send(f"❌ Invalid option `{token}`. See `{ctx.prefix}help fishset simulate` for valid keys.")
+                return
+        
+        # Keep runs bounded so one admin can't tie up the host
+        run["casts"] = max(1000, min(run["casts"], 5_000_000))
+        run["reaction"] = max(0.25, min(run["reaction"], 4.5))  # Hooks must be set within 5 seconds
+        
+        points = []
+        for location in grid["location"]:
+            for season in grid["season"]:
+                for weather in grid["weather"]:
+                    for bait in grid["bait"]:
+                        for rod in grid["rod"]:
+                            for luck in grid["luck"]:
+                                points.append({
+                                    "location": location,
+                                    "water_type": FISHING_LOCATIONS[location]["water_type"],
+                                    "season": season,
+                                    "weather": weather,
+                                    "bait": bait,
+                                    "rod": rod,
+                                    "luck": luck,
+                                    "reaction": run["reaction"],
+                                })
+        if len(points) > 48:
+            await ctx.send(f"❌ That grid has {len(points)} points, the limit is 48.")
+            return
+        run["casts"] = min(run["casts"], 50_000_000 // len(points))
+        
+        # One independent stream per grid point, reproducible when a seed is given
+        import numpy as np
+        seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(run["seed"]).spawn(len(points))]
+        
+        async with ctx.typing():
+            loop = asyncio.get_running_loop()
+            pool = ProcessPoolExecutor(max_workers=max(1, min(len(points), os.cpu_count() or 1, 4)))
+            try:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(pool, simulate_point, point, run["casts"], seed)
+                    for point, seed in zip(points, seeds)
+                ))
+            except Exception as e:
+                log.exception("Catch simulation failed", exc_info=e)
+                await ctx.send(f"❌ Simulation failed: {e}")
+                return
+            finally:
+                pool.shutdown(wait=False)
+        
+        embed = discord.Embed(title="🎣 Catch Simulation", color=discord.Color.blue())
+        embed.description = f"```\n{format_table(results)}\n```"
+        if len(results) == 1:
+            result = results[0]
+            rates = "\n".join(
+                f"{rarity.title()}: **{rate:.3%}** ({result['rarity_per_hour'][rarity]:.2f}/hr)"
+                for rarity, rate in result["rarity_rates"].items()
+            )
+            embed.add_field(name="Rarity", value=rates, inline=True)
+            minutes = result["minutes_per_catch"]
+            embed.add_field(
+                name="Per Catch",
+                value=(
+                    f"⏱️ {minutes:.1f} min\n" if minutes else "⏱️ never\n"
+                ) + (
+                    f"⚖️ {result['mean_weight_oz'] / 16:.1f} lbs avg\n"
+                    f"🏆 {result['tokens_per_hour']:.3f} tokens/hr"
+                ),
+                inline=True
+            )
+            if result["stranded"]:
+                embed.add_field(
+                    name="⚠️ No Bites",
+                    value=f"{result['stranded']:,} casts never got a fish to strike.",
+                    inline=False
+                )
+        embed.set_footer(
+            text=f"{run['casts']:,} casts per point | {run['reaction']:g}s reactions | "
+                 f"C/hr = catches/hour, Leg% = legendary share, Tok% = FishMaster token share"
+        )
+        csv_file = discord.File(BytesIO(to_csv(results).encode("utf-8")), filename="catch_simulation.csv")
+        await ctx.send(embed=embed, file=csv_file)
+
     @fishset.command(name="listfish")
     async def list_fish(self, ctx: commands.Context, water_type: str = None):
         """Display a paginated list of all fish in the database.
@@ -1740,6 +2282,43 @@ class Admin(MixinMeta):
         view.message = message
 
 
+def parse_debug_filters(options: str) -> tuple:
+    """
+    Parse `key=value` debug log filters into CatchLog.query() kwargs and an export format.
+    
+    Raises ValueError with the offending token.
+    """
+    query = {}
+    fmt = "csv"
+    now = time.time()
+    for token in options.split():
+        key, sep, value = token.partition("=")
+        key = key.lower()
+        try:
+            if not sep or not value:
+                raise ValueError
+            if key == "user":
+                query["user_id"] = int(value.strip("<@!>"))
+            elif key == "fish":
+                query["fish_id"] = value.lower()
+            elif key == "trophy":
+                query["trophy"] = 0
+                for name in value.lower().split(","):
+                    query["trophy"] |= catch_log.TROPHY_FLAGS[name]
+            elif key in ("since", "until"):
+                delta = commands.parse_timedelta(value)
+                if delta is None:
+                    raise ValueError
+                query[key] = now - delta.total_seconds()
+            elif key == "format" and value.lower() in ("csv", "json"):
+                fmt = value.lower()
+            else:
+                raise ValueError
+        except (ValueError, KeyError, commands.BadArgument):
+            raise ValueError(token)
+    return query, fmt
+
+
 class FishListView(discord.ui.View):
     """Paginated view for displaying fish list."""
     
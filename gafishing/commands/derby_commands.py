@@ -0,0 +1,228 @@
+import logging
+
+import discord
+from redbot.core import commands
+
+from ..abc import MixinMeta
+from ..common.derby import (
+    DERBY_METRICS,
+    MAX_MINUTES,
+    METRIC_NAMES,
+    MIN_MINUTES,
+    RESULTS_KEPT,
+    SCOREBOARD_INTERVAL,
+    Derby,
+)
+from ..databases.fish import FISH_DATABASE
+from .admin_commands import is_admin
+from .helper_functions import is_channel_allowed
+
+log = logging.getLogger("red.greenacresfishing.derby")
+
+MEDALS = ("🥇", "🥈", "🥉")
+
+
+def format_weight(weight_oz: float) -> str:
+    return f"{weight_oz / 16:.1f} lbs" if weight_oz >= 16 else f"{weight_oz:.1f} oz"
+
+
+def derby_embed(summary: dict, final: bool = False) -> discord.Embed:
+    """Scoreboard for a running derby, or the results of a finished one, from `Derby.results()`."""
+    from ..views.fishing_view import FISHING_LOCATIONS
+
+    location = FISHING_LOCATIONS.get(summary["location"], FISHING_LOCATIONS["pond"])
+    embed = discord.Embed(
+        title=f"🏁 {location['emoji']} {location['name']} Derby{' - Final Results' if final else ''}",
+        description=(
+            f"{'Ended' if final else 'Ends'} <t:{int(summary['ends_at'])}:R> | "
+            f"Ranked by **{METRIC_NAMES[summary['metric']]}**\n"
+            f"🎣 **{summary['anglers']:,}** anglers | 🐟 **{summary['catches']:,}** catches"
+        ),
+        color=discord.Color.gold() if final else discord.Color.blue()
+    )
+    lines = []
+    for rank, entry in enumerate(summary["standings"], start=1):
+        place = MEDALS[rank - 1] if rank <= len(MEDALS) else f"**{rank}.**"
+        if summary["metric"] == "weight":
+            fish_name = FISH_DATABASE.get(entry["best_fish_id"], {}).get("name", "Fish")
+            score = f"{format_weight(entry['best_weight_oz'])} {fish_name}"
+        else:
+            score = f"{entry['points']:,} FP ({entry['catches']:,} fish)"
+        lines.append(f"{place} {entry['name']} - {score}")
+    embed.add_field(name="Standings", value="\n".join(lines) or "*No catches yet.*", inline=False)
+    if not final:
+        embed.set_footer(text="Join with the derby join command and fish at the derby location!")
+    return embed
+
+
+class Derbies(MixinMeta):
+    """Timed fishing derbies."""
+
+    async def _update_scoreboard(self, derby: Derby, final: bool = False) -> None:
+        """Re-render the derby's single scoreboard message."""
+        derby.dirty = False
+        guild = self.bot.get_guild(derby.guild_id)
+        channel = guild.get_channel(derby.channel_id) if guild else None
+        if channel is None or derby.message_id is None:
+            return
+        try:
+            await channel.get_partial_message(derby.message_id).edit(embed=derby_embed(derby.results(), final))
+        except discord.NotFound:
+            derby.message_id = None
+        except discord.HTTPException as e:
+            log.debug(f"Failed to update derby scoreboard in {derby.guild_id}: {e}")
+
+    async def _derby_tick(self, guild_id: int) -> None:
+        """Refresh the scoreboard at a fixed cadence and finish the derby when time runs out."""
+        derby = self.derbies.get(guild_id)
+        if derby is None:
+            return
+        if derby.is_over():
+            await self._finish_derby(derby)
+            return
+        if derby.dirty:
+            await self._update_scoreboard(derby)
+        self.scheduler.schedule(("derby", guild_id), min(SCOREBOARD_INTERVAL, derby.time_left()), self._derby_tick, guild_id)
+
+    def _close_derby(self, derby: Derby) -> bool:
+        """Stop tracking the derby and store its results. Returns False if it was already closed."""
+        if self.derbies.get(derby.guild_id) is not derby:
+            return False
+        del self.derbies[derby.guild_id]
+        self.scheduler.cancel(("derby", derby.guild_id))
+
+        conf = self.db.get_conf(derby.guild_id)
+        conf.derby_results.append(derby.results())
+        del conf.derby_results[:-RESULTS_KEPT]
+        return True
+
+    async def _finish_derby(self, derby: Derby) -> None:
+        """Write the results once and post the final standings."""
+        if not self._close_derby(derby):
+            return
+        self.save()
+        await self._announce_derby(derby)
+
+    async def _announce_derby(self, derby: Derby) -> None:
+        """Show the final standings on the scoreboard and congratulate the winner."""
+        await self._update_scoreboard(derby, final=True)
+        guild = self.bot.get_guild(derby.guild_id)
+        channel = guild.get_channel(derby.channel_id) if guild else None
+        if channel is None:
+            return
+        standings = derby.standings(1)
+        if standings:
+            winner = standings[0]
+            text = f"🏆 The derby is over! Congratulations to **{winner.name}** for taking first place!"
+        else:
+            text = "🏁 The derby is over! Nobody landed a fish this time."
+        try:
+            await channel.send(text, embed=derby_embed(derby.results(), final=True))
+        except discord.HTTPException as e:
+            log.debug(f"Failed to announce derby results in {derby.guild_id}: {e}")
+
+    @commands.group(name="derby", invoke_without_command=True)
+    @commands.guild_only()
+    async def derby(self, ctx: commands.Context):
+        """Show the current fishing derby standings."""
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
+            return  # Silently ignore commands in non-allowed channels
+        derby = self.derbies.get(ctx.guild.id)
+        if derby is None:
+            await ctx.send(f"There's no derby running. See `{ctx.prefix}derby results` for the last one.")
+            return
+        await ctx.send(embed=derby_embed(derby.results()))
+
+    @derby.command(name="start")
+    @commands.check(is_admin)
+    async def derby_start(self, ctx: commands.Context, location: str, minutes: int, metric: str = "weight"):
+        """Start a timed derby at one location.
+
+        Anglers join with `derby join` and every fish they land at the derby location counts.
+        Rank by `weight` (heaviest single fish) or `points` (total FishPoints caught).
+        The scoreboard is posted in this channel and refreshed every few seconds.
+
+        Examples:
+        - `derby start lake 30` - 30 minute heaviest-fish derby at the lake
+        - `derby start ocean 60 points` - One hour FishPoints derby at the ocean
+        """
+        from ..views.fishing_view import FISHING_LOCATIONS
+
+        conf = self.db.get_conf(ctx.guild)
+        location = location.lower()
+        metric = metric.lower()
+        if not conf.is_game_enabled:
+            await ctx.send("❌ Greenacres Fishing is currently disabled.")
+            return
+        if ctx.guild.id in self.derbies:
+            await ctx.send("❌ A derby is already running in this server.")
+            return
+        if location not in FISHING_LOCATIONS:
+            await ctx.send(f"❌ Unknown location. Choose from: {', '.join(FISHING_LOCATIONS)}")
+            return
+        if not MIN_MINUTES <= minutes <= MAX_MINUTES:
+            await ctx.send(f"❌ A derby lasts between {MIN_MINUTES} and {MAX_MINUTES} minutes.")
+            return
+        if metric not in DERBY_METRICS:
+            await ctx.send(f"❌ Rank by one of: {', '.join(DERBY_METRICS)}")
+            return
+
+        derby = Derby(ctx.guild.id, ctx.channel.id, location, minutes, metric)
+        self.derbies[ctx.guild.id] = derby
+        message = await ctx.send(embed=derby_embed(derby.results()))
+        derby.message_id = message.id
+        derby.dirty = False
+        self.scheduler.schedule(("derby", ctx.guild.id), SCOREBOARD_INTERVAL, self._derby_tick, ctx.guild.id)
+
+    @derby.command(name="stop")
+    @commands.check(is_admin)
+    async def derby_stop(self, ctx: commands.Context):
+        """End the running derby now and post the results."""
+        derby = self.derbies.get(ctx.guild.id)
+        if derby is None:
+            await ctx.send("❌ There's no derby running.")
+            return
+        derby.end_now()
+        await self._finish_derby(derby)
+        await ctx.tick()
+
+    @derby.command(name="join")
+    @commands.guild_only()
+    async def derby_join(self, ctx: commands.Context):
+        """Join the running derby and head to its location."""
+        from ..views.fishing_view import FishingView
+
+        conf = self.db.get_conf(ctx.guild)
+        if not conf.is_game_enabled:
+            await ctx.send("Greenacres Fishing is currently disabled. Please try again later.")
+            return
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
+            return  # Silently ignore commands in non-allowed channels
+        derby = self.derbies.get(ctx.guild.id)
+        if derby is None or derby.is_over():
+            await ctx.send("❌ There's no derby running.")
+            return
+        if ctx.author.id not in conf.users or not conf.get_user(ctx.author).first_join:
+            await ctx.send(f"❌ You haven't started fishing yet! Use `{ctx.prefix}fish` to begin.")
+            return
+
+        derby.join(ctx.author.id, ctx.author.display_name)
+        view = FishingView(cog=self, author=ctx.author, location=derby.location)
+        embed = await view.create_fishing_embed(ctx.guild)
+        view.message = await ctx.send(
+            f"🏁 {ctx.author.mention} you're in! Catches here count until <t:{int(derby.ends_at)}:t>.",
+            embed=embed,
+            view=view
+        )
+
+    @derby.command(name="results")
+    @commands.guild_only()
+    async def derby_results(self, ctx: commands.Context):
+        """Show the results of the last finished derby."""
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
+            return  # Silently ignore commands in non-allowed channels
+        conf = self.db.get_conf(ctx.guild)
+        if not conf.derby_results:
+            await ctx.send("❌ No derbies have finished in this server yet.")
+            return
+        await ctx.send(embed=derby_embed(conf.derby_results[-1], final=True))
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -7,23 +8,30 @@ from pathlib import Path
 import time
 import random
 import json
+import logging
 
 import discord
 
+from ..common.catch_log import MAX_LENGTH, MAX_WEIGHT, PERFECT, TOKEN, CatchLog, CatchRecord
 from ..common.models import DB
+from ..common.permissions import PermissionCache
+from ..common.weather import Weather, weather_engine
 from ..databases.fish import FISH_DATABASE
 from ..databases.items import HATS_DATABASE, COATS_DATABASE, BOOTS_DATABASE, LURES_DATABASE
 
+log = logging.getLogger("red.greenacresfishing.helpers")
 
-def log_debug_catch(debug_log: list, user: discord.User, fish_id: str, fish_data: dict, weight_oz: float, length_in: float, 
-                    max_weight_oz: float, max_length_in: float, earned_token: bool, earned_perfect: bool, total_tokens: int):
+
+def log_debug_catch(debug_log: CatchLog, user: discord.User, fish_id: str, fish_data: dict, weight_oz: float, length_in: float, 
+                    max_weight_oz: float, max_length_in: float, earned_token: bool, earned_perfect: bool, total_tokens: int,
+                    seed: Optional[int] = None, trace: Optional[List[tuple]] = None):
     """
     Log a fish catch to the in-memory debug log.
     
     Parameters
     ----------
-    debug_log : list
-        The cog's in-memory debug log list to append to
+    debug_log : CatchLog
+        The cog's in-memory debug catch ring buffer
     user : discord.User
         The user who caught the fish
     fish_id : str
@@ -44,33 +52,36 @@ def log_debug_catch(debug_log: list, user: discord.User, fish_id: str, fish_data
         Whether this was a perfect trophy
     total_tokens : int
         User's total tokens after this catch
+    seed : Optional[int]
+        Seed of the fishing session the fish came from
+    trace : Optional[List[tuple]]
+        The session's traced draws, for replaying the catch
     """
     try:
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "user_id": user.id,
-            "user_name": f"{user.name}#{user.discriminator}" if user.discriminator != "0" else user.name,
-            "fish_id": fish_id,
-            "fish_name": fish_data.get("name", "Unknown"),
-            "weight_caught_oz": round(weight_oz, 1),
-            "weight_max_oz": round(max_weight_oz, 1),
-            "is_max_weight": weight_oz == max_weight_oz,
-            "length_caught_in": round(length_in, 1),
-            "length_max_in": round(max_length_in, 1),
-            "is_max_length": length_in == max_length_in,
-            "token_awarded": earned_token,
-            "perfect_trophy": earned_perfect,
-            "total_tokens": total_tokens
-        }
-        
-        debug_log.append(entry)
-        
-        # Keep log from growing too large (max 1000 entries)
-        if len(debug_log) > 1000:
-            debug_log.pop(0)
+        flags = (
+            (MAX_WEIGHT if weight_oz == max_weight_oz else 0)
+            | (MAX_LENGTH if length_in == max_length_in else 0)
+            | (TOKEN if earned_token else 0)
+            | (PERFECT if earned_perfect else 0)
+        )
+        debug_log.record(CatchRecord(
+            timestamp=time.time(),
+            user_id=user.id,
+            user_name=f"{user.name}#{user.discriminator}" if user.discriminator != "0" else user.name,
+            fish_id=fish_id,
+            fish_name=fish_data.get("name", "Unknown"),
+            weight_oz=weight_oz,
+            max_weight_oz=max_weight_oz,
+            length_in=length_in,
+            max_length_in=max_length_in,
+            flags=flags,
+            total_tokens=total_tokens,
+            seed=seed,
+            trace=tuple(trace) if trace is not None else None,
+        ))
     except Exception as e:
-        # Silently fail - debug logging shouldn't break gameplay
-        print(f"Debug log error: {e}")
+        # Debug logging shouldn't break gameplay
+        log.error("Failed to log debug catch", exc_info=e)
 
 
 def ensure_lure_uses(lure_dict: dict) -> None:
@@ -97,14 +108,15 @@ def ensure_lure_uses(lure_dict: dict) -> None:
             lure_dict["remaining_uses"] = quantity * uses_per_item
 
 
-async def is_channel_allowed(db: DB, guild: discord.Guild, channel_id: int, author: discord.Member = None, bot = None) -> bool:
+async def is_channel_allowed(db: DB, guild: discord.Guild, channel_id: int, author: discord.Member = None, bot = None,
+                             permissions: PermissionCache = None) -> bool:
     """
     Check if a channel is allowed for fishing commands.
     
     Returns True if:
-    - The author is an admin (can use commands anywhere)
     - No channels are in allowed_channels (empty = all allowed)
     - The channel_id is in the allowed_channels list
+    - The author is an admin (can use commands anywhere)
     
     Parameters
     ----------
@@ -118,30 +130,38 @@ async def is_channel_allowed(db: DB, guild: discord.Guild, channel_id: int, auth
         The member running the command (for admin check)
     bot : optional
         The bot instance (for Red admin check)
+    permissions : PermissionCache, optional
+        Cache for the Red admin check, without it Red is asked every time
     
     Returns
     -------
     bool
         True if the channel is allowed, False otherwise
     """
-    # Check if author is an admin - admins can use commands anywhere
-    if author is not None:
-        # Check Discord permissions
-        if author.guild_permissions.manage_guild or author.guild_permissions.administrator:
-            return True
-        # Check Red-DiscordBot admin status
-        if bot is not None:
-            try:
-                if await bot.is_admin(author):
-                    return True
-            except Exception:
-                pass
-    
     conf = db.get_conf(guild)
+    allowed = conf.allowed_channel_set
     # If no channels are specified, all channels are allowed
-    if not conf.allowed_channels:
+    if not allowed or channel_id in allowed:
         return True
-    return channel_id in conf.allowed_channels
+    
+    # Check if author is an admin - admins can use commands anywhere
+    if author is None:
+        return False
+    # Check Discord permissions
+    if author.guild_permissions.manage_guild or author.guild_permissions.administrator:
+        return True
+    if bot is None:
+        return False
+    if permissions is not None:
+        # Known non-admins in the wrong channel get turned away without awaiting
+        if permissions.is_known_non_admin(guild.id, author.id):
+            return False
+        return await permissions.is_admin(bot, author)
+    # Check Red-DiscordBot admin status
+    try:
+        return await bot.is_admin(author)
+    except Exception:
+        return False
 
 
 class Season(Enum):
@@ -338,6 +358,18 @@ def get_game_calendar(db: DB, guild: discord.Guild | int) -> GameCalendar:
     )
 
 
+def get_time_period(game_hour: int) -> TimeOfDay:
+    """Get the time period (Dawn, Morning, etc.) a game hour falls in."""
+    for tod in TimeOfDay:
+        if tod == TimeOfDay.NIGHT:
+            # Night wraps around midnight
+            if game_hour >= tod.start_hour or game_hour < tod.end_hour:
+                return tod
+        elif tod.start_hour <= game_hour < tod.end_hour:
+            return tod
+    return TimeOfDay.NIGHT
+
+
 def get_game_time_of_day(db: DB, guild: discord.Guild | int) -> GameTimeOfDay:
     """
     Get the current game time of day.
@@ -365,16 +397,7 @@ def get_game_time_of_day(db: DB, guild: discord.Guild | int) -> GameTimeOfDay:
     game_minute = int(total_game_minutes % 60)
     
     # Determine time period
-    time_period = TimeOfDay.NIGHT  # Default
-    for tod in TimeOfDay:
-        if tod == TimeOfDay.NIGHT:
-            # Night wraps around midnight
-            if game_hour >= tod.start_hour or game_hour < tod.end_hour:
-                time_period = tod
-                break
-        elif tod.start_hour <= game_hour < tod.end_hour:
-            time_period = tod
-            break
+    time_period = get_time_period(game_hour)
     
     # Daytime is roughly 6 AM to 8 PM
     is_daytime = 6 <= game_hour < 20
@@ -388,21 +411,102 @@ def get_game_time_of_day(db: DB, guild: discord.Guild | int) -> GameTimeOfDay:
     )
 
 
+def _format_game_time(calendar: GameCalendar, time_of_day: GameTimeOfDay) -> str:
+    return (
+        f"{time_of_day['emoji']} {time_of_day['name']} "
+        f"({time_of_day['hour']:02d}:{time_of_day['minute']:02d}) - "
+        f"Day {calendar['day_of_season']} of {calendar['season']}, "
+        f"Year {calendar['year']}"
+    )
+
+
 def get_game_time_display(db: DB, guild: discord.Guild | int) -> str:
     """
     Get a formatted string showing current game time and calendar.
     
     Example: "☀️ Morning (09:30) - Day 15 of Summer, Year 2"
     """
-    calendar = get_game_calendar(db, guild)
-    time_of_day = get_game_time_of_day(db, guild)
+    return get_environment(db, guild)["time_display"]
+
+
+# ============================================================================
+# ENVIRONMENT SNAPSHOTS
+# ============================================================================
+
+class EnvironmentSnapshot(TypedDict):
+    """Everything a view needs to know about a guild's current game conditions."""
+    season: str
+    calendar: GameCalendar
+    time_of_day: GameTimeOfDay
+    weather: Weather
+    time_display: str
+    expires_at: float  # Unix time of the next game-minute boundary
+
+
+# guild_id -> (settings key, snapshot)
+_ENVIRONMENT_CACHE: Dict[int, tuple] = {}
+
+
+def _environment_key(conf) -> tuple:
+    """Settings a snapshot depends on. Changing any of them invalidates it."""
+    return (conf.timezone, conf.hemisphere, conf.game_time_multiplier, conf.game_epoch)
+
+
+def get_environment(db: DB, guild: discord.Guild | int) -> EnvironmentSnapshot:
+    """
+    Get the guild's current calendar, time of day, weather and season.
     
-    return (
-        f"{time_of_day['emoji']} {time_of_day['name']} "
-        f"({time_of_day['hour']:02d}:{time_of_day['minute']:02d}) - "
-        f"Day {calendar['day_of_season']} of {calendar['season']}, "
-        f"Year {calendar['year']}"
+    The snapshot is computed once and reused until the next game-minute boundary
+    (30 real seconds at the default 2.0 multiplier), so rendering an embed
+    doesn't redo timezone, season and weather work for every field.
+    A cached snapshot is also dropped as soon as the guild's timezone,
+    hemisphere, game time multiplier or epoch differ from when it was built.
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    gid = guild if isinstance(guild, int) else guild.id
+    conf = db.get_conf(gid)
+    _ensure_game_epoch(db, gid)
+    key = _environment_key(conf)
+    now = time.time()
+    
+    cached = _ENVIRONMENT_CACHE.get(gid)
+    if cached is not None:
+        cached_key, snapshot = cached
+        if cached_key == key and now < snapshot["expires_at"]:
+            return snapshot
+    
+    total_days = get_total_game_days(db, gid)
+    calendar = get_game_calendar(db, gid)
+    time_of_day = get_game_time_of_day(db, gid)
+    weather = weather_engine.get_weather(gid, calendar['season'], calendar['total_game_days'], time_of_day['hour'])
+    
+    # Real seconds left until the game clock ticks over to the next minute
+    if conf.game_time_multiplier > 0:
+        minute_fraction = (total_days * 24 * 60) % 1.0
+        seconds_left = (1.0 - minute_fraction) * 60 / conf.game_time_multiplier
+    else:
+        seconds_left = 60.0
+    
+    snapshot = EnvironmentSnapshot(
+        season=calendar['season'],
+        calendar=calendar,
+        time_of_day=time_of_day,
+        weather=weather,
+        time_display=_format_game_time(calendar, time_of_day),
+        expires_at=now + seconds_left,
     )
+    _ENVIRONMENT_CACHE[gid] = (key, snapshot)
+    return snapshot
+
+
+def invalidate_environment(guild: discord.Guild | int | None = None) -> None:
+    """Drop the cached snapshot for a guild, or for every guild if none is given."""
+    if guild is None:
+        _ENVIRONMENT_CACHE.clear()
+        return
+    gid = guild if isinstance(guild, int) else guild.id
+    _ENVIRONMENT_CACHE.pop(gid, None)
 
 
 def is_fish_biting_time(db: DB, guild: discord.Guild | int) -> tuple[bool, str]:
@@ -417,7 +521,7 @@ def is_fish_biting_time(db: DB, guild: discord.Guild | int) -> tuple[bool, str]:
     Returns:
         Tuple of (is_good_time: bool, reason: str)
     """
-    time_of_day = get_game_time_of_day(db, guild)
+    time_of_day = get_environment(db, guild)["time_of_day"]
     
     if time_of_day['name'] in ("Dawn", "Dusk"):
         return True, "🎣 The fish are very active right now!"
@@ -467,8 +571,9 @@ async def welcome_to_fishing(
     )
     
     # Get current game conditions
-    calendar = get_game_calendar(db, guild)
-    time_of_day = get_game_time_of_day(db, guild)
+    env = get_environment(db, guild)
+    calendar = env["calendar"]
+    time_of_day = env["time_of_day"]
     
     embed.add_field(
         name="🌍 Current Conditions",
@@ -522,28 +627,20 @@ async def setup_new_player(db: DB, guild: discord.Guild, user: discord.Member) -
     user_data = conf.get_user(user)
     
     # Mark as joined
-    user_data.first_join = True
+    user_data.set_stat("first_join", True)
     user_data.first_cast_timestamp = str(int(time.time()))
     
     # Give starter items
-    user_data.total_fishpoints = 100
-    user_data.most_fishpoints_ever = 100  # Track starting FP as initial max
+    user_data.set_stat("total_fishpoints", 100)
+    user_data.set_stat("most_fishpoints_ever", 100)  # Track starting FP as initial max
     
     # Add wooden canepole and equip it
-    user_data.current_rod_inventory.append({
-        "rod_id": "wooden_canepole",
-        "durability": 50,
-    })
-    user_data.equip_rod(0)  # Equip the first rod
-    
-    # Add starter bait (breadballs) and equip it
-    user_data.current_lure_inventory.append({
-        "lure_id": "breadballs",
-        "quantity": 10,
-        "remaining_uses": 10,  # 10 breadballs × 1 use each
-        "uses_per_item": 1,
-    })
-    user_data.equip_lure(0)  # Equip the first lure
+    rod_key = user_data.add_rod("wooden_canepole", durability=50)
+    user_data.equip_rod(rod_key)
+    
+    # Add starter bait (10 breadballs × 1 use each) and equip it
+    user_data.add_lures("breadballs", quantity=10, uses_per_item=1)
+    user_data.equip_lure("breadballs")
 
 
 # =============================================================================
@@ -564,9 +661,25 @@ class FishingPhase(Enum):
     ESCAPED = "escaped"              # Fish got away
 
 
-@dataclass
+# Status lines kept per session
+SESSION_MESSAGE_LIMIT = 5
+
+
+@dataclass(slots=True)
 class FishingSession:
-    """Tracks the state of an active fishing session."""
+    """
+    Tracks the state of an active fishing session.
+    
+    Only ids are stored; fish data is looked up from FISH_DATABASE on access.
+    Sessions are reused between casts via `reset()` instead of being rebuilt.
+    
+    Every random draw for the session comes from `rng`, seeded with `seed` on
+    creation and on each reset. The generator (about 2.5 KB of Mersenne Twister
+    state) is only built on the first draw after a reseed and dropped again on
+    the next one, so idle sessions only hold the seed. When `trace` is a list,
+    the inputs and outcome of each draw are appended to it so the session can be
+    replayed exactly (see `common/replay.py`).
+    """
     
     # Location info
     location: str = "pond"
@@ -584,7 +697,6 @@ class FishingSession:
     
     # Fish info (once hooked)
     fish_id: Optional[str] = None
-    fish_data: Optional[Dict[str, Any]] = None
     fish_weight_oz: float = 0.0
     fish_length_inches: float = 0.0
     is_max_size: bool = False        # True if this is a trophy fish
@@ -601,18 +713,88 @@ class FishingSession:
     last_action_time: float = field(default_factory=time.time)
     timeout_seconds: float = 3.0     # Player has 3 seconds to respond
     
-    # Messages for dynamic updates
+    # Messages for dynamic updates, oldest first (a plain list, a deque block is ~5x larger)
     status_messages: List[str] = field(default_factory=list)
     
     # Event tracking to prevent lockups
     last_event_was_tension: bool = False  # Track if last event was tension
     
+    # Randomness (reseeded in __post_init__ and reset)
+    seed: int = 0
+    _rng: Optional[random.Random] = None  # Built from `seed` on first use, see `rng`
+    trace: Optional[List[tuple]] = None  # (step, inputs, outcome) per draw, None when not tracing
+    
+    def __post_init__(self):
+        self.reseed(self.seed or None)
+    
+    def reseed(self, seed: Optional[int] = None):
+        """Start a new random sequence (a fresh seed unless one is given) and clear the trace."""
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self._rng = None
+        if self.trace is not None:
+            self.trace = []
+    
+    @property
+    def rng(self) -> random.Random:
+        """The session's generator, seeded with `seed` when first drawn from."""
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+    
+    def record(self, step: str, inputs: Dict[str, Any], outcome: Any):
+        """Append a draw to the trace."""
+        self.trace.append((step, inputs, outcome))
+    
+    @property
+    def fish_data(self) -> Optional[Dict[str, Any]]:
+        """Database entry for the hooked fish, if any."""
+        if self.fish_id is None:
+            return None
+        return FISH_DATABASE.get(self.fish_id)
+    
+    def reset(
+        self,
+        location: str,
+        water_type: str,
+        luck_bonus: int = 0,
+        rod_id: Optional[str] = None,
+        trace: Optional[bool] = None
+    ):
+        """Return the session to a fresh idle state for the next cast.
+        
+        `trace` turns draw tracing on or off; None keeps the current setting.
+        """
+        self.location = location
+        self.water_type = water_type
+        self.rod_id = rod_id
+        self.phase = FishingPhase.IDLE
+        self.line_distance = 0
+        self.max_distance = 0
+        self.fish_id = None
+        self.fish_weight_oz = 0.0
+        self.fish_length_inches = 0.0
+        self.is_max_size = False
+        self.successful_interactions = 0
+        self.botched_attempts = 0
+        self.max_botched = 3
+        self.luck_bonus = luck_bonus
+        self.last_action_time = time.time()
+        self.timeout_seconds = 3.0
+        self.status_messages.clear()
+        self.last_event_was_tension = False
+        if trace is not None:
+            self.trace = [] if trace else None
+        self.reseed()
+    
     def add_message(self, msg: str):
-        """Add a status message."""
+        """Add a status message, dropping the oldest past SESSION_MESSAGE_LIMIT."""
         self.status_messages.append(msg)
-        # Keep only last 5 messages
-        if len(self.status_messages) > 5:
-            self.status_messages.pop(0)
+        if len(self.status_messages) > SESSION_MESSAGE_LIMIT:
+            del self.status_messages[0]
+    
+    def recent_messages(self, count: int = 3) -> List[str]:
+        """Get the newest `count` status messages, oldest first."""
+        return self.status_messages[-count:]
     
     def reset_timer(self):
         """Reset the action timer."""
@@ -657,82 +839,115 @@ class FishingSession:
 # FISH SELECTION AND GENERATION
 # =============================================================================
 
-def get_eligible_fish(
-    location: str,
-    water_type: str,
-    season: str,
-    weather_type: str,
-    bait_id: str,
-    rod_id: Optional[str] = None,
-    line_integrity: float = 1.0
-) -> List[tuple]:
+# Base spawn weight per rarity, before season/weather/bait modifiers
+RARITY_WEIGHTS: Dict[str, int] = {
+    "common": 100,
+    "uncommon": 50,
+    "rare": 20,
+    "epic": 5,
+    "legendary": 1
+}
+
+# (location, water_type, rod_id) -> fish that can ever spawn there, with lowercased conditions
+_FISH_BUCKETS: Dict[tuple, tuple] = {}
+
+# (location, water_type, rod_id, season, weather, bait, rarity tier) -> (eligible, cumulative weights)
+_WEIGHT_TABLES: Dict[tuple, tuple] = {}
+_WEIGHT_TABLES_MAX = 4096
+
+
+def clear_fish_tables() -> None:
+    """Drop the cached fish buckets and weight tables (call if FISH_DATABASE changes at runtime)."""
+    _FISH_BUCKETS.clear()
+    _WEIGHT_TABLES.clear()
+
+
+def _get_fish_bucket(location: str, water_type: str, rod_id: Optional[str]) -> tuple:
     """
-    Get list of eligible fish with their spawn weights.
+    Get the fish that can spawn at a location with a given rod, ignoring conditions.
     
-    Returns list of (fish_id, fish_data, weight) tuples.
-    Weight is based on rarity, season, weather, bait match, rod requirements, and line integrity.
-    
-    Parameters
-    ----------
-    rod_id : Optional[str]
-        The ID of the equipped rod. Used to filter fish with required_rod restrictions.
-    line_integrity : float
-        Line integrity from 0.2 to 1.0. Lower values filter out rarer fish.
+    Each entry is (fish_id, fish_data, rarity, best_season, worst_season, best_weather, preferred_bait)
+    with the condition strings already lowercased.
     """
-    eligible = []
-    
-    # Get allowed rarities based on line integrity
-    allowed_rarities = get_allowed_rarities(line_integrity)
+    key = (location, water_type, rod_id)
+    bucket = _FISH_BUCKETS.get(key)
+    if bucket is not None:
+        return bucket
     
+    entries = []
     for fish_id, fish_data in FISH_DATABASE.items():
-        # Check water type match
-        fish_water_type = fish_data.get("water_type")
-        if fish_water_type not in [water_type, "both"]:
+        if fish_data.get("water_type") not in (water_type, "both"):
             continue
-        
-        # Check location match
         if location not in fish_data.get("locations", []):
             continue
-        
-        # Check rod requirement
         required_rod = fish_data.get("required_rod")
         if required_rod is not None and rod_id != required_rod:
             continue
         
+        best_season = fish_data.get("best_season")
+        worst_season = fish_data.get("worst_season")
+        best_weather = fish_data.get("best_weather")
+        entries.append((
+            fish_id,
+            fish_data,
+            fish_data.get("rarity", "common"),
+            best_season.lower() if best_season else None,
+            worst_season.lower() if worst_season else None,
+            best_weather.lower() if best_weather else None,
+            frozenset(fish_data.get("preferred_bait", [])),
+        ))
+    
+    bucket = tuple(entries)
+    _FISH_BUCKETS[key] = bucket
+    return bucket
+
+
+def _get_weight_table(
+    location: str,
+    water_type: str,
+    season: str,
+    weather_type: str,
+    bait_id: str,
+    rod_id: Optional[str],
+    line_integrity: float
+) -> tuple:
+    """
+    Get the cached (eligible, cumulative_weights) table for a set of fishing conditions.
+    
+    `eligible` is a tuple of (fish_id, fish_data, weight) and `cumulative_weights`
+    is the running sum of those weights, ready for bisect sampling.
+    """
+    allowed_rarities = get_allowed_rarities(line_integrity)
+    key = (location, water_type, rod_id, season, weather_type, bait_id, len(allowed_rarities))
+    table = _WEIGHT_TABLES.get(key)
+    if table is not None:
+        return table
+    
+    season_lower = season.lower()
+    weather_lower = weather_type.lower()
+    eligible = []
+    cumulative = []
+    total = 0.0
+    
+    for fish_id, fish_data, rarity, best_season, worst_season, best_weather, preferred_bait in _get_fish_bucket(location, water_type, rod_id):
         # Check rarity against line integrity allowance
-        rarity = fish_data.get("rarity", "common")
         if rarity not in allowed_rarities:
             continue
         
         # Base weight from rarity
-        rarity_weights = {
-            "common": 100,
-            "uncommon": 50,
-            "rare": 20,
-            "epic": 5,
-            "legendary": 1
-        }
-        weight = rarity_weights.get(rarity, 50)
+        weight = RARITY_WEIGHTS.get(rarity, 50)
         
         # Season modifier
-        best_season = fish_data.get("best_season")
-        worst_season = fish_data.get("worst_season")
-        season_lower = season.lower()
-        
-        if best_season and best_season.lower() == season_lower:
+        if best_season == season_lower:
             weight *= 2.0  # Double chance in best season
-        elif worst_season and worst_season.lower() == season_lower:
+        elif worst_season == season_lower:
             weight *= 0.15  # 15% chance in worst season
         
         # Weather modifier
-        best_weather = fish_data.get("best_weather")
-        if best_weather:
-            weather_lower = weather_type.lower()
-            if best_weather.lower() == weather_lower:
-                weight *= 1.5  # 50% boost in preferred weather
+        if best_weather == weather_lower:
+            weight *= 1.5  # 50% boost in preferred weather
         
         # Bait modifier
-        preferred_bait = fish_data.get("preferred_bait", [])
         if "any" in preferred_bait or bait_id in preferred_bait:
             weight *= 2.0  # Double chance with right bait
         else:
@@ -740,11 +955,18 @@ def get_eligible_fish(
         
         if weight > 0:
             eligible.append((fish_id, fish_data, weight))
+            total += weight
+            cumulative.append(total)
     
-    return eligible
+    # Bait ids and weather strings come from user data, keep the cache bounded
+    if len(_WEIGHT_TABLES) >= _WEIGHT_TABLES_MAX:
+        _WEIGHT_TABLES.clear()
+    table = (tuple(eligible), tuple(cumulative))
+    _WEIGHT_TABLES[key] = table
+    return table
 
 
-def select_fish(
+def get_eligible_fish(
     location: str,
     water_type: str,
     season: str,
@@ -752,6 +974,34 @@ def select_fish(
     bait_id: str,
     rod_id: Optional[str] = None,
     line_integrity: float = 1.0
+) -> List[tuple]:
+    """
+    Get list of eligible fish with their spawn weights.
+    
+    Returns list of (fish_id, fish_data, weight) tuples.
+    Weight is based on rarity, season, weather, bait match, rod requirements, and line integrity.
+    Results are served from a per-conditions cache, see `_get_weight_table`.
+    
+    Parameters
+    ----------
+    rod_id : Optional[str]
+        The ID of the equipped rod. Used to filter fish with required_rod restrictions.
+    line_integrity : float
+        Line integrity from 0.2 to 1.0. Lower values filter out rarer fish.
+    """
+    eligible, _ = _get_weight_table(location, water_type, season, weather_type, bait_id, rod_id, line_integrity)
+    return list(eligible)
+
+
+def select_fish(
+    location: str,
+    water_type: str,
+    season: str,
+    weather_type: str,
+    bait_id: str,
+    rod_id: Optional[str] = None,
+    line_integrity: float = 1.0,
+    rng: random.Random | None = None
 ) -> Optional[tuple]:
     """
     Select a random fish based on conditions.
@@ -762,24 +1012,20 @@ def select_fish(
     ----------
     line_integrity : float
         Line integrity from 0.2 to 1.0. Lower values filter out rarer fish.
+    rng : random.Random, optional
+        Source of randomness. Defaults to the global `random` module.
     """
-    eligible = get_eligible_fish(location, water_type, season, weather_type, bait_id, rod_id, line_integrity)
+    rng = rng or random
+    eligible, cumulative = _get_weight_table(location, water_type, season, weather_type, bait_id, rod_id, line_integrity)
     
     if not eligible:
         return None
     
-    # Weighted random selection
-    total_weight = sum(w for _, _, w in eligible)
-    roll = random.uniform(0, total_weight)
-    
-    cumulative = 0
-    for fish_id, fish_data, weight in eligible:
-        cumulative += weight
-        if roll <= cumulative:
-            return (fish_id, fish_data)
-    
-    # Fallback (shouldn't happen)
-    return eligible[0][:2] if eligible else None
+    # Weighted random selection: one draw, binary search over the cumulative weights
+    roll = rng.random() * cumulative[-1]
+    idx = min(bisect_right(cumulative, roll), len(eligible) - 1)
+    fish_id, fish_data, _ = eligible[idx]
+    return (fish_id, fish_data)
 
 
 def calculate_gear_luck_bonus(user_data) -> int:
@@ -819,7 +1065,7 @@ def calculate_gear_luck_bonus(user_data) -> int:
     return total_luck
 
 
-def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
+def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0, rng: random.Random | None = None) -> tuple:
     """
     Generate weight and length for a caught fish.
     
@@ -834,12 +1080,15 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
         Total luck bonus from equipped gear (0-9).
         - Increases trophy chance by 0.01% per luck point
         - Shifts weight distribution toward larger fish
+    rng : random.Random, optional
+        Source of randomness. Defaults to the global `random` module.
     
     Returns
     -------
     tuple
         (weight_oz, length_inches, is_max_size)
     """
+    rng = rng or random
     min_weight = fish_data.get("min_weight_oz", 1.0)
     max_weight = fish_data.get("max_weight_oz", 10.0)
     max_length = fish_data.get("max_length_inches", 10.0)
@@ -848,9 +1097,9 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
     # Max luck (9) = 0.25% + 0.09% = 0.34% trophy chance
     trophy_chance = 0.0025 + (luck_bonus * 0.0001)
     
-    if random.random() < trophy_chance:
+    if rng.random() < trophy_chance:
         # Randomly determine if max weight, max length, or both
-        roll = random.random()
+        roll = rng.random()
         if roll < 0.33:  # 33% chance for max weight only
             is_max_weight = True
             is_max_length = False
@@ -862,7 +1111,7 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
             is_max_length = True
         
         # Generate the actual values
-        weight = max_weight if is_max_weight else random.triangular(min_weight, max_weight, min_weight + (max_weight - min_weight) * 0.7)
+        weight = max_weight if is_max_weight else rng.triangular(min_weight, max_weight, min_weight + (max_weight - min_weight) * 0.7)
         
         if is_max_length:
             length = max_length
@@ -870,7 +1119,7 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
             weight_ratio = (weight - min_weight) / (max_weight - min_weight) if max_weight > min_weight else 0.5
             min_length = max_length * 0.4
             length = min_length + (max_length - min_length) * weight_ratio
-            length *= random.uniform(0.95, 1.05)
+            length *= rng.uniform(0.95, 1.05)
             length = min(length, max_length)
         
         return (round(weight, 1), round(length, 1), is_max_weight or is_max_length)
@@ -882,7 +1131,7 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
     base_mode_ratio = min(base_mode_ratio, 0.5)  # Cap at 50%
     
     mode = min_weight + (max_weight - min_weight) * base_mode_ratio
-    weight = random.triangular(min_weight, max_weight, mode)
+    weight = rng.triangular(min_weight, max_weight, mode)
     
     # Length correlates with weight (roughly)
     weight_ratio = (weight - min_weight) / (max_weight - min_weight) if max_weight > min_weight else 0.5
@@ -890,13 +1139,13 @@ def generate_fish_size(fish_data: Dict[str, Any], luck_bonus: int = 0) -> tuple:
     length = min_length + (max_length - min_length) * weight_ratio
     
     # Add some randomness to length
-    length *= random.uniform(0.95, 1.05)
+    length *= rng.uniform(0.95, 1.05)
     length = min(length, max_length)
     
     return (round(weight, 1), round(length, 1), False)
 
 
-def calculate_cast_distance(location: str = "pond") -> int:
+def calculate_cast_distance(location: str = "pond", rng: random.Random | None = None) -> int:
     """
     Calculate a random cast distance in feet (increments of 5).
     Base range: 20-100 feet.
@@ -906,18 +1155,21 @@ def calculate_cast_distance(location: str = "pond") -> int:
     ----------
     location : str
         The fishing location (pond, lake, river, ocean).
+    rng : random.Random, optional
+        Source of randomness. Defaults to the global `random` module.
     
     Returns
     -------
     int
         Cast distance in feet.
     """
+    rng = rng or random
     # Base distance from 20 to 100 feet in 5-foot increments
-    base_distance = random.choice([20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95, 100])
+    base_distance = rng.choice([20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95, 100])
     
     # Add extra distance for ocean and river locations
     if location.lower() in ["ocean", "river"]:
-        extra_distance = random.choice([20, 25, 30, 35, 40, 45])
+        extra_distance = rng.choice([20, 25, 30, 35, 40, 45])
         return base_distance + extra_distance
     
     return base_distance
@@ -1003,7 +1255,8 @@ def check_fish_interest(
     bait_id: str,
     luck_modifier: float = 1.0,
     rod_id: Optional[str] = None,
-    line_integrity: float = 1.0
+    line_integrity: float = 1.0,
+    rng: random.Random | None = None
 ) -> bool:
     """
     Check if a fish is interested based on conditions.
@@ -1015,11 +1268,14 @@ def check_fish_interest(
     ----------
     line_integrity : float
         Line integrity from 0.2 to 1.0. Lower values reduce bite chance.
+    rng : random.Random, optional
+        Source of randomness. Defaults to the global `random` module.
     """
+    rng = rng or random
     base_chance = 0.30
     
     # Get number of eligible fish - more fish = higher chance
-    eligible = get_eligible_fish(location, water_type, season, weather_type, bait_id, rod_id, line_integrity)
+    eligible, _ = _get_weight_table(location, water_type, season, weather_type, bait_id, rod_id, line_integrity)
     if not eligible:
         return False
     
@@ -1033,7 +1289,7 @@ def check_fish_interest(
     # Integrity of 1.0 = no penalty, 0.2 = 20% of normal bite rate
     final_chance = base_final * line_integrity
     
-    return random.random() < final_chance
+    return rng.random() < final_chance
 
 
 # =============================================================================
@@ -1044,7 +1300,9 @@ def create_fishing_session(
     location: str,
     water_type: str,
     luck_bonus: int = 0,
-    rod_id: Optional[str] = None
+    rod_id: Optional[str] = None,
+    seed: Optional[int] = None,
+    trace: bool = False
 ) -> FishingSession:
     """
     Create a new fishing session.
@@ -1060,6 +1318,10 @@ def create_fishing_session(
         Affects fish size distribution and trophy chance.
     rod_id : Optional[str]
         The ID of the equipped rod.
+    seed : Optional[int]
+        Seed for the session's random draws. A fresh one is picked if not given.
+    trace : bool
+        Record every draw so the session can be replayed (debug mode).
     
     Returns
     -------
@@ -1071,8 +1333,11 @@ def create_fishing_session(
         water_type=water_type,
         phase=FishingPhase.IDLE,
         luck_bonus=luck_bonus,
-        rod_id=rod_id
+        rod_id=rod_id,
+        trace=[] if trace else None
     )
+    if seed is not None:
+        session.reseed(seed)
     return session
 
 
@@ -1090,7 +1355,9 @@ def cast_line(session: FishingSession) -> str:
     str
         A message describing the cast.
     """
-    distance = calculate_cast_distance(session.location)
+    distance = calculate_cast_distance(session.location, session.rng)
+    if session.trace is not None:
+        session.record("cast", {"location": session.location}, distance)
     session.line_distance = distance
     session.max_distance = distance
     session.phase = FishingPhase.WAITING
@@ -1142,8 +1409,21 @@ def check_for_bite(
         bait_id,
         luck_modifier,
         session.rod_id,
-        line_integrity
+        line_integrity,
+        session.rng
     )
+    if session.trace is not None:
+        session.record("bite", {
+            "location": session.location,
+            "water_type": session.water_type,
+            "rod_id": session.rod_id,
+            "line_distance": session.line_distance,
+            "max_distance": session.max_distance,
+            "season": season,
+            "weather_type": weather_type,
+            "bait_id": bait_id,
+            "luck_modifier": luck_modifier,
+        }, interested)
     
     if interested:
         # Fish is following!
@@ -1214,8 +1494,20 @@ def fish_strikes(
     tuple
         (fish_id, fish_data, message) or (None, None, message) if fish swims away.
     """
+    if session.trace is not None:
+        inputs = {
+            "location": session.location,
+            "water_type": session.water_type,
+            "rod_id": session.rod_id,
+            "line_distance": session.line_distance,
+            "max_distance": session.max_distance,
+            "season": season,
+            "weather_type": weather_type,
+            "bait_id": bait_id,
+        }
+    
     # 50/50 chance the fish strikes or swims away
-    if random.random() < 0.5:
+    if session.rng.random() < 0.5:
         # Calculate line integrity for fish selection (affects rarity)
         line_integrity = calculate_line_integrity(session.line_distance, session.max_distance)
         
@@ -1227,13 +1519,15 @@ def fish_strikes(
             weather_type,
             bait_id,
             session.rod_id,
-            line_integrity
+            line_integrity,
+            session.rng
         )
         
         if result:
             fish_id, fish_data = result
+            if session.trace is not None:
+                session.record("strike", inputs, fish_id)
             session.fish_id = fish_id
-            session.fish_data = fish_data
             session.phase = FishingPhase.FISH_STRIKE
             session.reset_timer()
             session.timeout_seconds = 5.0  # 5 seconds to set hook
@@ -1243,6 +1537,8 @@ def fish_strikes(
             return (fish_id, fish_data, msg)
     
     # Fish swam away
+    if session.trace is not None:
+        session.record("strike", inputs, None)
     session.phase = FishingPhase.WAITING
     msg = "*The fish loses interest and swims away.*"
     session.add_message(msg)
@@ -1250,6 +1546,14 @@ def fish_strikes(
     return (None, None, msg)
 
 
+def _traced_fish_size(session: FishingSession) -> tuple:
+    """`generate_fish_size` for the hooked fish, drawn from (and traced on) the session."""
+    size = generate_fish_size(session.fish_data, session.luck_bonus, session.rng)
+    if session.trace is not None:
+        session.record("size", {"fish_id": session.fish_id, "luck_bonus": session.luck_bonus}, list(size))
+    return size
+
+
 def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
     """
     Attempt to set the hook when the fish strikes.
@@ -1270,7 +1574,6 @@ def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
         # Too slow! Fish spits out the hook
         session.phase = FishingPhase.WAITING
         session.fish_id = None
-        session.fish_data = None
         session.timeout_seconds = 3.0  # Reset to normal timeout
         msg = "*Too slow! The fish spits out the hook and swims away.*"
         session.add_message(msg)
@@ -1281,11 +1584,9 @@ def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
         spawn = user_data.pending_spawn
         
         # Override the fish type if specified in spawn
-        from ..databases.fish import FISH_DATABASE
         spawn_fish_id = spawn.get("fish_id")
         if spawn_fish_id and spawn_fish_id in FISH_DATABASE:
             session.fish_id = spawn_fish_id
-            session.fish_data = FISH_DATABASE[spawn_fish_id]
         
         fish_data = session.fish_data
         
@@ -1293,7 +1594,7 @@ def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
         if spawn["weight"] == "max":
             weight = fish_data.get("max_weight_oz", 10.0)
         elif spawn["weight"] == "random":
-            weight, _, _ = generate_fish_size(fish_data, session.luck_bonus)
+            weight, _, _ = _traced_fish_size(session)
         else:
             weight = float(spawn["weight"])
         
@@ -1301,7 +1602,7 @@ def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
         if spawn["length"] == "max":
             length = fish_data.get("max_length_inches", 10.0)
         elif spawn["length"] == "random":
-            _, length, _ = generate_fish_size(fish_data, session.luck_bonus)
+            _, length, _ = _traced_fish_size(session)
         else:
             length = float(spawn["length"])
         
@@ -1312,7 +1613,7 @@ def attempt_set_hook(session: FishingSession, user_data=None) -> tuple:
         user_data.pending_spawn = None
     else:
         # Normal fish generation
-        weight, length, is_max = generate_fish_size(session.fish_data, session.luck_bonus)
+        weight, length, is_max = _traced_fish_size(session)
     
     session.fish_weight_oz = weight
     session.fish_length_inches = length
@@ -1343,6 +1644,12 @@ def get_fight_event(session: FishingSession) -> tuple:
         should_reel: True if player should reel, False if they should wait.
     """
     fish_name = session.fish_data.get("name", "fish") if session.fish_data else "fish"
+    if session.trace is not None:
+        inputs = {
+            "fish_id": session.fish_id,
+            "line_distance": session.line_distance,
+            "last_event_was_tension": session.last_event_was_tension,
+        }
     
     # Random fight events
     events = [
@@ -1359,8 +1666,10 @@ def get_fight_event(session: FishingSession) -> tuple:
     # If the last event was tension, force this one to be fighting
     if session.last_event_was_tension:
         # Guarantee a fighting event so player can make progress
-        event = random.choice([e for e in events if e[0] == FishingPhase.FIGHTING])
+        event = session.rng.choice([e for e in events if e[0] == FishingPhase.FIGHTING])
         phase, msg, should_reel = event
+        if session.trace is not None:
+            session.record("fight", inputs, msg)
         session.phase = phase
         session.last_event_was_tension = False
         session.add_message(msg)
@@ -1384,16 +1693,18 @@ def get_fight_event(session: FishingSession) -> tuple:
         tension_probability = 0.75 - (distance_ratio * 0.5)  # 0.75 at 0ft, 0.25 at 50ft
     
     # Weight toward fighting events (reel) vs tension events (wait)
-    if random.random() < tension_probability:
+    if session.rng.random() < tension_probability:
         # Tension event - fish fights harder as it gets closer
-        event = random.choice([e for e in events if e[0] == FishingPhase.TENSION_HIGH])
+        event = session.rng.choice([e for e in events if e[0] == FishingPhase.TENSION_HIGH])
         session.last_event_was_tension = True
     else:
         # Fighting event - safe to reel
-        event = random.choice([e for e in events if e[0] == FishingPhase.FIGHTING])
+        event = session.rng.choice([e for e in events if e[0] == FishingPhase.FIGHTING])
         session.last_event_was_tension = False
     
     phase, msg, should_reel = event
+    if session.trace is not None:
+        session.record("fight", inputs, msg)
     session.phase = phase
     session.add_message(msg)
     session.reset_timer()
@@ -1472,7 +1783,7 @@ def process_reel_attempt(session: FishingSession, did_reel: bool) -> tuple:
     return (True, "", False)
 
 
-def land_the_fish(session: FishingSession, user_data, debug_log: list = None, user_obj: discord.User = None) -> tuple:
+def land_the_fish(session: FishingSession, user_data, debug_log: CatchLog = None, user_obj: discord.User = None) -> tuple:
     """
     Land the fish and add it to inventory.
     
@@ -1482,8 +1793,8 @@ def land_the_fish(session: FishingSession, user_data, debug_log: list = None, us
         The current fishing session.
     user_data : User
         The user's data model.
-    debug_log : list, optional
-        In-memory debug log list for debug logging
+    debug_log : CatchLog, optional
+        In-memory debug catch log
     user_obj : discord.User, optional
         Discord user object for debug logging
     
@@ -1524,7 +1835,7 @@ def land_the_fish(session: FishingSession, user_data, debug_log: list = None, us
         "is_trophy": earned_token,  # True if either max weight or max length
         "fishpoints": session.fish_data.get("base_fishpoints", 10)
     }
-    user_data.current_fish_inventory.append(fish_entry)
+    user_data.add_fish(fish_entry)
     
     # Consume the lure (fish ate the bait!)
     equipped_lure = user_data.get_equipped_lure()
@@ -1543,13 +1854,10 @@ def land_the_fish(session: FishingSession, user_data, debug_log: list = None, us
         
         if remaining_uses <= 0:
             # Remove empty lure stack
-            idx = user_data.equipped_lure_index
-            if idx is not None and 0 <= idx < len(user_data.current_lure_inventory):
-                user_data.current_lure_inventory.pop(idx)
-                user_data.equipped_lure_index = None
+            user_data.remove_lure(user_data.equipped_lure_id)
     
     # Update stats
-    user_data.total_fish_ever_caught += 1
+    user_data.add_stat("total_fish_ever_caught", 1)
     # Note: fishpoints are awarded when selling fish, not when catching
     
     # Check for personal record
@@ -1590,6 +1898,7 @@ def land_the_fish(session: FishingSession, user_data, debug_log: list = None, us
     
     # Build debug info
     debug_info = {
+        "seed": session.seed,
         "weight_oz": weight_oz,
         "length_in": length_in,
         "max_weight_oz": max_weight_oz,
@@ -1606,7 +1915,8 @@ def land_the_fish(session: FishingSession, user_data, debug_log: list = None, us
         log_debug_catch(
             debug_log, user_obj, session.fish_id, session.fish_data,
             weight_oz, length_in, max_weight_oz, max_length_inches,
-            earned_token, earned_perfect_trophy, user_data.current_fishmaster_tokens
+            earned_token, earned_perfect_trophy, user_data.current_fishmaster_tokens,
+            seed=session.seed, trace=session.trace
         )
     
     return (msg, is_record, earned_token, debug_info)
@@ -1647,7 +1957,7 @@ def handle_line_snap(session: FishingSession, user_data) -> tuple:
         if equipped_rod["durability"] <= 0 and old_durability > 0:
             rod_broke = True
             # Auto-unequip the broken rod
-            user_data.equipped_rod_index = None
+            user_data.unequip_rod()
     
     # Lose the lure - line snap loses entire bait item (all its uses)
     equipped_lure = user_data.get_equipped_lure()
@@ -1662,13 +1972,10 @@ def handle_line_snap(session: FishingSession, user_data) -> tuple:
         
         if equipped_lure["quantity"] <= 0 or equipped_lure["remaining_uses"] <= 0:
             # Remove empty lure stack
-            idx = user_data.equipped_lure_index
-            if idx is not None and 0 <= idx < len(user_data.current_lure_inventory):
-                user_data.current_lure_inventory.pop(idx)
-                user_data.equipped_lure_index = None
+            user_data.remove_lure(user_data.equipped_lure_id)
     
     # Update stats
-    user_data.total_fishing_attempts += 1
+    user_data.add_stat("total_fishing_attempts", 1)
     
     session.phase = FishingPhase.ESCAPED
     
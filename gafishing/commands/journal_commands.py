@@ -0,0 +1,167 @@
+import logging
+from typing import List, Tuple
+
+import discord
+from redbot.core import commands
+
+from ..abc import MixinMeta
+from ..common import catch_history
+from ..common.catch_history import HISTORY_FLUSH_INTERVAL, HISTORY_IDLE_UNLOAD
+from ..databases.fish import FISH_DATABASE
+from ..databases.items import LURES_DATABASE
+from .admin_commands import is_admin
+from .helper_functions import FishingSession, is_channel_allowed
+
+log = logging.getLogger("red.greenacresfishing.history")
+
+
+def format_weight(weight_oz: float) -> str:
+    return f"{weight_oz / 16:,.1f} lbs" if weight_oz >= 16 else f"{weight_oz:.1f} oz"
+
+
+def fish_name(fish_id: str) -> str:
+    return FISH_DATABASE.get(fish_id, {}).get("name", fish_id or "Unknown")
+
+
+def location_name(location: str) -> str:
+    from ..views.fishing_view import FISHING_LOCATIONS
+
+    return FISHING_LOCATIONS.get(location, {}).get("name", location or "Unknown")
+
+
+def bait_name(bait_id: str) -> str:
+    if not bait_id:
+        return "No bait"
+    return LURES_DATABASE.get(bait_id, {}).get("name", bait_id)
+
+
+def format_counts(counts: List[Tuple[str, int]], name=str) -> str:
+    return "\n".join(f"{name(value)}: **{count:,}**" for value, count in counts) or "*None*"
+
+
+def describe_catch(catch: dict) -> str:
+    return (
+        f"{fish_name(catch['fish_id'])} - {format_weight(catch['weight_oz'])}, "
+        f"{catch['length_in']:.1f} in at the {location_name(catch['location'])} <t:{catch['timestamp']}:R>"
+    )
+
+
+class Journal(MixinMeta):
+    """Catch history journal and analytics."""
+
+    def record_catch_history(self, guild: discord.Guild, user_id: int, session: FishingSession, weather: str, bait_id: str) -> None:
+        """Collect a landed fish for the guild's history, if the guild keeps one."""
+        conf = self.db.get_conf(guild)
+        if not conf.catch_history_enabled:
+            return
+        first = self.history.record(
+            guild.id, user_id, session.fish_id, session.fish_weight_oz, session.fish_length_inches,
+            session.location, weather, bait_id
+        )
+        if first:
+            self.scheduler.schedule(("history", guild.id), HISTORY_FLUSH_INTERVAL, self._flush_history, guild.id)
+
+    async def _flush_history(self, guild_id: int) -> None:
+        """Append the guild's collected catches to its history file."""
+        conf = self.db.get_conf(guild_id)
+        try:
+            await self.history.flush(guild_id, conf.catch_history_max, conf.catch_history_days)
+        except Exception as e:
+            log.exception(f"Failed to write catch history for {guild_id}", exc_info=e)
+            # The catches were kept, try again later
+            self.scheduler.schedule(("history", guild_id), HISTORY_FLUSH_INTERVAL, self._flush_history, guild_id)
+
+    async def _history_columns(self, guild_id: int) -> catch_history.HistoryColumns:
+        """The guild's rows for a query, unloaded again after `HISTORY_IDLE_UNLOAD` seconds without another."""
+        columns = await self.history.columns(guild_id)
+        self.scheduler.schedule(("history_unload", guild_id), HISTORY_IDLE_UNLOAD, self.history.unload, guild_id)
+        return columns
+
+    @commands.group(name="journal", invoke_without_command=True)
+    @commands.guild_only()
+    async def journal(self, ctx: commands.Context, member: discord.Member = None):
+        """Look back over your catches (or another angler's).
+
+        Only available when the server keeps a catch history.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
+            return  # Silently ignore commands in non-allowed channels
+        if not conf.catch_history_enabled:
+            await ctx.send("❌ This server doesn't keep a catch history.")
+            return
+        member = member or ctx.author
+
+        columns = await self._history_columns(ctx.guild.id)
+        summary = catch_history.journal(columns, self.history.codes, member.id)
+        if not summary["catches"]:
+            await ctx.send(f"📖 No catches recorded for **{member.display_name}** yet.")
+            return
+
+        embed = discord.Embed(
+            title=f"📖 {member.display_name}'s Fishing Journal",
+            description=(
+                f"🐟 **{summary['catches']:,}** catches since <t:{summary['first']}:D> "
+                f"(**{summary['this_week']:,}** this week)\n"
+                f"🐠 **{summary['species_count']}** species | "
+                f"⚖️ **{format_weight(summary['total_weight_oz'])}** landed in total"
+            ),
+            color=discord.Color.green()
+        )
+        embed.add_field(name="🏆 Heaviest", value=describe_catch(summary["heaviest"]), inline=False)
+        embed.add_field(name="📏 Longest", value=describe_catch(summary["longest"]), inline=False)
+        embed.add_field(name="Most Caught", value=format_counts(summary["species"], fish_name), inline=True)
+        embed.add_field(name="Favorite Spots", value=format_counts(summary["locations"], location_name), inline=True)
+        embed.add_field(name="Best Bait", value=format_counts(summary["baits"], bait_name), inline=True)
+        embed.add_field(
+            name="Recent Catches",
+            value="\n".join(describe_catch(catch) for catch in summary["recent"]),
+            inline=False
+        )
+        if conf.catch_history_days:
+            embed.set_footer(text=f"Catches older than {conf.catch_history_days} days are not kept")
+        await ctx.send(embed=embed)
+
+    @journal.command(name="server")
+    @commands.check(is_admin)
+    async def journal_server(self, ctx: commands.Context, days: int = 7):
+        """Catch analytics for the whole server over the last few days.
+
+        Examples:
+        - `journal server` - The last week
+        - `journal server 30` - The last 30 days
+        """
+        conf = self.db.get_conf(ctx.guild)
+        if not conf.catch_history_enabled:
+            await ctx.send("❌ Catch history is off. Turn it on with `fishset history toggle`.")
+            return
+        days = max(1, days)
+
+        columns = await self._history_columns(ctx.guild.id)
+        stats = catch_history.analytics(columns, self.history.codes, days)
+        if not stats["catches"]:
+            await ctx.send(f"📊 No catches recorded in the last {days} day(s).")
+            return
+
+        embed = discord.Embed(
+            title=f"📊 Catches - Last {days} Day{'s' if days != 1 else ''}",
+            description=(
+                f"🐟 **{stats['catches']:,}** catches by **{stats['anglers']:,}** anglers\n"
+                f"⚖️ **{format_weight(stats['total_weight_oz'])}** landed in total"
+            ),
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Top Species", value=format_counts(stats["species"], fish_name), inline=True)
+        embed.add_field(name="Locations", value=format_counts(stats["locations"], location_name), inline=True)
+        embed.add_field(name="Weather", value=format_counts(stats["weather"]), inline=True)
+        embed.add_field(name="Baits", value=format_counts(stats["baits"], bait_name), inline=True)
+        embed.add_field(
+            name="Per Day",
+            value="\n".join(
+                f"{'Today' if day == 0 else f'{day} day(s) ago'}: **{count:,}**"
+                for day, count in enumerate(stats["per_day"])
+            ),
+            inline=True
+        )
+        embed.set_footer(text=f"{len(columns):,} catches stored | {self.history.size(ctx.guild.id) / 1024:,.0f} KiB on disk")
+        await ctx.send(embed=embed)
@@ -3,7 +3,8 @@ from redbot.core import commands
 from datetime import datetime
 
 from ..abc import MixinMeta
-from .helper_functions import welcome_to_fishing, is_channel_allowed
+from .helper_functions import welcome_to_fishing, is_channel_allowed, get_game_time_display
+from ..common.weather import get_forecast_for_guild, get_forecast_display, get_weather_fishing_message
 from ..views import MainMenuView, WelcomeView, create_main_menu_embed, FishInfoView
 from ..databases.items import RODS_DATABASE, LURES_DATABASE, HATS_DATABASE, COATS_DATABASE, BOOTS_DATABASE
 
@@ -30,7 +31,7 @@ class User(MixinMeta):
             return
         
         # Check if channel is allowed (admins bypass this check)
-        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot):
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
             return  # Silently ignore commands in non-allowed channels
         
         user_data = conf.get_user(ctx.author)
@@ -54,6 +55,43 @@ class User(MixinMeta):
             message = await ctx.send(embed=embed, view=view)
             view.message = message
 
+    @commands.command(name="fishforecast")
+    @commands.guild_only()
+    async def fish_forecast(self, ctx: commands.Context, hours: int = 6):
+        """
+        Check the weather forecast for the next few game hours.
+        
+        Shows up to 12 game hours, starting with the current one.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        
+        if not conf.is_game_enabled:
+            await ctx.send("Greenacres Fishing is currently disabled. Please try again later.")
+            return
+        
+        # Check if channel is allowed (admins bypass this check)
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
+            return  # Silently ignore commands in non-allowed channels
+        
+        hours = max(1, min(hours, 12))
+        forecast = get_forecast_for_guild(self.db, ctx.guild, hours)
+        
+        embed = discord.Embed(
+            title="🌦️ Fishing Forecast",
+            description=(
+                f"**Now:** {get_game_time_display(self.db, ctx.guild)}\n"
+                f"{get_weather_fishing_message(forecast[0]['weather'])}"
+            ),
+            color=discord.Color.blue()
+        )
+        embed.add_field(
+            name=f"Next {len(forecast)} game hours",
+            value=get_forecast_display(forecast),
+            inline=False
+        )
+        embed.set_footer(text="Weather changes every game hour.")
+        await ctx.send(embed=embed)
+
     @commands.command(name="fishinfo")
     @commands.guild_only()
     async def fish_info(self, ctx: commands.Context, target: discord.Member = None):
@@ -74,7 +112,7 @@ class User(MixinMeta):
         conf = self.db.get_conf(ctx.guild)
         
         # Check if channel is allowed (admins bypass this check)
-        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot):
+        if not await is_channel_allowed(self.db, ctx.guild, ctx.channel.id, ctx.author, self.bot, self.permissions):
             return  # Silently ignore commands in non-allowed channels
         
         # Check if target has any data
@@ -123,17 +161,8 @@ class User(MixinMeta):
             return "None"
         
         def get_clothing_name(user_data, slot: str, database: dict) -> str:
-            if slot == "hat":
-                idx = user_data.equipped_hat_index
-            elif slot == "coat":
-                idx = user_data.equipped_coat_index
-            elif slot == "boots":
-                idx = user_data.equipped_boots_index
-            else:
-                return "None"
-            
-            if idx is not None and idx < len(user_data.current_clothing_inventory):
-                item = user_data.current_clothing_inventory[idx]
+            item = user_data.get_equipped_clothing(slot)
+            if item:
                 item_id = item.get("clothing_id")
                 return database.get(item_id, {}).get("name", item_id)
             return "None"
@@ -155,25 +155,29 @@ class Base(BaseModel):
         return cls.parse_file(path)
 
     def to_file(self, path: Path) -> None:
-        dump = self.model_dump_json()
-        # We want to write the file as safely as possible
-        # https://github.com/Cog-Creators/Red-DiscordBot/blob/V3/develop/redbot/core/_drivers/json.py#L224
-        tmp_path = path.parent / f"{path.stem}-{uuid4().fields[0]}.tmp"
-        with tmp_path.open(encoding="utf-8", mode="w") as fs:
-            fs.write(dump)
-            fs.flush()  # This does get closed on context exit, ...
-            os.fsync(fs.fileno())  # but that needs to happen prior to this line
+        write_file(path, self.model_dump_json())
 
-        # Replace the original file with the new content
-        try:
-            tmp_path.replace(path)
-        except FileNotFoundError as e:
-            log.error(f"Failed to rename {tmp_path} to {path}", exc_info=e)
 
-        # Ensure directory fsync for better durability
-        if hasattr(os, "O_DIRECTORY"):
-            fd = os.open(path.parent, os.O_DIRECTORY)
-            try:
-                os.fsync(fd)
-            finally:
-                os.close(fd)
+def write_file(path: Path, dump: str | bytes) -> None:
+    """Replace the file at `path` with `dump` (text or binary) as safely as possible."""
+    # https://github.com/Cog-Creators/Red-DiscordBot/blob/V3/develop/redbot/core/_drivers/json.py#L224
+    tmp_path = path.parent / f"{path.stem}-{uuid4().fields[0]}.tmp"
+    opened = tmp_path.open(mode="wb") if isinstance(dump, bytes) else tmp_path.open(encoding="utf-8", mode="w")
+    with opened as fs:
+        fs.write(dump)
+        fs.flush()  # This does get closed on context exit, ...
+        os.fsync(fs.fileno())  # but that needs to happen prior to this line
+
+    # Replace the original file with the new content
+    try:
+        tmp_path.replace(path)
+    except FileNotFoundError as e:
+        log.error(f"Failed to rename {tmp_path} to {path}", exc_info=e)
+
+    # Ensure directory fsync for better durability
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,128 @@
+"""
+Memory benchmarks for fishing sessions.
+
+Measures what each active fishing session costs, so changes to
+`FishingSession` or `SessionScheduler` can be checked against real numbers
+instead of figures quoted in commit messages:
+
+- `session_memory`: bytes per `FishingSession`, idle (fresh after `reset`) and
+  mid-fight (hooked fish, full status log, generator drawn from).
+- `timer_memory`: bytes per session to keep one pending deadline, as a
+  sleeping asyncio task per session versus one `SessionScheduler` entry.
+
+Run from the directory holding the cog, with its requirements installed:
+
+    python -m gafishing.common.benchmark
+"""
+
+import asyncio
+import gc
+import tracemalloc
+from typing import Callable, Dict, List, Sequence
+
+from ..commands.helper_functions import SESSION_MESSAGE_LIMIT, FishingPhase, FishingSession
+from .scheduler import SessionScheduler
+
+DEFAULT_COUNTS = (100, 1000, 5000)
+# Longer than the benchmark runs, so no deadline ever fires
+TIMER_DELAY = 600.0
+
+
+def _measure(build: Callable[[int], list], count: int) -> float:
+    """Average traced bytes per item kept alive by `build(count)`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = build(count)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def _idle_sessions(count: int) -> List[FishingSession]:
+    sessions = []
+    for _ in range(count):
+        session = FishingSession()
+        session.reset("pond", "freshwater", luck_bonus=3, rod_id="rod_basic")
+        sessions.append(session)
+    return sessions
+
+
+def _fighting_sessions(count: int) -> List[FishingSession]:
+    sessions = _idle_sessions(count)
+    for session in sessions:
+        session.phase = FishingPhase.FIGHTING
+        session.fish_id = "bass_largemouth"
+        session.fish_weight_oz = session.rng.uniform(16, 160)
+        session.fish_length_inches = session.rng.uniform(10, 24)
+        for i in range(SESSION_MESSAGE_LIMIT + 1):
+            session.add_message(f"The fish pulls left! ({i})")
+    return sessions
+
+
+def session_memory(counts: Sequence[int] = DEFAULT_COUNTS) -> List[Dict[str, float]]:
+    """Bytes per FishingSession at each session count."""
+    return [
+        {
+            "sessions": count,
+            "idle": _measure(_idle_sessions, count),
+            "fighting": _measure(_fighting_sessions, count),
+        }
+        for count in counts
+    ]
+
+
+async def _noop():
+    pass
+
+
+async def _timers(count: int) -> Dict[str, float]:
+    async def sleeper():
+        await asyncio.sleep(TIMER_DELAY)
+
+    def tasks(n: int) -> list:
+        return [asyncio.create_task(sleeper()) for _ in range(n)]
+
+    def wheel(n: int) -> list:
+        scheduler = SessionScheduler()
+        for key in range(n):
+            scheduler.schedule(key, TIMER_DELAY, _noop)
+        return [scheduler]
+
+    result = {"sessions": count}
+    for name, build in (("tasks", tasks), ("scheduler", wheel)):
+        result[name] = _measure(build, count)
+        # Let the cancelled tasks unwind before the next measurement
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+        await asyncio.sleep(0)
+    return result
+
+
+def timer_memory(counts: Sequence[int] = DEFAULT_COUNTS) -> List[Dict[str, float]]:
+    """Bytes per session to keep one pending deadline at each session count."""
+    return [asyncio.run(_timers(count)) for count in counts]
+
+
+def format_table(rows: List[Dict[str, float]]) -> str:
+    """Render benchmark rows as a plain text table, one column per measurement."""
+    columns = [key for key in rows[0] if key != "sessions"]
+    lines = [f"{'sessions':>9}" + "".join(f"{column:>12}" for column in columns)]
+    for row in rows:
+        lines.append(f"{row['sessions']:>9}" + "".join(f"{row[column]:>10.0f} B" for column in columns))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    print("FishingSession (bytes per session)")
+    print(format_table(session_memory()))
+    print()
+    print("One pending deadline (bytes per session)")
+    print(format_table(timer_memory()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Guild-wide stat boards and running totals for one guild.
+
+The leaderboard overview used to sum every user's catches and sales on each
+open, and each stat board rebuilt and sorted the whole user list. The index
+keeps a running total per stat, the angler count, and one sorted board per
+stat. Tracked fields are only changed through `User.set_stat`, `add_stat` and
+`add_fishpoints` (catches, sales, casts, purchases, fpset), which report each
+change to the index.
+"""
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .models import User
+
+# User fields that have a leaderboard
+BOARD_FIELDS = (
+    "total_fish_ever_caught",
+    "total_fish_sold",
+    "total_fishing_attempts",
+    "total_fishpoints",
+    "most_fishpoints_ever",
+)
+# Everything the index needs to hear about
+TRACKED_FIELDS = frozenset(BOARD_FIELDS + ("first_join",))
+
+
+class BoardIndex:
+    """Running totals and sorted stat boards, highest first."""
+
+    def __init__(self):
+        # field -> [(-value, user_id)] kept sorted ascending, only users with value > 0
+        self._boards: Dict[str, List[Tuple[int, int]]] = {field: [] for field in BOARD_FIELDS}
+        # field -> sum over all users
+        self._totals: Dict[str, int] = {field: 0 for field in BOARD_FIELDS}
+        self.anglers = 0
+
+    @classmethod
+    def build(cls, users: Dict[int, "User"]) -> "BoardIndex":
+        """Index every user's stats (one full scan) and hook the users up for updates."""
+        index = cls()
+        for uid, user in users.items():
+            index.bind(uid, user)
+            if user.first_join:
+                index.anglers += 1
+            for field in BOARD_FIELDS:
+                value = getattr(user, field)
+                index._totals[field] += value
+                if value > 0:
+                    index._boards[field].append((-value, uid))
+        for board in index._boards.values():
+            board.sort()
+        return index
+
+    def bind(self, uid: int, user: "User") -> None:
+        """Route this user's stat changes into the index."""
+        user._stats_hook = lambda field, old, new: self.update(uid, field, old, new)
+
+    def update(self, uid: int, field: str, old, new) -> None:
+        if field == "first_join":
+            self.anglers += bool(new) - bool(old)
+            return
+        self._totals[field] += new - old
+        board = self._boards[field]
+        if old > 0:
+            pos = bisect_left(board, (-old, uid))
+            if pos < len(board) and board[pos] == (-old, uid):
+                del board[pos]
+        if new > 0:
+            insort(board, (-new, uid))
+
+    def total(self, field: str) -> int:
+        return self._totals[field]
+
+    def count(self, field: str) -> int:
+        return len(self._boards[field])
+
+    def page(self, field: str, start: int, size: int) -> List[Tuple[int, int]]:
+        """(user_id, value) pairs for ranks start+1 .. start+size."""
+        return [(uid, -neg) for neg, uid in self._boards[field][start:start + size]]
@@ -0,0 +1,449 @@
+"""
+Optional per-guild catch history.
+
+Only personal records and running totals are kept in db.json, so there was no
+way to answer "what have I caught this week" or "which bait works at the lake".
+When a guild turns history on, every landed fish is recorded as one row of
+(timestamp, user, species, weight, length, location, weather, bait) in a file
+of its own under the cog's data folder, never in db.json, so saving the config
+costs the same with or without it.
+
+Rows are stored by column: each block in a guild's file is a small header
+followed by one packed `array` per column, and strings (species, location,
+weather, bait) are stored as small integer codes from a shared code table.
+Catches collect in memory and are appended as one block every
+`HISTORY_FLUSH_INTERVAL` seconds. Once the file holds well over the guild's
+row limit, or at least once a day, it is rewritten without the rows that fell
+out of retention.
+
+A guild's rows are only read into memory for journal and analytics queries,
+which then run as counts over the code columns, and are dropped again after
+`HISTORY_IDLE_UNLOAD` seconds without a query.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import write_file
+
+log = logging.getLogger("red.greenacresfishing.history")
+
+# (name, array typecode) in the order columns are stored in a block
+COLUMNS = (
+    ("timestamp", "I"),
+    ("user_id", "Q"),
+    ("fish", "H"),
+    ("weight", "f"),
+    ("length", "f"),
+    ("location", "B"),
+    ("weather", "B"),
+    ("bait", "H"),
+)
+ROW_SIZE = sum(array(typecode).itemsize for _, typecode in COLUMNS)
+# Columns holding codes from the code table
+CODED_COLUMNS = ("fish", "location", "weather", "bait")
+
+# Block header: magic, row count
+BLOCK_MAGIC = b"GFH1"
+BLOCK_HEADER = struct.Struct("<4sI")
+# Files are little-endian whatever the host
+BIG_ENDIAN = sys.byteorder == "big"
+
+# Seconds between appending collected catches to the guild's file
+HISTORY_FLUSH_INTERVAL = 60.0
+# Rewrite the file once it holds this much more than the row limit...
+COMPACT_SLACK = 1.25
+# ...or when it hasn't been trimmed for this long
+COMPACT_EVERY = 24 * 60 * 60
+# Seconds a guild's rows stay loaded after the last query
+HISTORY_IDLE_UNLOAD = 30 * 60
+
+DEFAULT_HISTORY_DAYS = 90
+DEFAULT_HISTORY_MAX_CATCHES = 250_000
+MIN_HISTORY_CATCHES = 1_000
+MAX_HISTORY_CATCHES = 5_000_000
+
+
+class HistoryColumns:
+    """Catch rows stored column by column."""
+
+    __slots__ = tuple(name for name, _ in COLUMNS) + ("_by_user",)
+
+    def __init__(self):
+        for name, typecode in COLUMNS:
+            setattr(self, name, array(typecode))
+        # user_id -> positions of their rows, built on first use
+        self._by_user: Optional[Dict[int, array]] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, row: tuple) -> None:
+        """Add one row, given in `COLUMNS` order."""
+        if self._by_user is not None:
+            self._by_user.setdefault(row[1], array("I")).append(len(self.timestamp))
+        for (name, _), value in zip(COLUMNS, row):
+            getattr(self, name).append(value)
+
+    def extend(self, other: "HistoryColumns") -> None:
+        for name, _ in COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+        self._by_user = None
+
+    def rows_for(self, user_id: int) -> array:
+        """Positions of one user's rows, oldest first."""
+        if self._by_user is None:
+            by_user: Dict[int, array] = {}
+            for pos, uid in enumerate(self.user_id):
+                rows = by_user.get(uid)
+                if rows is None:
+                    rows = by_user[uid] = array("I")
+                rows.append(pos)
+            self._by_user = by_user
+        return self._by_user.get(user_id, array("I"))
+
+    def since(self, timestamp: float) -> int:
+        """Position of the first row at or after `timestamp` (rows are appended in time order)."""
+        return bisect_left(self.timestamp, int(timestamp))
+
+    def trimmed(self, max_rows: int, cutoff: float) -> Optional["HistoryColumns"]:
+        """A copy without the rows outside retention, or None if every row is kept."""
+        start = max(len(self) - max_rows, self.since(cutoff) if cutoff else 0, 0)
+        if start == 0:
+            return None
+        kept = HistoryColumns()
+        for name, _ in COLUMNS:
+            setattr(kept, name, getattr(self, name)[start:])
+        return kept
+
+    def to_block(self) -> bytes:
+        parts = [BLOCK_HEADER.pack(BLOCK_MAGIC, len(self))]
+        for name, _ in COLUMNS:
+            column = getattr(self, name)
+            if BIG_ENDIAN:
+                column = array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Tuple["HistoryColumns", int]:
+        """Read every complete block. Returns the rows and how many bytes were valid."""
+        columns = cls()
+        view = memoryview(data)
+        offset = 0
+        while offset + BLOCK_HEADER.size <= len(data):
+            magic, count = BLOCK_HEADER.unpack_from(data, offset)
+            end = offset + BLOCK_HEADER.size + count * ROW_SIZE
+            if magic != BLOCK_MAGIC or end > len(data):
+                break
+            pos = offset + BLOCK_HEADER.size
+            for name, typecode in COLUMNS:
+                column = array(typecode)
+                size = count * column.itemsize
+                column.frombytes(view[pos:pos + size])
+                if BIG_ENDIAN:
+                    column.byteswap()
+                getattr(columns, name).extend(column)
+                pos += size
+            offset = end
+        return columns, offset
+
+
+class HistoryCodes:
+    """Shared string <-> code tables for the coded columns. Codes are only ever added."""
+
+    def __init__(self):
+        self.values: Dict[str, List[str]] = {name: [""] for name in CODED_COLUMNS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {"": 0} for name in CODED_COLUMNS}
+        self.dirty = False
+
+    def code(self, column: str, value: Optional[str]) -> int:
+        value = value or ""
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.values[column])
+            self.values[column].append(value)
+            self.dirty = True
+        return code
+
+    def value(self, column: str, code: int) -> str:
+        values = self.values[column]
+        return values[code] if code < len(values) else ""
+
+    def dump(self) -> str:
+        self.dirty = False
+        return json.dumps(self.values, separators=(",", ":"))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "HistoryCodes":
+        codes = cls()
+        if path.is_file():
+            data = json.loads(path.read_bytes())
+            for name in CODED_COLUMNS:
+                for value in data.get(name, [""])[1:]:
+                    codes.code(name, value)
+            codes.dirty = False
+        return codes
+
+
+class GuildHistory:
+    """One guild's history file and the catches not yet written to it."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.pending = HistoryColumns()
+        # Every row on disk plus pending, while loaded for queries
+        self.columns: Optional[HistoryColumns] = None
+        self.disk_rows = 0
+        self.compacted_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def due_for_compaction(self, max_rows: int) -> bool:
+        return self.disk_rows > max_rows * COMPACT_SLACK or time.time() - self.compacted_at > COMPACT_EVERY
+
+
+def _append_block(path: Path, block: bytes) -> None:
+    """Append a block, cutting the file back to its old size if the write fails partway."""
+    with path.open("ab") as fs:
+        size = fs.tell()
+        try:
+            fs.write(block)
+            fs.flush()
+            os.fsync(fs.fileno())
+        except Exception:
+            try:
+                fs.truncate(size)
+            except OSError as e:
+                log.error(f"Failed to cut {path.name} back after a failed write", exc_info=e)
+            raise
+
+
+def _read_file(path: Path) -> Tuple[HistoryColumns, int, int]:
+    """Rows on disk, plus the valid and total byte counts."""
+    if not path.is_file():
+        return HistoryColumns(), 0, 0
+    data = path.read_bytes()
+    columns, valid = HistoryColumns.from_bytes(data)
+    return columns, valid, len(data)
+
+
+class CatchHistory:
+    """Catch history for every guild that has it turned on."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.codes = HistoryCodes()
+        self.guilds: Dict[int, GuildHistory] = {}
+
+    def load_codes(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.codes = HistoryCodes.from_file(self.root / "codes.json")
+
+    def _guild(self, guild_id: int) -> GuildHistory:
+        history = self.guilds.get(guild_id)
+        if history is None:
+            history = self.guilds[guild_id] = GuildHistory(self.root / f"{guild_id}.bin")
+        return history
+
+    def record(
+        self,
+        guild_id: int,
+        user_id: int,
+        fish_id: str,
+        weight_oz: float,
+        length_in: float,
+        location: str,
+        weather: str,
+        bait_id: Optional[str],
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """Collect one catch. Returns True if it is the first one waiting to be written."""
+        codes = self.codes
+        row = (
+            int(timestamp or time.time()),
+            user_id,
+            codes.code("fish", fish_id),
+            weight_oz,
+            length_in,
+            codes.code("location", location),
+            codes.code("weather", weather),
+            codes.code("bait", bait_id),
+        )
+        history = self._guild(guild_id)
+        history.pending.append(row)
+        if history.columns is not None:
+            history.columns.append(row)
+        return len(history.pending) == 1
+
+    async def flush(self, guild_id: int, max_rows: int, days: int) -> None:
+        """Write the guild's collected catches, rewriting the file instead if it's due for trimming."""
+        history = self.guilds.get(guild_id)
+        if history is None:
+            return
+        async with history.lock:
+            if self.codes.dirty:
+                await asyncio.to_thread(write_file, self.root / "codes.json", self.codes.dump())
+            if history.due_for_compaction(max_rows):
+                await self._compact(history, max_rows, days)
+            elif history.pending:
+                taken, history.pending = history.pending, HistoryColumns()
+                try:
+                    await asyncio.to_thread(_append_block, history.path, taken.to_block())
+                except Exception:
+                    taken.extend(history.pending)
+                    history.pending = taken
+                    # Part of the block may have reached the file, rewrite it instead of appending after that
+                    history.compacted_at = 0.0
+                    raise
+                history.disk_rows += len(taken)
+
+    async def _load(self, history: GuildHistory) -> HistoryColumns:
+        """Read the guild's rows (call with the lock held)."""
+        if history.columns is None:
+            columns, valid, size = await asyncio.to_thread(_read_file, history.path)
+            if valid < size:
+                log.warning(f"Ignoring {size - valid} unreadable bytes at the end of {history.path.name}")
+                history.compacted_at = 0.0  # Rewrite it without them on the next flush
+            history.disk_rows = len(columns)
+            columns.extend(history.pending)
+            history.columns = columns
+        return history.columns
+
+    async def _compact(self, history: GuildHistory, max_rows: int, days: int) -> None:
+        """Rewrite the guild's file with only the rows inside retention (call with the lock held)."""
+        was_loaded = history.columns is not None
+        columns = await self._load(history)
+        cutoff = time.time() - days * 86400 if days else 0
+        kept = columns.trimmed(max_rows, cutoff)
+        if kept is not None:
+            history.columns = columns = kept
+        taken, history.pending = history.pending, HistoryColumns()
+        try:
+            await asyncio.to_thread(write_file, history.path, columns.to_block())
+        except Exception:
+            taken.extend(history.pending)
+            history.pending = taken
+            raise
+        # Rows collected during the write are in `columns` but not yet on disk
+        history.disk_rows = len(columns) - len(history.pending)
+        history.compacted_at = time.time()
+        if not was_loaded:
+            history.columns = None
+
+    async def columns(self, guild_id: int) -> HistoryColumns:
+        """The guild's rows, read into memory if needed."""
+        history = self._guild(guild_id)
+        async with history.lock:
+            return await self._load(history)
+
+    async def unload(self, guild_id: int) -> None:
+        """Drop the guild's rows from memory, they are read again on the next query."""
+        history = self.guilds.get(guild_id)
+        if history is None:
+            return
+        async with history.lock:
+            history.columns = None
+
+    def flush_all_now(self) -> None:
+        """Append every guild's collected catches synchronously (used on unload)."""
+        if self.codes.dirty:
+            write_file(self.root / "codes.json", self.codes.dump())
+        for history in self.guilds.values():
+            if history.pending:
+                try:
+                    _append_block(history.path, history.pending.to_block())
+                except Exception as e:
+                    log.error(f"Failed to write catch history to {history.path.name}", exc_info=e)
+                history.pending = HistoryColumns()
+
+    def size(self, guild_id: int) -> int:
+        """Bytes on disk for the guild's history."""
+        path = self.root / f"{guild_id}.bin"
+        return path.stat().st_size if path.is_file() else 0
+
+    def delete(self, guild_id: int) -> None:
+        """Forget the guild's history, on disk and in memory."""
+        self.guilds.pop(guild_id, None)
+        path = self.root / f"{guild_id}.bin"
+        if path.is_file():
+            path.unlink()
+
+
+# Queries
+
+
+def _top(counter: Counter, codes: HistoryCodes, column: str, count: int) -> List[Tuple[str, int]]:
+    return [(codes.value(column, code), n) for code, n in counter.most_common(count)]
+
+
+def journal(columns: HistoryColumns, codes: HistoryCodes, user_id: int, recent: int = 5, now: Optional[float] = None) -> dict:
+    """One angler's catch history summed up."""
+    now = now or time.time()
+    rows = columns.rows_for(user_id)
+    if not rows:
+        return {"catches": 0}
+    fish_col, weight_col, length_col = columns.fish, columns.weight, columns.length
+    timestamps = columns.timestamp
+
+    species = Counter(fish_col[i] for i in rows)
+    heaviest = max(rows, key=weight_col.__getitem__)
+    longest = max(rows, key=length_col.__getitem__)
+    week_start = now - 7 * 86400
+
+    def catch(i: int) -> dict:
+        return {
+            "timestamp": timestamps[i],
+            "fish_id": codes.value("fish", fish_col[i]),
+            "weight_oz": weight_col[i],
+            "length_in": length_col[i],
+            "location": codes.value("location", columns.location[i]),
+        }
+
+    return {
+        "catches": len(rows),
+        "first": timestamps[rows[0]],
+        "this_week": len(rows) - bisect_left(rows, columns.since(week_start)),
+        "total_weight_oz": sum(weight_col[i] for i in rows),
+        "species": _top(species, codes, "fish", 5),
+        "species_count": len(species),
+        "locations": _top(Counter(columns.location[i] for i in rows), codes, "location", 3),
+        "weather": _top(Counter(columns.weather[i] for i in rows), codes, "weather", 3),
+        "baits": _top(Counter(columns.bait[i] for i in rows), codes, "bait", 3),
+        "heaviest": catch(heaviest),
+        "longest": catch(longest),
+        "recent": [catch(i) for i in reversed(rows[-recent:])],
+    }
+
+
+def analytics(columns: HistoryColumns, codes: HistoryCodes, days: int, now: Optional[float] = None) -> dict:
+    """Guild-wide catch counts over the last `days` days."""
+    now = now or time.time()
+    start = columns.since(now - days * 86400)
+    count = len(columns) - start
+    if not count:
+        return {"catches": 0, "days": days}
+    daily = Counter((now - t) // 86400 for t in columns.timestamp[start:])
+    return {
+        "catches": count,
+        "days": days,
+        "anglers": len(set(columns.user_id[start:])),
+        "total_weight_oz": sum(columns.weight[start:]),
+        "species": _top(Counter(columns.fish[start:]), codes, "fish", 5),
+        "locations": _top(Counter(columns.location[start:]), codes, "location", 5),
+        "weather": _top(Counter(columns.weather[start:]), codes, "weather", 5),
+        "baits": _top(Counter(columns.bait[start:]), codes, "bait", 5),
+        # Catches per day, today first
+        "per_day": [daily.get(day, 0) for day in range(min(days, 7))],
+    }
@@ -0,0 +1,225 @@
+"""
+In-memory ring buffer of debug catches.
+
+Catches made by users in debug mode are kept as compact slotted records in a
+fixed-capacity ring, so logging a catch is O(1) and memory stays bounded no
+matter how long debug mode is left on. An optional sample rate records only a
+fraction of catches, which keeps debug mode cheap in busy guilds. Filters,
+percentiles and the CSV export are computed on demand from the buffer.
+"""
+
+import csv
+import random
+from collections import Counter
+from datetime import datetime
+from io import StringIO
+from typing import Iterator, List, Optional
+
+DEFAULT_CAPACITY = 1000
+
+# Flag bits packed into CatchRecord.flags
+MAX_WEIGHT = 1
+MAX_LENGTH = 2
+TOKEN = 4
+PERFECT = 8
+
+# trophy= filter names -> flag bits
+TROPHY_FLAGS = {
+    "weight": MAX_WEIGHT,
+    "length": MAX_LENGTH,
+    "token": TOKEN,
+    "perfect": PERFECT,
+}
+
+CSV_COLUMNS = (
+    "timestamp", "user_id", "user_name", "fish_id", "fish_name",
+    "weight_caught_oz", "weight_max_oz", "is_max_weight",
+    "length_caught_in", "length_max_in", "is_max_length",
+    "token_awarded", "perfect_trophy", "total_tokens", "seed",
+)
+
+
+class CatchRecord:
+    """One logged catch."""
+
+    __slots__ = (
+        "timestamp", "user_id", "user_name", "fish_id", "fish_name",
+        "weight_oz", "max_weight_oz", "length_in", "max_length_in", "flags", "total_tokens",
+        "seed", "trace",
+    )
+
+    def __init__(
+        self,
+        timestamp: float,
+        user_id: int,
+        user_name: str,
+        fish_id: str,
+        fish_name: str,
+        weight_oz: float,
+        max_weight_oz: float,
+        length_in: float,
+        max_length_in: float,
+        flags: int,
+        total_tokens: int,
+        seed: Optional[int] = None,
+        trace: Optional[tuple] = None,
+    ):
+        self.timestamp = timestamp
+        self.user_id = user_id
+        self.user_name = user_name
+        self.fish_id = fish_id
+        self.fish_name = fish_name
+        self.weight_oz = weight_oz
+        self.max_weight_oz = max_weight_oz
+        self.length_in = length_in
+        self.max_length_in = max_length_in
+        self.flags = flags
+        self.total_tokens = total_tokens
+        # Session seed and traced draws, enough to replay the catch (see common/replay.py)
+        self.seed = seed
+        self.trace = trace
+
+    @property
+    def weight_ratio(self) -> float:
+        return self.weight_oz / self.max_weight_oz if self.max_weight_oz else 0.0
+
+    @property
+    def length_ratio(self) -> float:
+        return self.length_in / self.max_length_in if self.max_length_in else 0.0
+
+    def to_dict(self) -> dict:
+        """The entry layout the JSON export has always used, plus the session seed and trace."""
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "user_id": self.user_id,
+            "user_name": self.user_name,
+            "fish_id": self.fish_id,
+            "fish_name": self.fish_name,
+            "weight_caught_oz": round(self.weight_oz, 1),
+            "weight_max_oz": round(self.max_weight_oz, 1),
+            "is_max_weight": bool(self.flags & MAX_WEIGHT),
+            "length_caught_in": round(self.length_in, 1),
+            "length_max_in": round(self.max_length_in, 1),
+            "is_max_length": bool(self.flags & MAX_LENGTH),
+            "token_awarded": bool(self.flags & TOKEN),
+            "perfect_trophy": bool(self.flags & PERFECT),
+            "total_tokens": self.total_tokens,
+            "seed": self.seed,
+            "trace": list(self.trace) if self.trace is not None else None,
+        }
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list, q in 0-100."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class CatchLog:
+    """
+    Fixed-capacity ring of the most recent debug catches.
+
+    Once full, each new record overwrites the oldest one. `sample_rate` is the
+    fraction of catches that get recorded (1.0 logs everything).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, sample_rate: float = 1.0):
+        self.capacity = capacity
+        self.sample_rate = sample_rate
+        self._ring: List[Optional[CatchRecord]] = [None] * capacity
+        self._next = 0  # Slot the next record goes into
+        self._size = 0
+
+        # Stats
+        self.seen = 0
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[CatchRecord]:
+        """Oldest to newest."""
+        start = (self._next - self._size) % self.capacity
+        for i in range(self._size):
+            yield self._ring[(start + i) % self.capacity]
+
+    def record(self, record: CatchRecord) -> bool:
+        """Store a catch, subject to sampling. Returns whether it was kept."""
+        self.seen += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.skipped += 1
+            return False
+        self._ring[self._next] = record
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def clear(self) -> int:
+        """Drop every record, returns how many there were."""
+        count = self._size
+        self._ring = [None] * self.capacity
+        self._next = 0
+        self._size = 0
+        return count
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        fish_id: Optional[str] = None,
+        trophy: int = 0,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[CatchRecord]:
+        """Records matching every given filter, oldest first. `trophy` is a mask of flag bits, any of which matches."""
+        return [
+            r for r in self
+            if (user_id is None or r.user_id == user_id)
+            and (fish_id is None or r.fish_id == fish_id)
+            and (not trophy or r.flags & trophy)
+            and (since is None or r.timestamp >= since)
+            and (until is None or r.timestamp <= until)
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "size": self._size,
+            "capacity": self.capacity,
+            "sample_rate": self.sample_rate,
+            "seen": self.seen,
+            "skipped": self.skipped,
+        }
+
+
+def summarize(records: List[CatchRecord]) -> dict:
+    """Distribution summary for a set of records."""
+    weight_ratios = sorted(r.weight_ratio for r in records)
+    length_ratios = sorted(r.length_ratio for r in records)
+    # Catches per tenth of the species max weight, 0-10% .. 90-100%
+    histogram = [0] * 10
+    for ratio in weight_ratios:
+        histogram[min(int(ratio * 10), 9)] += 1
+    total = len(records)
+    return {
+        "count": total,
+        "users": len({r.user_id for r in records}),
+        "species": Counter(r.fish_name for r in records).most_common(5),
+        "weight_pct": {q: percentile(weight_ratios, q) for q in (50, 90, 99)},
+        "length_pct": {q: percentile(length_ratios, q) for q in (50, 90, 99)},
+        "weight_histogram": histogram,
+        "token_rate": sum(1 for r in records if r.flags & TOKEN) / total if total else 0.0,
+        "perfect_rate": sum(1 for r in records if r.flags & PERFECT) / total if total else 0.0,
+        "first": records[0].timestamp if records else None,
+        "last": records[-1].timestamp if records else None,
+    }
+
+
+def to_csv(records: List[CatchRecord]) -> str:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    for record in records:
+        row = record.to_dict()
+        writer.writerow([row[column] for column in CSV_COLUMNS])
+    return buffer.getvalue()
@@ -0,0 +1,133 @@
+"""
+Timed fishing derbies.
+
+A derby pins one location for a fixed number of minutes. Anglers join, fish
+there through the normal fishing views, and each catch they land at the derby
+location updates their entry in O(1). Nothing is sent or saved per catch: the
+scoreboard is one message re-rendered at a fixed cadence (and only when
+something changed), and the results are written to the guild's settings once
+when the derby ends.
+
+Derbies live in memory only. Unloading the cog ends every running derby
+early: its results are stored with the final save and announced as usual.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional
+
+# Ranking options: best single fish by weight, or FishPoints of everything caught
+DERBY_METRICS = ("weight", "points")
+METRIC_NAMES = {"weight": "heaviest catch", "points": "total FishPoints"}
+
+# Seconds between scoreboard refreshes
+SCOREBOARD_INTERVAL = 15.0
+# While a derby runs, queued saves are written at most this often
+DERBY_SAVE_INTERVAL = 30.0
+# Finished derbies kept per guild
+RESULTS_KEPT = 10
+
+MIN_MINUTES = 1
+MAX_MINUTES = 24 * 60
+
+
+class DerbyEntry:
+    """One angler's running totals."""
+
+    __slots__ = ("user_id", "name", "catches", "points", "best_weight", "best_fish_id", "best_at")
+
+    def __init__(self, user_id: int, name: str):
+        self.user_id = user_id
+        self.name = name
+        self.catches = 0
+        self.points = 0
+        self.best_weight = 0.0
+        self.best_fish_id: Optional[str] = None
+        self.best_at = 0.0  # When the best fish was landed, earlier wins ties
+
+
+class Derby:
+    """A running derby in one guild."""
+
+    def __init__(self, guild_id: int, channel_id: int, location: str, minutes: int, metric: str = "weight"):
+        if metric not in DERBY_METRICS:
+            raise ValueError(f"Unknown derby metric {metric!r}")
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.location = location
+        self.metric = metric
+        self.started_at = time.time()
+        self.ends_at = self.started_at + minutes * 60
+        self.entries: Dict[int, DerbyEntry] = {}
+        self.total_catches = 0
+        self.message_id: Optional[int] = None  # The scoreboard message
+        # Set by joins and catches, cleared when the scoreboard is rendered
+        self.dirty = True
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.entries
+
+    def join(self, user_id: int, name: str) -> bool:
+        """Add an angler. Returns False if they had already joined."""
+        if user_id in self.entries:
+            return False
+        self.entries[user_id] = DerbyEntry(user_id, name)
+        self.dirty = True
+        return True
+
+    def is_over(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.ends_at
+
+    def time_left(self, now: Optional[float] = None) -> float:
+        return max(0.0, self.ends_at - (now or time.time()))
+
+    def end_now(self) -> None:
+        self.ends_at = min(self.ends_at, time.time())
+
+    def record_catch(self, user_id: int, location: str, fish_id: str, weight_oz: float, points: int) -> bool:
+        """Count a landed fish if it was caught by an entrant at the derby location before the end."""
+        entry = self.entries.get(user_id)
+        if entry is None or location != self.location:
+            return False
+        now = time.time()
+        if self.is_over(now):
+            return False
+        entry.catches += 1
+        entry.points += points
+        if weight_oz > entry.best_weight:
+            entry.best_weight = weight_oz
+            entry.best_fish_id = fish_id
+            entry.best_at = now
+        self.total_catches += 1
+        self.dirty = True
+        return True
+
+    def standings(self, count: int = 10) -> List[DerbyEntry]:
+        """Top `count` entrants with at least one catch, best first."""
+        if self.metric == "weight":
+            key = lambda e: (e.best_weight, -e.best_at)
+        else:
+            key = lambda e: (e.points, e.catches)
+        return heapq.nlargest(count, (e for e in self.entries.values() if e.catches), key=key)
+
+    def results(self, count: int = 10) -> dict:
+        """Summary stored in the guild's derby history (and rendered on the scoreboard)."""
+        return {
+            "location": self.location,
+            "metric": self.metric,
+            "started_at": self.started_at,
+            "ends_at": self.ends_at,
+            "anglers": len(self.entries),
+            "catches": self.total_catches,
+            "standings": [
+                {
+                    "user_id": e.user_id,
+                    "name": e.name,
+                    "catches": e.catches,
+                    "points": e.points,
+                    "best_weight_oz": e.best_weight,
+                    "best_fish_id": e.best_fish_id,
+                }
+                for e in self.standings(count)
+            ],
+        }
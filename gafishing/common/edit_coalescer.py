@@ -0,0 +1,173 @@
+"""
+Rate-limit aware message edits for active fishing views.
+
+Fishing sessions re-render their message after every bite check, phase change
+and fight event. Several people fishing in one channel all share that channel's
+message edit bucket, so editing on every change quickly runs into 429s. The
+coalescer keeps only the newest pending render per message and flushes a
+channel at most once per interval. Renders that are replaced before they are
+flushed are counted as dropped frames.
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+import discord
+
+if TYPE_CHECKING:
+    from .scheduler import SessionScheduler
+
+log = logging.getLogger("red.greenacresfishing.edits")
+
+# Default minimum seconds between flushes in one channel
+DEFAULT_EDIT_INTERVAL = 1.0
+MIN_EDIT_INTERVAL = 0.25
+MAX_EDIT_INTERVAL = 10.0
+
+
+class PendingFrame:
+    """Latest not-yet-sent render for one message."""
+
+    __slots__ = ("message", "kwargs")
+
+    def __init__(self, message: discord.Message, kwargs: dict):
+        self.message = message
+        self.kwargs = kwargs
+
+
+class EditCoalescer:
+    """
+    Coalesces message edits per message and paces them per channel.
+
+    `submit()` prefers answering the interaction when one is given, since
+    interaction responses don't spend the channel's edit budget. Otherwise the
+    edit goes out immediately if the channel hasn't been edited within its
+    interval, or is parked until the channel's next flush. A newer render for
+    the same message replaces the parked one. Flushes are deadlines on the
+    shared session scheduler.
+    """
+
+    def __init__(self, scheduler: "SessionScheduler"):
+        self.scheduler = scheduler
+        self._pending: Dict[int, PendingFrame] = {}  # message id -> frame
+        self._channels: Dict[int, Set[int]] = {}  # channel id -> pending message ids
+        self._last_flush: Dict[int, float] = {}  # channel id -> monotonic time
+
+        # Metrics
+        self.submitted = 0
+        self.via_interaction = 0
+        self.sent = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.errors = 0
+
+    async def submit(
+        self,
+        message: Optional[discord.Message],
+        interval: float = DEFAULT_EDIT_INTERVAL,
+        interaction: Optional[discord.Interaction] = None,
+        **kwargs,
+    ) -> bool:
+        """
+        Render `kwargs` (embed=, view=, ...) onto `message`.
+
+        Returns False only if an edit was attempted right away and failed.
+        A parked frame counts as success, it will be sent on the next flush.
+        """
+        if message is None:
+            return False
+        self.submitted += 1
+
+        if interaction is not None:
+            # Whatever was parked for this message is now stale
+            if self._discard(message.id):
+                self.dropped += 1
+            try:
+                if interaction.response.is_done():
+                    await interaction.edit_original_response(**kwargs)
+                else:
+                    await interaction.response.edit_message(**kwargs)
+                self.via_interaction += 1
+                return True
+            except (discord.NotFound, discord.HTTPException):
+                # Interaction expired or failed, fall back to a paced edit
+                pass
+
+        frame = self._pending.get(message.id)
+        if frame is not None:
+            # Replace the parked render, keeping anything this one doesn't set
+            frame.kwargs.update(kwargs)
+            self.dropped += 1
+            return True
+
+        channel_id = message.channel.id
+        flush_key = ("edits", channel_id)
+        now = time.monotonic()
+        wait = self._last_flush.get(channel_id, 0.0) + interval - now
+        if wait <= 0 and flush_key not in self.scheduler:
+            self._last_flush[channel_id] = now
+            return await self._send(message, kwargs)
+
+        self._pending[message.id] = PendingFrame(message, dict(kwargs))
+        self._channels.setdefault(channel_id, set()).add(message.id)
+        if flush_key not in self.scheduler:
+            self.scheduler.schedule(flush_key, max(wait, 0.0), self._flush, channel_id)
+        return True
+
+    def discard(self, message: Optional[discord.Message]) -> None:
+        """Drop the parked render for a message, e.g. when its view is replaced."""
+        if message is not None and self._discard(message.id):
+            self.dropped += 1
+
+    def _discard(self, message_id: int) -> bool:
+        frame = self._pending.pop(message_id, None)
+        if frame is None:
+            return False
+        channel_id = frame.message.channel.id
+        ids = self._channels.get(channel_id)
+        if ids is not None:
+            ids.discard(message_id)
+            if not ids:
+                del self._channels[channel_id]
+                self.scheduler.cancel(("edits", channel_id))
+        return True
+
+    async def _flush(self, channel_id: int) -> None:
+        ids = self._channels.pop(channel_id, set())
+        frames = [self._pending.pop(mid) for mid in ids if mid in self._pending]
+        if not frames:
+            return
+        self._last_flush[channel_id] = time.monotonic()
+        self.flushes += 1
+        await asyncio.gather(*(self._send(frame.message, frame.kwargs) for frame in frames))
+
+    async def _send(self, message: discord.Message, kwargs: dict) -> bool:
+        try:
+            await message.edit(**kwargs)
+            self.sent += 1
+            return True
+        except (discord.NotFound, discord.HTTPException) as e:
+            self.errors += 1
+            log.debug(f"Fishing message edit failed in channel {message.channel.id}: {e}")
+            return False
+
+    def clear(self) -> None:
+        for channel_id in self._channels:
+            self.scheduler.cancel(("edits", channel_id))
+        self._pending.clear()
+        self._channels.clear()
+        self._last_flush.clear()
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "via_interaction": self.via_interaction,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "pending": len(self._pending),
+            "drop_rate": (self.dropped / self.submitted) if self.submitted else 0.0,
+        }
@@ -0,0 +1,81 @@
+"""
+Running totals for a user's fish inventory.
+
+The fish bucket is an unbounded list kept in catch order. The shop and the
+inventory used to walk all of it (with a database lookup for legacy entries)
+to count and value the fish on every open. The ledger is built once per user
+and kept current as fish are added and sold, so totals for any sell selection
+come from a handful of per-species counters instead of the fish themselves.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..databases.fish import FISH_DATABASE
+
+
+def fish_value(entry: dict) -> int:
+    """FishPoints a caught fish sells for."""
+    if "fishpoints" in entry:
+        return entry["fishpoints"]
+    # Legacy fish without stored fishpoints - look up from database
+    return FISH_DATABASE.get(entry.get("fish_id", ""), {}).get("base_fishpoints", 10)
+
+
+def matches(entry: dict, species: Optional[str], trophy: Optional[bool]) -> bool:
+    """Whether a fish is part of a sell selection (None means any)."""
+    return (species is None or entry.get("fish_id") == species) and (
+        trophy is None or bool(entry.get("is_trophy", False)) == trophy
+    )
+
+
+class FishLedger:
+    """Counts and values per species, split into trophy and non-trophy fish."""
+
+    def __init__(self):
+        # fish_id -> [count, value, trophy count, trophy value]
+        self.species: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, fish: Iterable[dict]) -> "FishLedger":
+        ledger = cls()
+        for entry in fish:
+            ledger.add(entry)
+        return ledger
+
+    def add(self, entry: dict, sign: int = 1) -> None:
+        totals = self.species.setdefault(entry.get("fish_id", "unknown"), [0, 0, 0, 0])
+        value = fish_value(entry)
+        totals[0] += sign
+        totals[1] += sign * value
+        if entry.get("is_trophy", False):
+            totals[2] += sign
+            totals[3] += sign * value
+
+    def remove(self, entry: dict) -> None:
+        self.add(entry, sign=-1)
+        fish_id = entry.get("fish_id", "unknown")
+        if not self.species[fish_id][0]:
+            del self.species[fish_id]
+
+    def selection(self, species: Optional[str] = None, trophy: Optional[bool] = None) -> Tuple[int, int]:
+        """(count, value) of the fish a sell selection would take."""
+        if species is None:
+            rows = self.species.values()
+        else:
+            rows = [self.species[species]] if species in self.species else []
+        count = value = 0
+        for total, total_value, trophies, trophy_value in rows:
+            if trophy is None:
+                count += total
+                value += total_value
+            elif trophy:
+                count += trophies
+                value += trophy_value
+            else:
+                count += total - trophies
+                value += total_value - trophy_value
+        return count, value
+
+    def by_count(self) -> List[Tuple[str, int]]:
+        """(fish_id, count) pairs, most caught first."""
+        return sorted(((fish_id, row[0]) for fish_id, row in self.species.items()), key=lambda x: -x[1])
@@ -0,0 +1,81 @@
+"""
+Versioned, lazy schema migrations.
+
+Each migrated record carries an integer schema version. Upgrade steps are
+registered per version and run in order the first time an out-of-date record
+is touched, so records that are already current cost one integer comparison.
+A throttled background sweep can bring everything else up to date without
+blocking startup.
+
+This module has no dependencies on the rest of the cog, so other cogs can use
+it as-is for their own models.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+log = logging.getLogger("red.greenacresfishing.migrations")
+
+
+class Migrations:
+    """
+    Ordered upgrade steps for one kind of record.
+
+    Register steps with `@migrations.register(version)`. A step receives the
+    record at `version - 1` and changes it in place; `upgrade()` then stamps
+    the record with the new version. Versions start at 1 and must be
+    registered without gaps.
+    """
+
+    def __init__(self, name: str, attr: str = "schema_version"):
+        self.name = name
+        self.attr = attr
+        self._steps: Dict[int, Callable[[Any], None]] = {}
+
+    @property
+    def latest(self) -> int:
+        return len(self._steps)
+
+    def register(self, version: int) -> Callable:
+        def decorator(func: Callable[[Any], None]) -> Callable[[Any], None]:
+            if version != self.latest + 1:
+                raise ValueError(f"{self.name} migration {version} registered out of order (expected {self.latest + 1})")
+            self._steps[version] = func
+            return func
+        return decorator
+
+    def pending(self, obj: Any) -> bool:
+        return getattr(obj, self.attr) < self.latest
+
+    def upgrade(self, obj: Any) -> bool:
+        """Bring one record up to the latest version. Returns True if anything ran."""
+        current = getattr(obj, self.attr)
+        if current >= self.latest:
+            return False
+        for version in range(current + 1, self.latest + 1):
+            self._steps[version](obj)
+            setattr(obj, self.attr, version)
+        return True
+
+    async def sweep(self, objects: Iterable[Any], batch_size: int = 250, pause: float = 0.05) -> Tuple[int, int]:
+        """
+        Upgrade every record in `objects`, yielding to the event loop between batches.
+
+        Pass a snapshot rather than live containers, they may change during a pause.
+        Returns how many records were upgraded and how many failed.
+        """
+        upgraded = 0
+        failed = 0
+        checked = 0
+        for obj in objects:
+            try:
+                if self.upgrade(obj):
+                    upgraded += 1
+            except Exception as e:
+                failed += 1
+                log.exception(f"{self.name} migration failed for a record, it will be retried when touched", exc_info=e)
+            checked += 1
+            if checked % batch_size == 0:
+                await asyncio.sleep(pause)
+        return upgraded, failed
@@ -1,9 +1,98 @@
 import discord
-from typing import ClassVar, List, Dict, Optional
+from functools import partial
+from typing import Callable, ClassVar, List, Dict, Optional, Tuple
+from uuid import uuid4
 from . import Base
-from pydantic import Field
+from .boards import TRACKED_FIELDS, BoardIndex
+from .catch_history import DEFAULT_HISTORY_DAYS, DEFAULT_HISTORY_MAX_CATCHES
+from .fish_ledger import FishLedger, matches
+from .records import RecordIndex
+from .schema import USER_MIGRATIONS
+from .view_registry import DEFAULT_MAX_VIEWS_PER_USER
+from .world_records import WorldRecords
+from pydantic import Field, PrivateAttr, model_validator
+
+CLOTHING_SLOTS = ("hat", "coat", "boots")
+
+
+def new_item_id(inventory: Dict[str, dict]) -> str:
+    """Short random key that isn't already used in `inventory`."""
+    while True:
+        item_id = uuid4().hex[:8]
+        if item_id not in inventory:
+            return item_id
+
+
+def migrate_gear_inventories(data: dict) -> dict:
+    """
+    Convert a stored user from list-based gear inventories to keyed ones.
+    
+    Old data kept gear in lists and equipped items as list indexes (and before that,
+    as an `equipped` flag on the item). Rods and clothing get generated keys, lure
+    stacks are keyed by lure_id with duplicate stacks merged.
+    """
+    rods = data.get("current_rod_inventory")
+    if isinstance(rods, list):
+        keyed = {}
+        equipped_idx = data.pop("equipped_rod_index", None)
+        for idx, rod in enumerate(rods):
+            rod = dict(rod)
+            if "id" in rod and "rod_id" not in rod:
+                rod["rod_id"] = rod.pop("id")
+            item_id = new_item_id(keyed)
+            if rod.pop("equipped", False) and equipped_idx is None:
+                equipped_idx = idx
+            if idx == equipped_idx:
+                data["equipped_rod_id"] = item_id
+            keyed[item_id] = rod
+        data["current_rod_inventory"] = keyed
+    
+    lures = data.get("current_lure_inventory")
+    if isinstance(lures, list):
+        keyed = {}
+        equipped_idx = data.pop("equipped_lure_index", None)
+        for idx, lure in enumerate(lures):
+            lure = dict(lure)
+            if "id" in lure and "lure_id" not in lure:
+                lure["lure_id"] = lure.pop("id")
+            lure_id = lure.get("lure_id", "")
+            if lure.pop("equipped", False) and equipped_idx is None:
+                equipped_idx = idx
+            if idx == equipped_idx:
+                data["equipped_lure_id"] = lure_id
+            stack = keyed.get(lure_id)
+            if stack is None:
+                keyed[lure_id] = lure
+            else:
+                # Merge duplicate stacks of the same lure
+                stack["quantity"] = stack.get("quantity", 0) + lure.get("quantity", 0)
+                if "remaining_uses" in stack and "remaining_uses" in lure:
+                    stack["remaining_uses"] += lure["remaining_uses"]
+                else:
+                    stack.pop("remaining_uses", None)  # Recomputed from quantity by ensure_lure_uses
+        data["current_lure_inventory"] = keyed
+    
+    clothing = data.get("current_clothing_inventory")
+    if isinstance(clothing, list):
+        keyed = {}
+        equipped = {slot: data.pop(f"equipped_{slot}_index", None) for slot in CLOTHING_SLOTS}
+        for idx, item in enumerate(clothing):
+            item = dict(item)
+            slot = item.get("slot")
+            item_id = new_item_id(keyed)
+            if item.pop("equipped", False) and slot in equipped and equipped[slot] is None:
+                equipped[slot] = idx
+            if slot in equipped and equipped[slot] == idx:
+                data[f"equipped_{slot}_id"] = item_id
+            keyed[item_id] = item
+        data["current_clothing_inventory"] = keyed
+    
+    return data
+
 
 class User(Base):
+    # Stored data without this field predates versioning, see common/schema.py
+    schema_version: int = 0
     first_join: bool = False
     first_cast_timestamp: str = ""
     total_fish_ever_caught: int = 0
@@ -21,24 +110,51 @@ class User(Base):
     # Cooldowns (Unix timestamps)
     last_scavenge_timestamp: int = 0  # Last time player searched garbage (12hr cooldown)
     
-    # Inventory lists
-    current_rod_inventory: List[dict] = Field(default_factory=list)
-    current_lure_inventory: List[dict] = Field(default_factory=list)
-    current_clothing_inventory: List[dict] = Field(default_factory=list)
+    # Gear inventories, keyed so items can be found and equipped without scanning.
+    # Rods and clothing are keyed by a generated item id (each has its own state, e.g. durability),
+    # lures are keyed by lure_id since each lure type is one stack. Insertion order is display order.
+    current_rod_inventory: Dict[str, dict] = Field(default_factory=dict)
+    current_lure_inventory: Dict[str, dict] = Field(default_factory=dict)
+    current_clothing_inventory: Dict[str, dict] = Field(default_factory=dict)
     current_fish_inventory: List[dict] = Field(default_factory=list)
     
-    # Equipped items (stores inventory index, None if nothing equipped)
-    # Using index allows tracking specific items (e.g., rod durability)
-    equipped_rod_index: Optional[int] = None
-    equipped_lure_index: Optional[int] = None
-    equipped_hat_index: Optional[int] = None
-    equipped_coat_index: Optional[int] = None
-    equipped_boots_index: Optional[int] = None
+    # Equipped items (inventory key, None if nothing equipped)
+    equipped_rod_id: Optional[str] = None
+    equipped_lure_id: Optional[str] = None
+    equipped_hat_id: Optional[str] = None
+    equipped_coat_id: Optional[str] = None
+    equipped_boots_id: Optional[str] = None
     
     # Personal records per fish species
     # Format: {"fish_id": {"max_weight": float, "max_length": float, "weight_timestamp": str, "length_timestamp": str}}
     fish_records: Dict[str, dict] = Field(default_factory=dict)
     
+    # Set by the guild's RecordIndex: (fish_id, "weight"/"length", value) on a new personal best
+    _record_hook: Optional[Callable[[str, str, float], None]] = PrivateAttr(default=None)
+    # Offers new records to the bot-wide boards, bound by GuildSettings.get_user
+    _world_hook: Optional[Callable[[str, str, float], None]] = PrivateAttr(default=None)
+    # Set by the guild's BoardIndex, called with (field, old, new) when a board stat changes
+    _stats_hook: Optional[Callable[[str, object, object], None]] = PrivateAttr(default=None)
+    # Running totals over current_fish_inventory, built on first use
+    _fish_ledger: Optional[FishLedger] = PrivateAttr(default=None)
+
+    def set_stat(self, field: str, value) -> None:
+        """Set a leaderboard stat (see `TRACKED_FIELDS`), keeping the guild's boards up to date."""
+        old = getattr(self, field)
+        setattr(self, field, value)
+        if self._stats_hook is not None and field in TRACKED_FIELDS:
+            self._stats_hook(field, old, value)
+    
+    def add_stat(self, field: str, amount: int) -> None:
+        """Add to (or with a negative amount, take from) a leaderboard stat."""
+        self.set_stat(field, getattr(self, field) + amount)
+    
+    def add_fishpoints(self, amount: int) -> None:
+        """Award FishPoints, raising most_fishpoints_ever if the new balance passes it."""
+        self.add_stat("total_fishpoints", amount)
+        if self.total_fishpoints > self.most_fishpoints_ever:
+            self.set_stat("most_fishpoints_ever", self.total_fishpoints)
+    
     def update_fish_record(self, fish_id: str, weight: float, length: float) -> Dict[str, bool]:
         """
         Update personal records for a fish species.
@@ -64,11 +180,19 @@ class User(Base):
             record["max_weight"] = weight
             record["weight_timestamp"] = timestamp
             result["new_weight_record"] = True
+            if self._record_hook is not None:
+                self._record_hook(fish_id, "weight", weight)
+            if self._world_hook is not None:
+                self._world_hook(fish_id, "weight", weight)
         
         if length > record["max_length"]:
             record["max_length"] = length
             record["length_timestamp"] = timestamp
             result["new_length_record"] = True
+            if self._record_hook is not None:
+                self._record_hook(fish_id, "length", length)
+            if self._world_hook is not None:
+                self._world_hook(fish_id, "length", length)
         
         return result
     
@@ -76,83 +200,142 @@ class User(Base):
         """Get personal record for a fish species, or None if never caught."""
         return self.fish_records.get(fish_id)
     
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_gear_lists(cls, data):
+        """Convert list-based gear inventories and index-based equip pointers to keyed ones."""
+        if isinstance(data, dict) and any(
+            isinstance(data.get(f"current_{kind}_inventory"), list) for kind in ("rod", "lure", "clothing")
+        ):
+            data = migrate_gear_inventories(dict(data))
+        return data
+    
+    @property
+    def fish_ledger(self) -> FishLedger:
+        if self._fish_ledger is None:
+            self._fish_ledger = FishLedger.build(self.current_fish_inventory)
+        return self._fish_ledger
+    
+    def add_fish(self, entry: dict) -> None:
+        """Put a caught fish in the bucket."""
+        self.current_fish_inventory.append(entry)
+        if self._fish_ledger is not None:
+            self._fish_ledger.add(entry)
+    
+    def take_fish(self, species: Optional[str] = None, trophy: Optional[bool] = None) -> Tuple[int, int]:
+        """
+        Remove the fish matching a sell selection and return their (count, value).
+        
+        `species` limits to one fish_id, `trophy` to trophies (True) or non-trophies (False).
+        """
+        count, value = self.fish_ledger.selection(species, trophy)
+        if not count:
+            return 0, 0
+        if species is None and trophy is None:
+            self.current_fish_inventory.clear()
+            self._fish_ledger = FishLedger()
+            return count, value
+        kept = []
+        for entry in self.current_fish_inventory:
+            if matches(entry, species, trophy):
+                self._fish_ledger.remove(entry)
+            else:
+                kept.append(entry)
+        self.current_fish_inventory[:] = kept
+        return count, value
+    
     def get_equipped_rod(self) -> Optional[dict]:
         """Get the currently equipped rod, or None."""
-        if self.equipped_rod_index is not None and self.equipped_rod_index < len(self.current_rod_inventory):
-            return self.current_rod_inventory[self.equipped_rod_index]
-        return None
+        if self.equipped_rod_id is None:
+            return None
+        return self.current_rod_inventory.get(self.equipped_rod_id)
     
     def get_equipped_lure(self) -> Optional[dict]:
         """Get the currently equipped lure, or None."""
-        if self.equipped_lure_index is not None and self.equipped_lure_index < len(self.current_lure_inventory):
-            lure = self.current_lure_inventory[self.equipped_lure_index]
-            # Auto-migrate old format lures to new uses tracking
-            if "remaining_uses" not in lure or "uses_per_item" not in lure:
-                from ..commands.helper_functions import ensure_lure_uses
-                ensure_lure_uses(lure)
-            return lure
-        return None
+        if self.equipped_lure_id is None:
+            return None
+        return self.current_lure_inventory.get(self.equipped_lure_id)
     
     def get_equipped_clothing(self, slot: str) -> Optional[dict]:
         """Get equipped clothing for a specific slot (hat, coat, boots), or None."""
-        index_map = {
-            "hat": self.equipped_hat_index,
-            "coat": self.equipped_coat_index,
-            "boots": self.equipped_boots_index,
-        }
-        idx = index_map.get(slot)
-        if idx is not None and idx < len(self.current_clothing_inventory):
-            item = self.current_clothing_inventory[idx]
-            if item.get("slot") == slot:
-                return item
+        item_id = self.get_equipped_clothing_id(slot)
+        if item_id is None:
+            return None
+        item = self.current_clothing_inventory.get(item_id)
+        if item is not None and item.get("slot") == slot:
+            return item
         return None
     
-    def equip_rod(self, index: int) -> bool:
-        """Equip a rod by inventory index. Returns True if successful."""
-        if 0 <= index < len(self.current_rod_inventory):
-            self.equipped_rod_index = index
-            return True
-        return False
+    def get_equipped_clothing_id(self, slot: str) -> Optional[str]:
+        """Inventory key of the clothing equipped in a slot, or None."""
+        return getattr(self, f"equipped_{slot}_id", None) if slot in CLOTHING_SLOTS else None
+    
+    def add_rod(self, rod_id: str, durability: int) -> str:
+        """Add a new rod, returns its inventory key."""
+        item_id = new_item_id(self.current_rod_inventory)
+        self.current_rod_inventory[item_id] = {"rod_id": rod_id, "durability": durability}
+        return item_id
     
-    def equip_lure(self, index: int) -> bool:
-        """Equip a lure by inventory index. Returns True if successful."""
-        if 0 <= index < len(self.current_lure_inventory):
-            self.equipped_lure_index = index
+    def add_clothing(self, clothing_id: str, slot: str) -> str:
+        """Add a clothing item, returns its inventory key."""
+        item_id = new_item_id(self.current_clothing_inventory)
+        self.current_clothing_inventory[item_id] = {"clothing_id": clothing_id, "slot": slot}
+        return item_id
+    
+    def add_lures(self, lure_id: str, quantity: int, uses_per_item: int) -> dict:
+        """Add lures to the stack for `lure_id`, creating the stack if needed. Returns the stack."""
+        stack = self.current_lure_inventory.get(lure_id)
+        if stack is None:
+            stack = self.current_lure_inventory[lure_id] = {
+                "lure_id": lure_id,
+                "quantity": 0,
+                "remaining_uses": 0,
+            }
+        stack["quantity"] = stack.get("quantity", 0) + quantity
+        stack["remaining_uses"] = stack.get("remaining_uses", 0) + quantity * uses_per_item
+        stack["uses_per_item"] = uses_per_item
+        return stack
+    
+    def remove_lure(self, lure_id: str) -> None:
+        """Drop an empty lure stack, unequipping it if it was equipped."""
+        self.current_lure_inventory.pop(lure_id, None)
+        if self.equipped_lure_id == lure_id:
+            self.equipped_lure_id = None
+    
+    def equip_rod(self, item_id: str) -> bool:
+        """Equip a rod by inventory key. Returns True if successful."""
+        if item_id in self.current_rod_inventory:
+            self.equipped_rod_id = item_id
             return True
         return False
     
-    def equip_clothing(self, index: int) -> bool:
-        """Equip a clothing item by inventory index. Returns True if successful."""
-        if 0 <= index < len(self.current_clothing_inventory):
-            item = self.current_clothing_inventory[index]
-            slot = item.get("slot")
-            if slot == "hat":
-                self.equipped_hat_index = index
-            elif slot == "coat":
-                self.equipped_coat_index = index
-            elif slot == "boots":
-                self.equipped_boots_index = index
-            else:
-                return False
+    def equip_lure(self, lure_id: str) -> bool:
+        """Equip a lure stack by lure id. Returns True if successful."""
+        if lure_id in self.current_lure_inventory:
+            self.equipped_lure_id = lure_id
             return True
         return False
     
+    def equip_clothing(self, item_id: str) -> bool:
+        """Equip a clothing item by inventory key. Returns True if successful."""
+        item = self.current_clothing_inventory.get(item_id)
+        if item is None or item.get("slot") not in CLOTHING_SLOTS:
+            return False
+        setattr(self, f"equipped_{item['slot']}_id", item_id)
+        return True
+    
     def unequip_rod(self) -> None:
         """Unequip the current rod."""
-        self.equipped_rod_index = None
+        self.equipped_rod_id = None
     
     def unequip_lure(self) -> None:
         """Unequip the current lure."""
-        self.equipped_lure_index = None
+        self.equipped_lure_id = None
     
     def unequip_clothing(self, slot: str) -> None:
         """Unequip clothing from a specific slot."""
-        if slot == "hat":
-            self.equipped_hat_index = None
-        elif slot == "coat":
-            self.equipped_coat_index = None
-        elif slot == "boots":
-            self.equipped_boots_index = None
+        if slot in CLOTHING_SLOTS:
+            setattr(self, f"equipped_{slot}_id", None)
     
 
 class GuildSettings(Base):
@@ -185,19 +368,117 @@ class GuildSettings(Base):
         """Returns combined list of default and user-added disallowed names."""
         return list(set(self.DEFAULT_DISALLOWED_NAMES + self.disallowed_names))
 
+    # Results of the most recent finished derbies, oldest first (see common/derby.py)
+    derby_results: List[dict] = Field(default_factory=list)
+
     allowed_channels: List[int] = Field(default_factory=list)  # Empty means all channels are allowed
+    _allowed_channel_set: Optional[frozenset] = PrivateAttr(default=None)
+    
+    @property
+    def allowed_channel_set(self) -> frozenset:
+        """allowed_channels as a frozenset for membership checks, rebuilt after changes."""
+        if self._allowed_channel_set is None:
+            self._allowed_channel_set = frozenset(self.allowed_channels)
+        return self._allowed_channel_set
+    
+    def allow_channel(self, channel_id: int) -> bool:
+        """Add a channel to the allow-list. Returns False if it was already there."""
+        if channel_id in self.allowed_channel_set:
+            return False
+        self.allowed_channels.append(channel_id)
+        self._allowed_channel_set = None
+        return True
+    
+    def disallow_channel(self, channel_id: int) -> bool:
+        """Remove a channel from the allow-list. Returns False if it wasn't there."""
+        if channel_id not in self.allowed_channel_set:
+            return False
+        self.allowed_channels.remove(channel_id)
+        self._allowed_channel_set = None
+        return True
     message_cleanup_enabled: bool = False
 
+    # Fishing message edit pacing (seconds between edits per channel)
+    edit_interval: float = 1.0
+    channel_edit_intervals: Dict[int, float] = Field(default_factory=dict)  # Per-channel overrides
+
+    def get_edit_interval(self, channel_id: int) -> float:
+        return self.channel_edit_intervals.get(channel_id, self.edit_interval)
+
+    # Show this server and its anglers on the bot-wide World Records (opt-in)
+    world_records_public: bool = False
+
+    # Open menus per user before their oldest is closed (0 = no limit)
+    max_views_per_user: int = DEFAULT_MAX_VIEWS_PER_USER
+
+    # Catch history, kept in its own files (see common/catch_history.py)
+    catch_history_enabled: bool = False
+    catch_history_days: int = DEFAULT_HISTORY_DAYS  # 0 = keep catches until the row limit
+    catch_history_max: int = DEFAULT_HISTORY_MAX_CATCHES  # Newest catches kept
+
     # Blacklist Settings
     blacklisted_users: List[int] = Field(default_factory=list)
 
+    # Per-species record boards, built on first use
+    _records: Optional[RecordIndex] = PrivateAttr(default=None)
+
+    @property
+    def records(self) -> RecordIndex:
+        if self._records is None:
+            self._records = RecordIndex.build(self.users)
+        return self._records
+
+    # Stat boards and running totals for the leaderboards, built on first use
+    _boards: Optional[BoardIndex] = PrivateAttr(default=None)
+
+    @property
+    def boards(self) -> BoardIndex:
+        if self._boards is None:
+            self._boards = BoardIndex.build(self.users)
+        return self._boards
+
+    # Bot-wide record boards for this guild's users, bound by DB.get_conf
+    _world_hook: Optional[Callable[[int, str, str, float], None]] = PrivateAttr(default=None)
+
+    def _offer_world_record(self, uid: int, fish_id: str, kind: str, value: float) -> None:
+        """Pass a new personal record on to the World Records, if this guild takes part."""
+        if self.world_records_public and self._world_hook is not None:
+            self._world_hook(uid, fish_id, kind, value)
+
+    def invalidate_indexes(self) -> None:
+        """Drop the record and board indexes (call after removing or resetting users)."""
+        self._records = None
+        self._boards = None
+
     def get_user(self, user: discord.User | int) -> User:
         uid = user if isinstance(user, int) else user.id
-        return self.users.setdefault(uid, User())
+        user_data = self.users.get(uid)
+        if user_data is None:
+            user_data = self.users[uid] = User(schema_version=USER_MIGRATIONS.latest)
+        elif user_data.schema_version < USER_MIGRATIONS.latest:
+            USER_MIGRATIONS.upgrade(user_data)
+        if self._records is not None and user_data._record_hook is None:
+            self._records.bind(uid, user_data)
+        if self._boards is not None and user_data._stats_hook is None:
+            self._boards.bind(uid, user_data)
+        if self._world_hook is not None and user_data._world_hook is None:
+            user_data._world_hook = partial(self._offer_world_record, uid)
+        return user_data
 
 class DB(Base):
     configs: dict[int, GuildSettings] = {}
+    # Every stored user is at least this user schema version (set once a sweep finishes)
+    schema_version: int = 0
+    # Bot-wide record boards (kept in their own file), attached by the cog once loaded
+    _world_records: Optional[WorldRecords] = PrivateAttr(default=None)
+    
+    def iter_users(self):
+        """Every stored user, snapshotted so guilds and users can be added or removed while iterating."""
+        return [user for conf in list(self.configs.values()) for user in list(conf.users.values())]
 
     def get_conf(self, guild: discord.Guild | int) -> GuildSettings:
         gid = guild if isinstance(guild, int) else guild.id
-        return self.configs.setdefault(gid, GuildSettings())
+        conf = self.configs.setdefault(gid, GuildSettings())
+        if self._world_records is not None and conf._world_hook is None:
+            conf._world_hook = partial(self._world_records.offer, gid)
+        return conf
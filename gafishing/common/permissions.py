@@ -0,0 +1,92 @@
+"""
+Short-lived cache of Red admin status per member.
+
+Fishing commands outside the allowed channels are still open to admins, and
+asking Red whether a member is an admin resolves the guild's admin roles on
+every call. The cache remembers the answer per (guild, member) for a short
+TTL. Member role changes and guild role edits drop entries early; the TTL
+bounds how long a change to Red's admin role settings (which raises no event)
+can go unnoticed.
+"""
+
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+import discord
+
+log = logging.getLogger("red.greenacresfishing.permissions")
+
+DEFAULT_TTL = 60.0
+
+
+class PermissionCache:
+    """Admin status per (guild, member), expiring after `ttl` seconds."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        # guild id -> member id -> (expires at, is admin)
+        self._entries: Dict[int, Dict[int, Tuple[float, bool]]] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id: int, member_id: int) -> Optional[bool]:
+        """Cached admin status, or None if unknown or expired."""
+        entry = self._entries.get(guild_id, {}).get(member_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def is_known_non_admin(self, guild_id: int, member_id: int) -> bool:
+        """True if the member is cached as not an admin, counted as a hit."""
+        if self.get(guild_id, member_id) is False:
+            self.hits += 1
+            return True
+        return False
+
+    def set(self, guild_id: int, member_id: int, is_admin: bool) -> None:
+        members = self._entries.setdefault(guild_id, {})
+        now = time.monotonic()
+        if len(members) >= 1000:
+            # Drop whatever has expired before the guild's table grows further
+            for mid in [mid for mid, (expires, _) in members.items() if expires < now]:
+                del members[mid]
+        members[member_id] = (now + self.ttl, is_admin)
+
+    def invalidate(self, guild_id: int, member_id: Optional[int] = None) -> None:
+        """Forget one member, or the whole guild if no member is given."""
+        if member_id is None:
+            self._entries.pop(guild_id, None)
+        else:
+            self._entries.get(guild_id, {}).pop(member_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def is_admin(self, bot, member: discord.Member) -> bool:
+        """Manage Server / Administrator permission or Red admin status, with the Red check cached."""
+        if member.guild_permissions.manage_guild or member.guild_permissions.administrator:
+            return True
+        cached = self.get(member.guild.id, member.id)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        try:
+            is_admin = bool(await bot.is_admin(member))
+        except Exception as e:
+            log.debug(f"Red admin check failed for {member.id}: {e}")
+            return False
+        self.set(member.guild.id, member.id, is_admin)
+        return is_admin
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": sum(len(members) for members in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
@@ -0,0 +1,75 @@
+"""
+Per-species fish record boards for one guild.
+
+The species leaderboards used to scan every user's `fish_records` and sort on
+each open. The index keeps one sorted board per (species, weight/length) and is
+updated by `User.update_fish_record` whenever a personal record improves, so
+reading a page is a slice.
+"""
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .models import User
+
+RECORD_KINDS = ("weight", "length")
+
+
+class RecordIndex:
+    """Sorted personal bests per species, highest first."""
+
+    def __init__(self):
+        # (fish_id, kind) -> [(-value, user_id)] kept sorted ascending
+        self._boards: Dict[Tuple[str, str], List[Tuple[float, int]]] = {}
+        # (fish_id, kind) -> {user_id: value} so an entry can be found for removal
+        self._values: Dict[Tuple[str, str], Dict[int, float]] = {}
+
+    @classmethod
+    def build(cls, users: Dict[int, "User"]) -> "RecordIndex":
+        """Index every user's records (one full scan) and hook the users up for updates."""
+        index = cls()
+        for uid, user in users.items():
+            index.bind(uid, user)
+            for fish_id, record in user.fish_records.items():
+                for kind in RECORD_KINDS:
+                    value = record.get(f"max_{kind}", 0)
+                    if value > 0:
+                        key = (fish_id, kind)
+                        index._boards.setdefault(key, []).append((-value, uid))
+                        index._values.setdefault(key, {})[uid] = value
+        for board in index._boards.values():
+            board.sort()
+        return index
+
+    def bind(self, uid: int, user: "User") -> None:
+        """Route this user's record improvements into the index."""
+        user._record_hook = lambda fish_id, kind, value: self.update(uid, fish_id, kind, value)
+
+    def update(self, uid: int, fish_id: str, kind: str, value: float) -> None:
+        key = (fish_id, kind)
+        board = self._boards.setdefault(key, [])
+        values = self._values.setdefault(key, {})
+        old = values.get(uid)
+        if old is not None:
+            pos = bisect_left(board, (-old, uid))
+            if pos < len(board) and board[pos] == (-old, uid):
+                del board[pos]
+        values[uid] = value
+        insort(board, (-value, uid))
+
+    def count(self, fish_id: str, kind: str) -> int:
+        return len(self._boards.get((fish_id, kind), ()))
+
+    def page(self, fish_id: str, kind: str, start: int, size: int) -> List[Tuple[int, float]]:
+        """(user_id, value) pairs for ranks start+1 .. start+size."""
+        board = self._boards.get((fish_id, kind), [])
+        return [(uid, -neg) for neg, uid in board[start:start + size]]
+
+    def holder(self, fish_id: str, kind: str) -> Optional[Tuple[int, float]]:
+        """Current (user_id, value) record holder, or None if nobody has caught one."""
+        board = self._boards.get((fish_id, kind))
+        if not board:
+            return None
+        neg, uid = board[0]
+        return (uid, -neg)
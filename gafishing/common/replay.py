@@ -0,0 +1,98 @@
+"""
+Replays of traced fishing sessions.
+
+A session traced in debug mode records the inputs and outcome of every random
+draw it made (see `FishingSession.trace`). Feeding those inputs back through the
+real helpers with a generator seeded the same way reproduces every outcome, so
+the first step that comes out differently points at a change in the mechanics
+or the databases since the session was played. Since nothing depends on timing
+or player input, a trace is also a fixed workload for benchmarking the helpers.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..commands.helper_functions import (
+    FishingSession,
+    cast_line,
+    check_for_bite,
+    fish_strikes,
+    generate_fish_size,
+    get_fight_event,
+)
+from ..databases.fish import FISH_DATABASE
+
+# Session fields restored from a step's inputs before replaying it
+SESSION_FIELDS = ("location", "water_type", "rod_id", "line_distance", "max_distance", "fish_id", "last_event_was_tension")
+
+
+@dataclass(slots=True)
+class ReplayStep:
+    step: str
+    expected: Any
+    actual: Any
+
+    @property
+    def matches(self) -> bool:
+        return self.expected == self.actual
+
+
+def _restore(session: FishingSession, inputs: Dict[str, Any]) -> None:
+    for name in SESSION_FIELDS:
+        if name in inputs:
+            setattr(session, name, inputs[name])
+
+
+def _cast(session: FishingSession, inputs: Dict[str, Any]) -> int:
+    cast_line(session)
+    return session.line_distance
+
+
+def _bite(session: FishingSession, inputs: Dict[str, Any]) -> bool:
+    interested, _ = check_for_bite(
+        session, inputs["season"], inputs["weather_type"], inputs["bait_id"], inputs["luck_modifier"]
+    )
+    return interested
+
+
+def _strike(session: FishingSession, inputs: Dict[str, Any]) -> Optional[str]:
+    fish_id, _, _ = fish_strikes(session, inputs["season"], inputs["weather_type"], inputs["bait_id"])
+    return fish_id
+
+
+def _size(session: FishingSession, inputs: Dict[str, Any]) -> list:
+    fish_data = FISH_DATABASE.get(inputs["fish_id"], {})
+    return list(generate_fish_size(fish_data, inputs["luck_bonus"], session.rng))
+
+
+def _fight(session: FishingSession, inputs: Dict[str, Any]) -> str:
+    _, msg, _ = get_fight_event(session)
+    return msg
+
+
+STEPS: Dict[str, Callable[[FishingSession, Dict[str, Any]], Any]] = {
+    "cast": _cast,
+    "bite": _bite,
+    "strike": _strike,
+    "size": _size,
+    "fight": _fight,
+}
+
+
+def replay(seed: int, trace: Iterable[tuple]) -> List[ReplayStep]:
+    """Re-run every traced draw from `seed`, returning expected and actual outcomes per step."""
+    session = FishingSession()
+    session.reseed(seed)
+    results = []
+    for step, inputs, expected in trace:
+        _restore(session, inputs)
+        results.append(ReplayStep(step, expected, STEPS[step](session, inputs)))
+    return results
+
+
+def first_mismatch(results: List[ReplayStep]) -> Optional[int]:
+    """Index of the first step that didn't reproduce, or None if all of them did."""
+    for i, result in enumerate(results):
+        if not result.matches:
+            return i
+    return None
@@ -0,0 +1,194 @@
+"""
+Central scheduler for fishing session deadlines.
+
+Active fishing sessions used to each keep their own sleeping asyncio tasks
+(bite check, hook timeout, fight events, tension release). The scheduler owns
+all of those deadlines instead: one background task advances a hashed timing
+wheel and dispatches everything that came due in the same tick as one batch.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+log = logging.getLogger("red.greenacresfishing.scheduler")
+
+# Wheel resolution. Fishing deadlines are 3-10 seconds, a quarter second is plenty.
+DEFAULT_TICK = 0.25
+# 512 slots * 0.25s = 128 seconds before a timer needs more than one lap
+DEFAULT_SLOTS = 512
+
+
+class ScheduledEvent:
+    """One pending deadline. Each key has at most one pending event."""
+
+    __slots__ = ("key", "deadline", "callback", "args", "slot", "rounds")
+
+    def __init__(self, key: Hashable, deadline: float, callback: Callable[..., Awaitable[Any]], args: tuple):
+        self.key = key
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.slot = 0
+        self.rounds = 0
+
+
+class SessionScheduler:
+    """
+    Hashed timing wheel for session phase transitions.
+
+    `schedule(key, delay, callback)` replaces whatever was pending for `key`, so a
+    session (keyed by its view) only ever has one live deadline: the next bite
+    check, hook timeout, fight event or tension release. Scheduling and
+    cancelling are O(1). When nothing is pending the runner sleeps on an event
+    instead of ticking.
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS):
+        self.tick = tick
+        self.slots = slots
+        self._wheel: List[Dict[Hashable, ScheduledEvent]] = [dict() for _ in range(slots)]
+        self._events: Dict[Hashable, ScheduledEvent] = {}
+        self._cursor = 0  # Index of the next slot to fire
+        self._next_tick_at = time.monotonic()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._batches: set[asyncio.Task] = set()
+
+        # Stats
+        self.dispatched = 0
+        self.batches = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._events
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._runner is None or self._runner.done():
+            self._next_tick_at = time.monotonic()
+            self._runner = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop ticking and drop every pending deadline."""
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+        for batch in list(self._batches):
+            batch.cancel()
+        self._batches.clear()
+        for slot in self._wheel:
+            slot.clear()
+        self._events.clear()
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[..., Awaitable[Any]], *args) -> None:
+        """Run `await callback(*args)` in roughly `delay` seconds, replacing any pending event for `key`."""
+        self.cancel(key)
+
+        event = ScheduledEvent(key, time.monotonic() + delay, callback, args)
+        if not self._events:
+            # Wheel was idle, realign it with the clock before placing the event
+            self._next_tick_at = time.monotonic()
+        # Round up so an event never fires early, at worst one tick late
+        ticks = max(0, math.ceil(delay / self.tick))
+        event.slot = (self._cursor + ticks) % self.slots
+        event.rounds = ticks // self.slots
+        self._wheel[event.slot][key] = event
+        self._events[key] = event
+        self._wakeup.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        event = self._events.pop(key, None)
+        if event is None:
+            return False
+        self._wheel[event.slot].pop(key, None)
+        return True
+
+    def time_left(self, key: Hashable) -> Optional[float]:
+        event = self._events.get(key)
+        if event is None:
+            return None
+        return max(0.0, event.deadline - time.monotonic())
+
+    # -------------------------------------------------------------------------
+    # Runner
+    # -------------------------------------------------------------------------
+
+    def _advance(self) -> List[ScheduledEvent]:
+        """Fire the slot under the cursor and move on. Returns the events that came due."""
+        slot = self._wheel[self._cursor]
+        due = []
+        for key, event in list(slot.items()):
+            if event.rounds > 0:
+                event.rounds -= 1
+                continue
+            del slot[key]
+            del self._events[key]
+            due.append(event)
+        self._cursor = (self._cursor + 1) % self.slots
+        return due
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self._events:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                delay = self._next_tick_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # Catch up on any ticks missed while the loop was busy
+                due: List[ScheduledEvent] = []
+                now = time.monotonic()
+                while self._next_tick_at <= now and self._events:
+                    due.extend(self._advance())
+                    self._next_tick_at += self.tick
+
+                if due:
+                    self._dispatch(due)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.exception("Session scheduler tick failed", exc_info=e)
+
+    def _dispatch(self, due: List[ScheduledEvent]) -> None:
+        """Run one tick's callbacks concurrently in a single batch task."""
+        self.batches += 1
+        self.dispatched += len(due)
+        batch = asyncio.create_task(self._run_batch(due))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, due: List[ScheduledEvent]) -> None:
+        results = await asyncio.gather(
+            *(event.callback(*event.args) for event in due),
+            return_exceptions=True,
+        )
+        for event, result in zip(due, results):
+            if isinstance(result, Exception):
+                self.errors += 1
+                log.error(f"Scheduled session event for {event.key!r} failed", exc_info=result)
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._events),
+            "in_flight_batches": len(self._batches),
+            "dispatched": self.dispatched,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
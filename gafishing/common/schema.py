@@ -0,0 +1,35 @@
+"""
+Schema versions for stored Greenacres Fishing users.
+
+Structural changes that the models can't load without (list-based gear
+inventories) are converted while parsing, see `migrate_gear_inventories`.
+Everything else is a numbered step here, applied lazily by
+`GuildSettings.get_user` and by the background sweep started on load.
+"""
+
+from ..databases.items import RODS_DATABASE
+from .migrations import Migrations
+
+USER_MIGRATIONS = Migrations("user")
+
+
+@USER_MIGRATIONS.register(1)
+def _clean_gear(user) -> None:
+    """Drop deprecated gear keys and cap rod durability to the database max."""
+    for item in list(user.current_rod_inventory.values()) + list(user.current_lure_inventory.values()):
+        item.pop("name", None)
+        item.pop("catch_bonus", None)
+    for rod in user.current_rod_inventory.values():
+        rod_id = rod.get("rod_id")
+        if rod_id in RODS_DATABASE:
+            max_durability = RODS_DATABASE[rod_id].get("durability", 50)
+            if rod.get("durability", 0) > max_durability:
+                rod["durability"] = max_durability
+
+
+@USER_MIGRATIONS.register(2)
+def _lure_uses(user) -> None:
+    """Give every lure stack uses tracking so readers don't have to check on each access."""
+    from ..commands.helper_functions import ensure_lure_uses
+    for lure in user.current_lure_inventory.values():
+        ensure_lure_uses(lure)
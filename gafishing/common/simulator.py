@@ -0,0 +1,305 @@
+"""
+Offline catch simulator for Greenacres Fishing.
+
+Mirrors the draws made during a fishing session (`calculate_cast_distance`,
+`check_fish_interest`, `fish_strikes`/`select_fish`, `get_fight_event` and
+`generate_fish_size`) but does them in bulk with NumPy, so millions of casts
+per set of conditions finish in seconds.
+
+The simulated player is ideal: they never retrieve line while waiting, react
+to every prompt after a fixed reaction time, set every hook in time and never
+reel during high tension. Rates are therefore upper bounds for real players.
+
+Everything in here is synchronous and returns plain dicts so grid points can be
+sent to a process pool with `loop.run_in_executor`.
+"""
+
+import csv
+import io
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..commands.helper_functions import get_eligible_fish
+
+# Session timings (seconds), see views/fishing_view.py ActiveFishingView
+BITE_CHECK_INTERVAL = 10.0
+FIGHT_EVENT_INTERVAL = 3.5
+TENSION_RELEASE_DELAY = 3.0
+DEFAULT_REACTION_TIME = 1.0
+
+# Fish must strike within this many follows or the cast counts as stranded
+MAX_FOLLOWS = 64
+
+# Representative line integrity for each rarity tier of `get_allowed_rarities`
+INTEGRITY_TIERS = (1.0, 0.6, 0.4, 0.2)
+
+RARITIES = ("common", "uncommon", "rare", "epic", "legendary")
+
+BASE_CAST_DISTANCES = np.arange(20, 101, 5)
+EXTRA_CAST_DISTANCES = np.arange(20, 46, 5)
+
+# Casts drawn at once, keeps memory flat for multi-million cast runs
+CHUNK_SIZE = 250_000
+
+
+def build_tables(location: str, water_type: str, season: str, weather: str, bait_id: str, rod_id: Optional[str]) -> dict:
+    """Flatten the eligible fish for one set of conditions into arrays, one weight table per rarity tier."""
+    species: List[str] = []
+    species_index: Dict[str, int] = {}
+    fish_rows: List[dict] = []
+    tiers = []
+    bite_base = []
+
+    for integrity in INTEGRITY_TIERS:
+        eligible = get_eligible_fish(location, water_type, season, weather, bait_id, rod_id, integrity)
+        members = []
+        weights = []
+        for fish_id, fish_data, weight in eligible:
+            if fish_id not in species_index:
+                species_index[fish_id] = len(species)
+                species.append(fish_id)
+                fish_rows.append(fish_data)
+            members.append(species_index[fish_id])
+            weights.append(weight)
+        tiers.append((np.array(members, dtype=np.int64), np.cumsum(np.array(weights, dtype=np.float64))))
+        # check_fish_interest: 30% base, +2% per eligible fish capped at 1.5x
+        bite_base.append(0.30 * min(1.0 + len(eligible) * 0.02, 1.5) if eligible else 0.0)
+
+    return {
+        "species": species,
+        "tiers": tiers,
+        "bite_base": np.array(bite_base, dtype=np.float64),
+        "min_weight": np.array([f.get("min_weight_oz", 1.0) for f in fish_rows], dtype=np.float64),
+        "max_weight": np.array([f.get("max_weight_oz", 10.0) for f in fish_rows], dtype=np.float64),
+        "max_length": np.array([f.get("max_length_inches", 10.0) for f in fish_rows], dtype=np.float64),
+        "fishpoints": np.array([f.get("base_fishpoints", 10) for f in fish_rows], dtype=np.int64),
+        "rarity": np.array([RARITIES.index(f.get("rarity", "common")) for f in fish_rows], dtype=np.int64),
+    }
+
+
+def line_integrity(distance: np.ndarray, cast: np.ndarray, grace_feet: int = 15) -> np.ndarray:
+    """Vectorized `calculate_line_integrity`."""
+    reeled = cast - distance
+    remaining = cast - grace_feet
+    integrity = 1.0 - (reeled - grace_feet) / np.maximum(remaining, 1) * 0.8
+    return np.where((reeled <= grace_feet) | (remaining <= 0), 1.0, np.maximum(0.2, integrity))
+
+
+def integrity_tier(integrity: np.ndarray) -> np.ndarray:
+    """Index into INTEGRITY_TIERS matching `get_allowed_rarities`."""
+    return np.select([integrity >= 0.8, integrity >= 0.5, integrity >= 0.3], [0, 1, 2], 3)
+
+
+def triangular(rng: np.random.Generator, low: np.ndarray, high: np.ndarray, mode: np.ndarray) -> np.ndarray:
+    """Same inverse CDF as `random.triangular`, tolerant of low == high."""
+    u = rng.random(low.shape)
+    span = high - low
+    c = np.divide(mode - low, span, out=np.full(low.shape, 0.5), where=span > 0)
+    left = low + np.sqrt(u * span * (mode - low))
+    right = high - np.sqrt((1.0 - u) * span * (high - mode))
+    return np.where(u < c, left, right)
+
+
+def draw_sizes(rng: np.random.Generator, tables: dict, fish: np.ndarray, luck: int):
+    """Vectorized `generate_fish_size`. Returns (weight, length, earns_token) arrays."""
+    n = fish.size
+    min_w = tables["min_weight"][fish]
+    max_w = tables["max_weight"][fish]
+    max_l = tables["max_length"][fish]
+
+    trophy = rng.random(n) < 0.0025 + luck * 0.0001
+    roll = rng.random(n)
+    force_weight = trophy & ((roll < 0.33) | (roll >= 0.66))
+    force_length = trophy & (roll >= 0.33)
+
+    mode_ratio = np.where(trophy, 0.7, min(0.3 + luck * 0.02, 0.5))
+    weight = triangular(rng, min_w, max_w, min_w + (max_w - min_w) * mode_ratio)
+    weight = np.where(force_weight, max_w, weight)
+
+    span = max_w - min_w
+    ratio = np.divide(weight - min_w, span, out=np.full(n, 0.5), where=span > 0)
+    min_l = max_l * 0.4
+    length = (min_l + (max_l - min_l) * ratio) * rng.uniform(0.95, 1.05, n)
+    length = np.where(force_length, max_l, np.minimum(length, max_l))
+
+    weight = np.round(weight, 1)
+    length = np.round(length, 1)
+    # land_the_fish awards a FishMaster token for max weight OR max length
+    earns_token = (weight == max_w) | (length == max_l)
+    return weight, length, earns_token
+
+
+def simulate_chunk(rng: np.random.Generator, tables: dict, n: int, extra_distance: bool, luck: int, reaction: float) -> dict:
+    """Simulate n casts from cast click to landing."""
+    cast = rng.choice(BASE_CAST_DISTANCES, n)
+    if extra_distance:
+        cast = cast + rng.choice(EXTRA_CAST_DISTANCES, n)
+    distance = cast.copy()
+    elapsed = np.full(n, reaction)  # Cast click
+    fish = np.full(n, -1, dtype=np.int64)
+
+    # Waiting: bite checks every 10s until something follows, retrieve, then 50/50 strike
+    pending = np.arange(n)
+    for _ in range(MAX_FOLLOWS):
+        if pending.size == 0:
+            break
+        integrity = line_integrity(distance[pending], cast[pending])
+        p_bite = tables["bite_base"][integrity_tier(integrity)] * integrity
+        biting = p_bite > 0
+        pending = pending[biting]
+        if pending.size == 0:
+            break
+        checks = rng.geometric(p_bite[biting])
+        elapsed[pending] += checks * BITE_CHECK_INTERVAL + reaction
+        distance[pending] = np.maximum(distance[pending] - 5, 0)
+
+        strikes = rng.random(pending.size) < 0.5
+        struck = pending[strikes]
+        tier = integrity_tier(line_integrity(distance[struck], cast[struck]))
+        landed_on = np.full(struck.size, -1, dtype=np.int64)
+        for t, (members, cumulative) in enumerate(tables["tiers"]):
+            mask = tier == t
+            count = int(mask.sum())
+            if count and members.size:
+                roll = rng.random(count) * cumulative[-1]
+                idx = np.minimum(np.searchsorted(cumulative, roll, side="right"), members.size - 1)
+                landed_on[mask] = members[idx]
+        fish[struck] = landed_on
+        pending = np.concatenate((pending[~strikes], struck[landed_on < 0]))
+
+    caught = np.flatnonzero(fish >= 0)
+
+    # Fight: hook set reels 5ft, then events every 3.5s until the line is in
+    line = np.maximum(distance[caught] - 5, 0)
+    fight_time = np.full(caught.size, reaction + FIGHT_EVENT_INTERVAL)
+    at_boat = line <= 0
+    fight_time[at_boat] = reaction * 2  # No more events, one reel lands it
+    active = ~at_boat
+    last_tension = np.zeros(caught.size, dtype=bool)
+    while active.any():
+        d = line[active]
+        p_tension = np.where(d >= 50, 0.25, np.where(d <= 0, 0.75, 0.75 - (d / 50.0) * 0.5))
+        tension = ~last_tension[active] & (rng.random(d.size) < p_tension)
+
+        idx = np.flatnonzero(active)
+        fight_time[idx[tension]] += TENSION_RELEASE_DELAY + FIGHT_EVENT_INTERVAL
+        reel = idx[~tension]
+        line[reel] -= 5
+        fight_time[reel] += reaction
+        landed = reel[line[reel] <= 0]
+        fight_time[reel[line[reel] > 0]] += FIGHT_EVENT_INTERVAL
+        last_tension[idx] = tension
+        active[landed] = False
+
+    # Continue Fishing click before the next cast
+    elapsed[caught] += fight_time + reaction
+
+    species = fish[caught]
+    weight, length, earns_token = draw_sizes(rng, tables, species, luck)
+    resolved = fish >= 0
+    return {
+        "casts": int(n),
+        "stranded": int(n - resolved.sum()),
+        "seconds": float(elapsed[resolved].sum()),
+        "species_counts": np.bincount(species, minlength=len(tables["species"])),
+        "tokens": int(earns_token.sum()),
+        "fishpoints": int(tables["fishpoints"][species].sum()),
+        "weight_oz": float(weight.sum()),
+    }
+
+
+def simulate_point(point: dict, casts: int, seed: Optional[int] = None) -> dict:
+    """
+    Simulate `casts` casts for one grid point.
+
+    `point` holds location, water_type, season, weather, bait, rod, luck and reaction.
+    This is the process pool entry point.
+    """
+    rng = np.random.default_rng(seed)
+    tables = build_tables(
+        point["location"], point["water_type"], point["season"], point["weather"], point["bait"], point["rod"]
+    )
+    extra_distance = point["location"].lower() in ("ocean", "river")
+    reaction = point.get("reaction", DEFAULT_REACTION_TIME)
+
+    species_counts = np.zeros(len(tables["species"]), dtype=np.int64)
+    totals = {"casts": 0, "stranded": 0, "seconds": 0.0, "tokens": 0, "fishpoints": 0, "weight_oz": 0.0}
+    remaining = casts
+    while remaining > 0:
+        n = min(remaining, CHUNK_SIZE)
+        chunk = simulate_chunk(rng, tables, n, extra_distance, point["luck"], reaction)
+        species_counts += chunk.pop("species_counts")
+        for key, value in chunk.items():
+            totals[key] += value
+        remaining -= n
+
+    catches = int(species_counts.sum())
+    hours = totals["seconds"] / 3600
+    rarity_counts = np.bincount(tables["rarity"], weights=species_counts, minlength=len(RARITIES)) if catches else np.zeros(len(RARITIES))
+
+    top = np.argsort(species_counts)[::-1][:5]
+    return {
+        "point": point,
+        "casts": totals["casts"],
+        "stranded": totals["stranded"],
+        "catches": catches,
+        "hours": hours,
+        "catches_per_hour": catches / hours if hours else 0.0,
+        "minutes_per_catch": (totals["seconds"] / 60 / catches) if catches else None,
+        "token_rate": totals["tokens"] / catches if catches else 0.0,
+        "tokens_per_hour": totals["tokens"] / hours if hours else 0.0,
+        "fishpoints_per_hour": totals["fishpoints"] / hours if hours else 0.0,
+        "mean_weight_oz": totals["weight_oz"] / catches if catches else 0.0,
+        "rarity_rates": {r: (float(c) / catches if catches else 0.0) for r, c in zip(RARITIES, rarity_counts)},
+        "rarity_per_hour": {r: (float(c) / hours if hours else 0.0) for r, c in zip(RARITIES, rarity_counts)},
+        "top_species": [
+            (tables["species"][i], float(species_counts[i]) / catches)
+            for i in top if catches and species_counts[i]
+        ],
+    }
+
+
+CSV_FIELDS = [
+    "location", "water_type", "season", "weather", "bait", "rod", "luck", "reaction",
+    "casts", "catches", "stranded", "hours", "catches_per_hour", "minutes_per_catch",
+    "token_rate", "tokens_per_hour", "fishpoints_per_hour", "mean_weight_oz",
+] + [f"{r}_rate" for r in RARITIES] + [f"{r}_per_hour" for r in RARITIES]
+
+
+def to_csv(results: List[dict]) -> str:
+    """One row per grid point."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for result in results:
+        point = result["point"]
+        row = {key: point.get(key) for key in ("location", "water_type", "season", "weather", "bait", "rod", "luck", "reaction")}
+        for key in ("casts", "catches", "stranded"):
+            row[key] = result[key]
+        for key in ("hours", "catches_per_hour", "token_rate", "tokens_per_hour", "fishpoints_per_hour", "mean_weight_oz"):
+            row[key] = f"{result[key]:.6g}"
+        row["minutes_per_catch"] = f"{result['minutes_per_catch']:.4g}" if result["minutes_per_catch"] else ""
+        for rarity in RARITIES:
+            row[f"{rarity}_rate"] = f"{result['rarity_rates'][rarity]:.6g}"
+            row[f"{rarity}_per_hour"] = f"{result['rarity_per_hour'][rarity]:.6g}"
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def format_table(results: List[dict], limit: int = 12) -> str:
+    """Render grid point results as a monospace table."""
+    lines = [f"{'Conditions':<30}{'C/hr':>6}{'Leg%':>7}{'Tok%':>6}{'FP/hr':>7}"]
+    for result in results[:limit]:
+        point = result["point"]
+        label = f"{point['location'][:5]} {point['season'][:3]} {point['weather'][:6]} {point['bait'][:8]} L{point['luck']}"
+        lines.append(
+            f"{label[:30]:<30}"
+            f"{result['catches_per_hour']:>6.1f}"
+            f"{result['rarity_rates']['legendary'] * 100:>7.3f}"
+            f"{result['token_rate'] * 100:>6.2f}"
+            f"{result['fishpoints_per_hour']:>7.0f}"
+        )
+    if len(results) > limit:
+        lines.append(f"... {len(results) - limit} more grid point(s) in the CSV")
+    return "\n".join(lines)
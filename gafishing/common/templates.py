@@ -0,0 +1,79 @@
+"""
+Prebuilt embeds and select options for the static parts of menus.
+
+The help pages, the fish list and the shop listings are built from the item
+and fish databases, which don't change while the cog is loaded, yet they were
+rebuilt field by field every time someone opened a menu. Templates are built
+once per process, keyed by page or category, and handed out as copies so the
+per-user parts (FishPoints balance, token locks) can be patched in without
+touching the cached version.
+"""
+
+from typing import Callable, Dict, Hashable, List
+
+import discord
+
+
+def _copy_embed_dict(data: dict) -> dict:
+    """Copy an embed dict deep enough that editing the embed built from it can't reach the template."""
+    data = dict(data)
+    for key, value in data.items():
+        if isinstance(value, dict):
+            data[key] = dict(value)
+        elif isinstance(value, list):
+            data[key] = [dict(item) for item in value]
+    return data
+
+
+class MenuTemplates:
+    """Process-wide cache of embed and select option templates."""
+
+    def __init__(self):
+        self._embeds: Dict[Hashable, dict] = {}
+        self._options: Dict[Hashable, List[discord.SelectOption]] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, key: Hashable, build: Callable[[], discord.Embed]) -> discord.Embed:
+        """A fresh copy of the embed stored under `key`, calling `build` the first time."""
+        data = self._embeds.get(key)
+        if data is None:
+            self.misses += 1
+            data = self._embeds[key] = build().to_dict()
+        else:
+            self.hits += 1
+        return discord.Embed.from_dict(_copy_embed_dict(data))
+
+    def options(self, key: Hashable, build: Callable[[], List[discord.SelectOption]]) -> List[discord.SelectOption]:
+        """
+        The select options stored under `key`, calling `build` the first time.
+
+        The list is a copy but the options themselves are shared, so callers
+        must not edit them.
+        """
+        options = self._options.get(key)
+        if options is None:
+            self.misses += 1
+            options = self._options[key] = list(build())
+        else:
+            self.hits += 1
+        return list(options)
+
+    def clear(self) -> None:
+        self._embeds.clear()
+        self._options.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "embeds": len(self._embeds),
+            "options": len(self._options),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+TEMPLATES = MenuTemplates()
@@ -0,0 +1,140 @@
+"""
+Registry of live menus, capped per user.
+
+Every menu holds the cog, its author and its message until it is stopped or
+its timeout runs out, and fishing menus also keep a scheduled event. Nothing
+stopped one user from opening menu after menu, so the registry keeps each
+user's menus in the order they were opened and closes the oldest once a user
+goes over the guild's limit, the same way a timeout would (buttons disabled on
+the message). Views can refuse eviction through `can_evict()`, so a fishing
+session with a line in the water is never closed from under its player.
+
+Views are counted from construction but the limit is only enforced once a view
+is attached to its message (`attach`). Menus navigate by building the next view
+inside the current one's button callback and swapping it onto the same
+message, so views on that message are the ones being replaced and are never
+evicted for it.
+Views that finished without unregistering (some override `on_timeout`) are
+swept out as the registry is used.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, Iterator, Set, Tuple
+
+import discord
+
+log = logging.getLogger("red.greenacresfishing.views")
+
+DEFAULT_MAX_VIEWS_PER_USER = 5
+# Full sweep of finished views after this many registrations
+SWEEP_EVERY = 100
+
+Owner = Tuple[int, int]  # (guild id, user id)
+
+
+def _can_evict(view: discord.ui.View) -> bool:
+    can_evict = getattr(view, "can_evict", None)
+    return can_evict() if can_evict is not None else True
+
+
+def _on_message(view: discord.ui.View, message_id: int) -> bool:
+    message = getattr(view, "message", None)
+    return message is not None and message.id == message_id
+
+
+class ViewRegistry:
+    """Live views per (guild, user), oldest first."""
+
+    def __init__(self):
+        # owner -> views in the order they were opened (dict as an ordered set)
+        self._views: Dict[Owner, Dict[discord.ui.View, None]] = {}
+        self._owners: Dict[discord.ui.View, Owner] = {}
+        self._adds_since_sweep = 0
+        # Eviction closes in flight, kept so they aren't garbage collected
+        self._closing: Set[asyncio.Task] = set()
+
+        # Stats
+        self.evicted = 0
+
+    def add(self, owner: Owner, view: discord.ui.View) -> None:
+        """Register a view. The limit is enforced when it is attached to a message."""
+        self._adds_since_sweep += 1
+        if self._adds_since_sweep >= SWEEP_EVERY:
+            self.sweep()
+
+        self._views.setdefault(owner, {})[view] = None
+        self._owners[view] = owner
+
+    def attach(self, view: discord.ui.View, message: discord.Message, limit: int = DEFAULT_MAX_VIEWS_PER_USER) -> None:
+        """
+        A registered view now shows on `message`. Closes the owner's oldest
+        evictable views past `limit` (0 for no limit), leaving alone any view on
+        the same message since `view` is replacing it.
+        """
+        owner = self._owners.get(view)
+        if owner is None:
+            return
+        views = self._views[owner]
+        for finished in [v for v in views if v.is_finished()]:
+            self.discard(finished)
+        if view not in views:
+            return
+
+        if limit and len(views) > limit:
+            evictable = [
+                v for v in views
+                if v is not view and _can_evict(v) and not _on_message(v, message.id)
+            ]
+            for oldest in evictable[:len(views) - limit]:
+                self.discard(oldest)
+                self.evicted += 1
+                self._close(oldest)
+
+    def _close(self, view: discord.ui.View) -> None:
+        """Stop an evicted view and run its timeout handling so its message shows it closed."""
+        try:
+            view.stop()
+        except Exception as e:
+            log.error(f"Error stopping evicted {type(view).__name__}: {e}")
+        task = asyncio.get_running_loop().create_task(view.on_timeout())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def discard(self, view: discord.ui.View) -> None:
+        owner = self._owners.pop(view, None)
+        if owner is None:
+            return
+        views = self._views.get(owner)
+        if views is not None:
+            views.pop(view, None)
+            if not views:
+                del self._views[owner]
+
+    def sweep(self) -> int:
+        """Drop every view that has already finished. Returns how many were dropped."""
+        self._adds_since_sweep = 0
+        finished = [view for view in self._owners if view.is_finished()]
+        for view in finished:
+            self.discard(view)
+        return len(finished)
+
+    def counts(self) -> Dict[str, int]:
+        """Live views per view class, most common first."""
+        self.sweep()
+        return dict(Counter(type(view).__name__ for view in self._owners).most_common())
+
+    def users(self) -> int:
+        """How many (guild, user) owners have at least one live view."""
+        return len(self._views)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def __iter__(self) -> Iterator[discord.ui.View]:
+        return iter(list(self._owners))
+
+    def clear(self) -> None:
+        self._views.clear()
+        self._owners.clear()
@@ -4,6 +4,7 @@ Weather is influenced by season and time of day.
 """
 
 import random
+from collections import deque
 from enum import Enum
 from typing import TypedDict
 
@@ -117,10 +118,14 @@ TIME_TEMP_MODIFIERS: dict[str, int] = {
 }
 
 
-def _weighted_random_choice(weights: dict[WeatherType, int]) -> WeatherType:
+# How many game hours of weather each guild keeps precomputed
+FORECAST_HOURS = 24
+
+
+def _weighted_random_choice(weights: dict[WeatherType, int], rng: random.Random) -> WeatherType:
     """Select a random weather type based on weights."""
     total = sum(weights.values())
-    r = random.randint(1, total)
+    r = rng.randint(1, total)
     cumulative = 0
     for weather_type, weight in weights.items():
         cumulative += weight
@@ -130,7 +135,12 @@ def _weighted_random_choice(weights: dict[WeatherType, int]) -> WeatherType:
     return WeatherType.CLEAR
 
 
-def get_weather(season: str, time_of_day: str, seed: int | None = None) -> Weather:
+def get_weather(
+    season: str,
+    time_of_day: str,
+    seed: int | None = None,
+    rng: random.Random | None = None
+) -> Weather:
     """
     Generate weather based on season and time of day.
     
@@ -138,44 +148,44 @@ def get_weather(season: str, time_of_day: str, seed: int | None = None) -> Weath
         season: Current season name (Spring, Summer, Fall, Winter)
         time_of_day: Current time of day name (Dawn, Morning, etc.)
         seed: Optional seed for reproducible weather (e.g., based on game day)
+        rng: Optional Random instance to draw from. Seeded with `seed` if both are given.
+             The global `random` module is never reseeded.
     
     Returns:
         Weather dict with all weather information
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
+    elif seed is not None:
+        rng.seed(seed)
     
     # Get weather weights for the season
     weights = SEASON_WEATHER_WEIGHTS.get(season, SEASON_WEATHER_WEIGHTS["Spring"])
-    weather_type = _weighted_random_choice(weights)
+    weather_type = _weighted_random_choice(weights, rng)
     
     # Calculate temperature
     temp_range = SEASON_TEMP_RANGES.get(season, (50, 75))
-    base_temp = random.randint(temp_range[0], temp_range[1])
+    base_temp = rng.randint(temp_range[0], temp_range[1])
     time_modifier = TIME_TEMP_MODIFIERS.get(time_of_day, 0)
     temperature = base_temp + time_modifier
     
     # Adjust temperature for certain weather conditions
     if weather_type == WeatherType.HEATWAVE:
-        temperature = max(temperature, 90) + random.randint(5, 15)
+        temperature = max(temperature, 90) + rng.randint(5, 15)
     elif weather_type == WeatherType.SNOW:
         temperature = min(temperature, 32)
     elif weather_type in (WeatherType.RAIN, WeatherType.HEAVY_RAIN, WeatherType.THUNDERSTORM):
-        temperature -= random.randint(3, 8)
+        temperature -= rng.randint(3, 8)
     
     # Generate wind speed
     if weather_type == WeatherType.WINDY:
-        wind_speed = random.randint(20, 40)
+        wind_speed = rng.randint(20, 40)
     elif weather_type in (WeatherType.THUNDERSTORM, WeatherType.HEAVY_RAIN):
-        wind_speed = random.randint(15, 30)
+        wind_speed = rng.randint(15, 30)
     elif weather_type == WeatherType.CLEAR:
-        wind_speed = random.randint(0, 10)
+        wind_speed = rng.randint(0, 10)
     else:
-        wind_speed = random.randint(5, 15)
-    
-    # Reset random seed if we set one
-    if seed is not None:
-        random.seed()
+        wind_speed = rng.randint(5, 15)
     
     return Weather(
         type=weather_type.name_str,
@@ -187,6 +197,108 @@ def get_weather(season: str, time_of_day: str, seed: int | None = None) -> Weath
     )
 
 
+def get_hour_seed(guild_id: int, game_day: int, hour: int) -> int:
+    """Seed for one game hour of weather in a guild."""
+    return hash((guild_id, game_day, hour)) % (2**31)
+
+
+class ForecastHour(TypedDict):
+    """One precomputed hour in a guild's forecast."""
+    game_day: int
+    hour: int
+    time_of_day: str
+    weather: Weather
+
+
+class GuildForecast:
+    """A guild's own RNG and a ring of upcoming hourly weather."""
+    
+    def __init__(self, guild_id: int, hours: int = FORECAST_HOURS):
+        self.guild_id = guild_id
+        self.rng = random.Random()
+        self.season: str | None = None
+        self.hours: deque[ForecastHour] = deque(maxlen=hours)
+    
+    def _generate(self, game_day: int, hour: int, time_of_day: str) -> ForecastHour:
+        weather = get_weather(
+            self.season,
+            time_of_day,
+            seed=get_hour_seed(self.guild_id, game_day, hour),
+            rng=self.rng,
+        )
+        return ForecastHour(game_day=game_day, hour=hour, time_of_day=time_of_day, weather=weather)
+    
+    def advance(self, season: str, game_day: int, hour: int) -> None:
+        """Drop past hours and top the ring back up so it starts at (game_day, hour)."""
+        from ..commands.helper_functions import get_time_period
+        
+        if season != self.season:
+            # Season tables changed, everything precomputed is stale
+            self.season = season
+            self.hours.clear()
+        
+        now = (game_day, hour)
+        while self.hours and (self.hours[0]["game_day"], self.hours[0]["hour"]) < now:
+            self.hours.popleft()
+        if self.hours and (self.hours[0]["game_day"], self.hours[0]["hour"]) != now:
+            # Clock moved backwards (epoch or multiplier changed), start over
+            self.hours.clear()
+        
+        if self.hours:
+            last = self.hours[-1]
+            next_day, next_hour = last["game_day"], last["hour"] + 1
+        else:
+            next_day, next_hour = game_day, hour
+        while len(self.hours) < self.hours.maxlen:
+            if next_hour >= 24:
+                next_day, next_hour = next_day + 1, 0
+            self.hours.append(self._generate(next_day, next_hour, get_time_period(next_hour).name_str))
+            next_hour += 1
+
+
+class WeatherEngine:
+    """
+    Per-guild weather, precomputed a game day ahead.
+    
+    Each guild draws from its own `random.Random`, so nothing here touches the
+    global RNG other cogs rely on. Weather for a given (guild, game day, hour) is
+    deterministic, so every player sees the same conditions for the whole hour.
+    """
+    
+    def __init__(self, hours: int = FORECAST_HOURS):
+        self.forecast_hours = hours
+        self.guilds: dict[int, GuildForecast] = {}
+    
+    def _get_guild(self, guild_id: int) -> GuildForecast:
+        forecast = self.guilds.get(guild_id)
+        if forecast is None:
+            forecast = GuildForecast(guild_id, self.forecast_hours)
+            self.guilds[guild_id] = forecast
+        return forecast
+    
+    def get_weather(self, guild_id: int, season: str, game_day: int, hour: int) -> Weather:
+        forecast = self._get_guild(guild_id)
+        head = forecast.hours[0] if forecast.hours else None
+        if head is None or forecast.season != season or head["game_day"] != game_day or head["hour"] != hour:
+            forecast.advance(season, game_day, hour)
+        return forecast.hours[0]["weather"]
+    
+    def get_forecast(self, guild_id: int, season: str, game_day: int, hour: int, hours: int = 6) -> list[ForecastHour]:
+        forecast = self._get_guild(guild_id)
+        self.get_weather(guild_id, season, game_day, hour)
+        return list(forecast.hours)[:hours]
+    
+    def invalidate(self, guild_id: int | None = None) -> None:
+        if guild_id is None:
+            self.guilds.clear()
+        else:
+            self.guilds.pop(guild_id, None)
+
+
+# Shared engine used by `get_weather_for_guild`
+weather_engine = WeatherEngine()
+
+
 def get_weather_for_guild(
     db: DB, 
     guild: discord.Guild | int,
@@ -199,6 +311,7 @@ def get_weather_for_guild(
     
     Weather changes every game hour (24 weather periods per day).
     This ensures weather is consistent for all players during the same hour.
+    Served from the guild's precomputed forecast in `weather_engine`.
     
     Args:
         db: Database instance
@@ -210,15 +323,36 @@ def get_weather_for_guild(
     Returns:
         Weather dict
     """
-    # Create a seed based on guild, game day, and current hour
-    from ..commands.helper_functions import get_game_time_of_day
-    time_info = get_game_time_of_day(db, guild)
-    hour = time_info['hour']
+    from ..commands.helper_functions import get_environment
+    hour = get_environment(db, guild)["time_of_day"]['hour']
     
     gid = guild if isinstance(guild, int) else guild.id
-    seed = hash((gid, game_day, hour)) % (2**31)
+    return weather_engine.get_weather(gid, season, game_day, hour)
+
+
+def get_forecast_for_guild(
+    db: DB,
+    guild: discord.Guild | int,
+    hours: int = 6
+) -> list[ForecastHour]:
+    """
+    Get the upcoming hourly weather for a guild, starting with the current hour.
+    
+    Args:
+        db: Database instance
+        guild: Guild or guild ID
+        hours: How many game hours to return (at most FORECAST_HOURS)
     
-    return get_weather(season, time_of_day, seed=seed)
+    Returns:
+        List of ForecastHour dicts
+    """
+    from ..commands.helper_functions import get_environment
+    env = get_environment(db, guild)
+    
+    gid = guild if isinstance(guild, int) else guild.id
+    return weather_engine.get_forecast(
+        gid, env['season'], env['calendar']['total_game_days'], env['time_of_day']['hour'], hours
+    )
 
 
 def get_weather_display(weather: Weather) -> str:
@@ -249,3 +383,15 @@ def get_weather_fishing_message(weather: Weather) -> str:
         return "🎣 **Poor** fishing conditions."
     else:
         return "⚠️ **Dangerous** conditions - fishing not recommended!"
+
+
+def get_forecast_display(forecast: list[ForecastHour]) -> str:
+    """
+    Get a formatted multi-line forecast, one line per game hour.
+    
+    Example: "`09:00` ☀️ Clear - 72°F, Wind: 5 mph"
+    """
+    return "\n".join(
+        f"`{entry['hour']:02d}:00` {get_weather_display(entry['weather'])}"
+        for entry in forecast
+    )
@@ -0,0 +1,164 @@
+"""
+Bot-wide fish records.
+
+Personal records live per user inside one guild, so the heaviest Largemouth
+Bass anywhere on the bot would take a scan of every guild and user. This index
+keeps only the top few anglers per (species, weight/length) across the guilds
+that opted in (`GuildSettings.world_records_public`), since the boards show
+server and member names to every other server. It is fed by `User.update_fish_record` through a hook bound in
+`GuildSettings.get_user`, and an offer that can't make the board is turned away
+with one comparison against its last place.
+
+The boards are stored next to db.json in their own small file (bare
+[value, guild id, user id] rows) so saving them never means rewriting the guild
+data. `build` recreates them from the DB with a full scan, which the cog runs
+in a worker thread.
+"""
+
+import json
+import logging
+from bisect import insort
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from . import write_file
+from .records import RECORD_KINDS
+
+if TYPE_CHECKING:
+    from .models import GuildSettings
+
+log = logging.getLogger("red.greenacresfishing.records")
+
+# Anglers kept per species and kind
+WORLD_TOP_N = 10
+# Saved boards from older formats are rebuilt instead of loaded
+FORMAT_VERSION = 2
+
+# (-value, guild_id, user_id), kept sorted ascending so the record is first
+Entry = Tuple[float, int, int]
+
+
+class WorldRecords:
+    """Top `WORLD_TOP_N` personal records per species across every guild, highest first."""
+
+    def __init__(self, top: int = WORLD_TOP_N):
+        self.top = top
+        self._boards: Dict[Tuple[str, str], List[Entry]] = {}
+        # Offers that arrived while a rebuild was scanning, replayed onto the result
+        self._pending: Optional[List[tuple]] = None
+        # Set when a board changes, cleared once written
+        self.dirty = False
+
+    def offer(self, guild_id: int, user_id: int, fish_id: str, kind: str, value: float) -> bool:
+        """Place an angler's new personal record. Returns True if it made the board."""
+        if self._pending is not None:
+            self._pending.append((guild_id, user_id, fish_id, kind, value))
+        board = self._boards.get((fish_id, kind))
+        if board is None:
+            board = self._boards[(fish_id, kind)] = []
+        elif len(board) >= self.top and value <= -board[-1][0]:
+            return False
+        for i, (neg, gid, uid) in enumerate(board):
+            if gid == guild_id and uid == user_id:
+                if -neg >= value:
+                    return False
+                del board[i]
+                break
+        insort(board, (-value, guild_id, user_id))
+        del board[self.top:]
+        self.dirty = True
+        return True
+
+    def board(self, fish_id: str, kind: str) -> List[Tuple[int, int, float]]:
+        """(guild_id, user_id, value) for every ranked angler, best first."""
+        return [(gid, uid, -neg) for neg, gid, uid in self._boards.get((fish_id, kind), ())]
+
+    def holder(self, fish_id: str, kind: str) -> Optional[Tuple[int, int, float]]:
+        """Current (guild_id, user_id, value) world record holder, or None if nobody has caught one."""
+        board = self._boards.get((fish_id, kind))
+        if not board:
+            return None
+        neg, gid, uid = board[0]
+        return (gid, uid, -neg)
+
+    def species(self, kind: str) -> List[str]:
+        """Species with at least one record of this kind."""
+        return [fish_id for (fish_id, k), board in self._boards.items() if k == kind and board]
+
+    def __len__(self) -> int:
+        return sum(len(board) for board in self._boards.values())
+
+    # Rebuilding
+
+    @classmethod
+    def build(cls, configs: Dict[int, "GuildSettings"], top: int = WORLD_TOP_N) -> "WorldRecords":
+        """Rank every stored personal record of the opted-in guilds (one full scan of `DB.configs`)."""
+        index = cls(top)
+        for gid, conf in list(configs.items()):
+            if not conf.world_records_public:
+                continue
+            for uid, user in list(conf.users.items()):
+                for fish_id, record in list(user.fish_records.items()):
+                    for kind in RECORD_KINDS:
+                        value = record.get(f"max_{kind}", 0)
+                        if value > 0:
+                            index.offer(gid, uid, fish_id, kind, value)
+        return index
+
+    def begin_rebuild(self) -> None:
+        """Start remembering offers so records set during a rebuild's scan aren't lost."""
+        self._pending = []
+
+    def adopt(self, other: "WorldRecords") -> None:
+        """Take over a rebuilt index's boards in place, so bound hooks keep working."""
+        pending, self._pending = self._pending or [], None
+        self.top = other.top
+        self._boards = other._boards
+        for args in pending:
+            self.offer(*args)
+        self.dirty = True
+
+    def abort_rebuild(self) -> None:
+        self._pending = None
+
+    # Persistence
+
+    def to_dict(self) -> dict:
+        boards: Dict[str, Dict[str, list]] = {}
+        for (fish_id, kind), board in self._boards.items():
+            if board:
+                boards.setdefault(fish_id, {})[kind] = [[-neg, gid, uid] for neg, gid, uid in board]
+        return {"version": FORMAT_VERSION, "top": self.top, "boards": boards}
+
+    @classmethod
+    def from_dict(cls, data: dict, top: int = WORLD_TOP_N) -> "WorldRecords":
+        index = cls(top)
+        for fish_id, kinds in data.get("boards", {}).items():
+            for kind, rows in kinds.items():
+                board = sorted((-value, gid, uid) for value, gid, uid in rows)
+                index._boards[(fish_id, kind)] = board[:top]
+        return index
+
+    def dump(self) -> str:
+        """Compact JSON for `to_file`, taken on the event loop so the write can happen in a thread."""
+        self.dirty = False
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @staticmethod
+    def to_file(path: Path, dump: str) -> None:
+        write_file(path, dump)
+
+    @classmethod
+    def from_file(cls, path: Path) -> Optional["WorldRecords"]:
+        """Load saved boards, or None if there are none, they're from an older format or kept shorter than `WORLD_TOP_N`."""
+        if not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError) as e:
+            log.warning(f"Discarding unreadable world records at {path}: {e}")
+            return None
+        if data.get("version") != FORMAT_VERSION or data.get("top", 0) < WORLD_TOP_N:
+            return None
+        return cls.from_dict(data)
+
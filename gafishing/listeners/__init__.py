@@ -1,8 +1,10 @@
 from ..abc import CompositeMetaClass
+from .members import MemberListeners
 from .messages import MessageListeners
 
 
 class Listeners(
+    MemberListeners,
     MessageListeners,
     metaclass=CompositeMetaClass,
 ):
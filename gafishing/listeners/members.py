@@ -0,0 +1,25 @@
+import discord
+from redbot.core import commands
+
+from ..abc import MixinMeta
+
+
+class MemberListeners(MixinMeta):
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # Role changes can grant or revoke admin, re-check on the next command
+        if before.roles != after.roles:
+            self.permissions.invalidate(after.guild.id, after.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.permissions.invalidate(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        # A role's permissions (or its standing as an admin role) may have changed for everyone holding it
+        self.permissions.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.permissions.invalidate(role.guild.id)
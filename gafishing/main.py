@@ -7,7 +7,16 @@ from redbot.core.data_manager import cog_data_path
 
 from .abc import CompositeMetaClass
 from .commands import Commands
+from .common.catch_history import CatchHistory
+from .common.catch_log import CatchLog
+from .common.derby import DERBY_SAVE_INTERVAL, Derby
+from .common.edit_coalescer import EditCoalescer
 from .common.models import DB
+from .common.permissions import PermissionCache
+from .common.schema import USER_MIGRATIONS
+from .common.scheduler import SessionScheduler
+from .common.view_registry import ViewRegistry
+from .common.world_records import WorldRecords
 from .listeners import Listeners
 from .tasks import TaskLoops
 
@@ -29,13 +38,30 @@ class GreenacresFishing(
         self.data_path = cog_data_path(self)  # Path to cog's data folder
 
         # States
-        self._saving = False
+        self._save_task: asyncio.Task | None = None
+        self._save_queued = False
+        self._migration_task: asyncio.Task | None = None
+        self._world_task: asyncio.Task | None = None
+        self._world_rebuild_again = False  # Something changed after the running rebuild's scan started
         
         # In-memory debug log for fish catches (avoids writing to filesystem)
-        self.debug_log: list = []
+        self.debug_log = CatchLog()
         
-        # Track active views so we can close them on reload
-        self.active_views = set()
+        # Track active views so we can cap them per user and close them on reload
+        self.active_views = ViewRegistry()
+        
+        # Shared deadline scheduler for active fishing sessions
+        self.scheduler = SessionScheduler()
+        # Paces fishing message edits per channel
+        self.edits = EditCoalescer(self.scheduler)
+        # Cached Red admin checks for the allowed-channel bypass
+        self.permissions = PermissionCache()
+        # Running derbies by guild id
+        self.derbies: dict[int, Derby] = {}
+        # Top personal records per species across every guild
+        self.world_records = WorldRecords()
+        # Per-guild catch history files, for guilds that turn it on
+        self.history = CatchHistory(self.data_path / "history")
 
     def format_help_for_context(self, ctx: commands.Context):
         helpcmd = super().format_help_for_context(ctx)
@@ -49,107 +75,143 @@ class GreenacresFishing(
         return
 
     async def cog_load(self) -> None:
+        self.scheduler.start()
         asyncio.create_task(self.initialize())
     
     def cog_unload(self) -> None:
         """Stop all active views when cog is unloaded/reloaded."""
+        self.active_views.sweep()
         log.debug(f"Stopping {len(self.active_views)} active views...")
-        for view in list(self.active_views):
+        for view in self.active_views:
             try:
                 view.stop()
             except Exception as e:
                 log.error(f"Error stopping view: {e}")
         self.active_views.clear()
+        # End running derbies so a reload doesn't wipe them, and post their results
+        for derby in list(self.derbies.values()):
+            derby.end_now()
+            if self._close_derby(derby):
+                self._save_queued = True
+                asyncio.create_task(self._announce_derby(derby))
+        # Write anything a pending or paced save still had to write
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+            self._save_queued = True
+        if self._save_queued:
+            try:
+                self.db.to_file(cog_data_path(self) / "db.json")
+            except Exception as e:
+                log.error(f"Error writing config: {e}")
+            self._save_queued = False
+        try:
+            self.history.flush_all_now()
+        except Exception as e:
+            log.error(f"Error writing catch history: {e}")
+        self.edits.clear()
+        self.scheduler.stop()
+        if self._migration_task is not None:
+            self._migration_task.cancel()
+        if self._world_task is not None:
+            self._world_task.cancel()
         log.debug("All active views stopped")
 
     async def initialize(self) -> None:
         await self.bot.wait_until_red_ready()
         self.db = await asyncio.to_thread(DB.from_file, cog_data_path(self) / "db.json")
+        await asyncio.to_thread(self.history.load_codes)
         log.info("Config loaded")
         
-        # Run migrations
-        await self._migrate_inventory_format()
+        saved = await asyncio.to_thread(WorldRecords.from_file, self.data_path / "world_records.json")
+        if saved is not None:
+            self.world_records = saved
+        self.db._world_records = self.world_records
+        if saved is None:
+            self.request_world_rebuild()
+        
+        # Only stores written before the latest schema need a sweep
+        if self.db.schema_version < USER_MIGRATIONS.latest:
+            self._migration_task = asyncio.create_task(self._migrate_users())
 
-    async def _migrate_inventory_format(self) -> None:
-        """Migrate old inventory format to new format.
+    async def _migrate_users(self) -> None:
+        """Bring every stored user up to the latest schema version in the background.
         
-        Old format used 'id' key, new format uses 'rod_id' and 'lure_id'.
-        Also removes deprecated keys like 'name', 'catch_bonus', and 'equipped'.
-        Caps durability to database max values.
-        Migrates old 'equipped' boolean to new index-based equipped system.
+        Users touched before the sweep reaches them are upgraded by `get_user`.
         """
-        from .databases.items import RODS_DATABASE
-        
-        migrated = False
+        latest = USER_MIGRATIONS.latest
+        upgraded, failed = await USER_MIGRATIONS.sweep(self.db.iter_users())
+        if failed:
+            # Leave the store unstamped so the next load sweeps again
+            log.warning(f"Migrated {upgraded} users to schema version {latest}, {failed} failed")
+        else:
+            self.db.schema_version = latest
+            log.info(f"Migrated {upgraded} users to schema version {latest}")
+        self.save()
+
+    def request_world_rebuild(self) -> asyncio.Task:
+        """Rebuild the world records in the background and return the task.
         
-        for guild_id, conf in self.db.configs.items():
-            for user_id, user_data in conf.users.items():
-                # Migrate rod inventory
-                for idx, rod in enumerate(user_data.current_rod_inventory):
-                    if "id" in rod and "rod_id" not in rod:
-                        rod["rod_id"] = rod.pop("id")
-                        migrated = True
-                    # Remove deprecated keys
-                    for key in ["name", "catch_bonus"]:
-                        if key in rod:
-                            del rod[key]
-                            migrated = True
-                    # Migrate old equipped boolean to index-based system
-                    if rod.pop("equipped", False) and user_data.equipped_rod_index is None:
-                        user_data.equipped_rod_index = idx
-                        migrated = True
-                    # Cap durability to database max
-                    rod_id = rod.get("rod_id")
-                    if rod_id and rod_id in RODS_DATABASE:
-                        max_durability = RODS_DATABASE[rod_id].get("durability", 50)
-                        if rod.get("durability", 0) > max_durability:
-                            rod["durability"] = max_durability
-                            migrated = True
-                
-                # Migrate lure inventory
-                for idx, lure in enumerate(user_data.current_lure_inventory):
-                    if "id" in lure and "lure_id" not in lure:
-                        lure["lure_id"] = lure.pop("id")
-                        migrated = True
-                    # Remove deprecated keys
-                    for key in ["name", "catch_bonus"]:
-                        if key in lure:
-                            del lure[key]
-                            migrated = True
-                    # Migrate old equipped boolean to index-based system
-                    if lure.pop("equipped", False) and user_data.equipped_lure_index is None:
-                        user_data.equipped_lure_index = idx
-                        migrated = True
-                
-                # Migrate clothing inventory
-                for idx, clothing in enumerate(user_data.current_clothing_inventory):
-                    # Migrate old equipped boolean to index-based system
-                    if clothing.pop("equipped", False):
-                        slot = clothing.get("slot")
-                        if slot == "hat" and user_data.equipped_hat_index is None:
-                            user_data.equipped_hat_index = idx
-                            migrated = True
-                        elif slot == "coat" and user_data.equipped_coat_index is None:
-                            user_data.equipped_coat_index = idx
-                            migrated = True
-                        elif slot == "boots" and user_data.equipped_boots_index is None:
-                            user_data.equipped_boots_index = idx
-                            migrated = True
+        If a rebuild is already running its scan may have passed whatever changed
+        (a guild opting in or out), so it runs once more when it finishes and the
+        running task is returned.
+        """
+        if self._world_task is None or self._world_task.done():
+            self._world_rebuild_again = False
+            self._world_task = asyncio.create_task(self._rebuild_world_records_until_current())
+        else:
+            self._world_rebuild_again = True
+        return self._world_task
+
+    async def _rebuild_world_records_until_current(self) -> int:
+        entries = await self.rebuild_world_records()
+        while self._world_rebuild_again:
+            self._world_rebuild_again = False
+            entries = await self.rebuild_world_records()
+        return entries
+
+    async def rebuild_world_records(self) -> int:
+        """Re-rank the world records from every guild's stored records in a worker thread.
         
-        if migrated:
-            log.info("Migrated inventory format to new schema")
-            self.save()
+        Records set while the scan runs are replayed onto the result. Returns how
+        many entries the rebuilt boards hold.
+        """
+        self.world_records.begin_rebuild()
+        try:
+            rebuilt = await asyncio.to_thread(WorldRecords.build, self.db.configs)
+        except BaseException:
+            self.world_records.abort_rebuild()
+            raise
+        self.world_records.adopt(rebuilt)
+        log.info(f"Rebuilt world records: {len(self.world_records)} entries")
+        self.save()
+        return len(self.world_records)
 
     def save(self) -> None:
-        async def _save():
-            if self._saving:
-                return
+        """Write the config in the background.
+        
+        Saves requested while a write is in flight are folded into one more write
+        once it finishes, so nothing is dropped and writes never overlap.
+        """
+        if self._save_task is not None and not self._save_task.done():
+            self._save_queued = True
+            return
+        self._save_task = asyncio.create_task(self._save())
+
+    async def _save(self) -> None:
+        while True:
+            self._save_queued = False
             try:
-                self._saving = True
                 await asyncio.to_thread(self.db.to_file, cog_data_path(self) / "db.json")
             except Exception as e:
                 log.exception("Failed to save config", exc_info=e)
-            finally:
-                self._saving = False
-
-        asyncio.create_task(_save())
+            if self.world_records.dirty:
+                try:
+                    dump = self.world_records.dump()
+                    await asyncio.to_thread(WorldRecords.to_file, self.data_path / "world_records.json", dump)
+                except Exception as e:
+                    log.exception("Failed to save world records", exc_info=e)
+            if not self._save_queued:
+                return
+            if self.derbies:
+                # Catches pour in during a derby, write them in batches instead of back to back
+                await asyncio.sleep(DERBY_SAVE_INTERVAL)
@@ -3,6 +3,7 @@ Bait Shop view - Buy and sell fishing supplies.
 """
 
 import discord
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, List, Dict, Any
 
 if TYPE_CHECKING:
@@ -16,6 +17,13 @@ from ..databases.items import (
     COATS_DATABASE, 
     BOOTS_DATABASE
 )
+from ..common.templates import TEMPLATES
+
+
+@lru_cache(maxsize=None)
+def _lures_by_water_type(water_type: str) -> Dict[str, Any]:
+    """Lures for one water type ("freshwater", "saltwater" or "both"). Treat the result as read-only."""
+    return {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == water_type}
 
 
 class BaitShopView(BackToMenuMixin, BaseView):
@@ -101,28 +109,13 @@ class BaitShopView(BackToMenuMixin, BaseView):
         conf = self.cog.db.get_conf(interaction.guild)
         user_data = conf.get_user(self.author)
         
-        fish_count = len(user_data.current_fish_inventory)
-        if fish_count == 0:
+        if not user_data.current_fish_inventory:
             await interaction.response.send_message(
                 "🐟 You don't have any fish to sell!",
                 ephemeral=True
             )
         else:
-            # Calculate total value - look up from database if not stored (backward compatibility)
-            from ..databases.fish import FISH_DATABASE
-            total_value = 0
-            for f in user_data.current_fish_inventory:
-                if "fishpoints" in f:
-                    total_value += f["fishpoints"]
-                else:
-                    fish_data = FISH_DATABASE.get(f.get("fish_id", ""), {})
-                    total_value += fish_data.get("base_fishpoints", 10)
-            view = SellFishConfirmView(
-                cog=self.cog, 
-                author=self.author,
-                fish_count=fish_count,
-                total_value=total_value
-            )
+            view = SellFishConfirmView(cog=self.cog, author=self.author)
             embed = view.create_embed()
             await self.stop_and_update(interaction, view, embed)
 
@@ -150,32 +143,34 @@ class LuresCategoryView(BackToShopMixin, BaseView):
         conf = self.cog.db.get_conf(self.author.guild)
         user_data = conf.get_user(self.author)
         
-        freshwater = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "freshwater"}
-        saltwater = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "saltwater"}
-        both = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "both"}
-        
+        embed = TEMPLATES.embed(("shop", "lures"), self._build_embed)
+        embed.description = (
+            "Select a water type to browse lures.\n\n"
+            f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**"
+        )
+        return embed
+    
+    @staticmethod
+    def _build_embed() -> discord.Embed:
+        """Build the static part of the category embed."""
         embed = discord.Embed(
             title="🐛 Lures & Bait",
-            description=(
-                "Select a water type to browse lures.\n\n"
-                f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**"
-            ),
             color=discord.Color.blue()
         )
         
         embed.add_field(
             name="🏞️ Freshwater",
-            value=f"{len(freshwater)} lures available",
+            value=f"{len(_lures_by_water_type('freshwater'))} lures available",
             inline=True
         )
         embed.add_field(
             name="🌊 Saltwater",
-            value=f"{len(saltwater)} lures available",
+            value=f"{len(_lures_by_water_type('saltwater'))} lures available",
             inline=True
         )
         embed.add_field(
             name="♾️ Universal",
-            value=f"{len(both)} lures available",
+            value=f"{len(_lures_by_water_type('both'))} lures available",
             inline=True
         )
         
@@ -183,21 +178,21 @@ class LuresCategoryView(BackToShopMixin, BaseView):
     
     @discord.ui.button(label="Freshwater", style=discord.ButtonStyle.primary, emoji="🏞️", row=0)
     async def freshwater_lures(self, interaction: discord.Interaction, button: discord.ui.Button):
-        items = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "freshwater"}
+        items = _lures_by_water_type("freshwater")
         view = ItemShopView(cog=self.cog, author=self.author, items=items, category="Freshwater Lures", slot="lure")
         embed = await view.create_embed()
         await self.stop_and_update(interaction, view, embed)
     
     @discord.ui.button(label="Saltwater", style=discord.ButtonStyle.primary, emoji="🌊", row=0)
     async def saltwater_lures(self, interaction: discord.Interaction, button: discord.ui.Button):
-        items = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "saltwater"}
+        items = _lures_by_water_type("saltwater")
         view = ItemShopView(cog=self.cog, author=self.author, items=items, category="Saltwater Lures", slot="lure")
         embed = await view.create_embed()
         await self.stop_and_update(interaction, view, embed)
     
     @discord.ui.button(label="Universal", style=discord.ButtonStyle.primary, emoji="♾️", row=0)
     async def universal_lures(self, interaction: discord.Interaction, button: discord.ui.Button):
-        items = {k: v for k, v in LURES_DATABASE.items() if v["water_type"] == "both"}
+        items = _lures_by_water_type("both")
         view = ItemShopView(cog=self.cog, author=self.author, items=items, category="Universal Lures", slot="lure")
         embed = await view.create_embed()
         await self.stop_and_update(interaction, view, embed)
@@ -215,14 +210,20 @@ class ApparelCategoryView(BackToShopMixin, BaseView):
         conf = self.cog.db.get_conf(self.author.guild)
         user_data = conf.get_user(self.author)
         
+        embed = TEMPLATES.embed(("shop", "apparel"), self._build_embed)
+        embed.description = (
+            "Select a category to browse apparel.\n\n"
+            f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**\n"
+            f"🏆 FishMaster Tokens: **{user_data.current_fishmaster_tokens}**\n\n"
+            "*FishMaster items require tokens to purchase!*"
+        )
+        return embed
+    
+    @staticmethod
+    def _build_embed() -> discord.Embed:
+        """Build the static part of the category embed."""
         embed = discord.Embed(
             title="👕 Apparel",
-            description=(
-                "Select a category to browse apparel.\n\n"
-                f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**\n"
-                f"🏆 FishMaster Tokens: **{user_data.current_fishmaster_tokens}**\n\n"
-                "*FishMaster items require tokens to purchase!*"
-            ),
             color=discord.Color.purple()
         )
         
@@ -274,6 +275,16 @@ class RodShopView(BackToShopMixin, BaseView):
     
     def _add_rod_select(self):
         """Add the rod selection dropdown."""
+        select = discord.ui.Select(
+            placeholder="Select a rod to purchase...",
+            options=TEMPLATES.options(("shop", "rods"), self._build_rod_options),
+            row=0
+        )
+        select.callback = self._rod_selected
+        self.add_item(select)
+    
+    @staticmethod
+    def _build_rod_options() -> List[discord.SelectOption]:
         options = []
         for rod_id, rod_data in RODS_DATABASE.items():
             price = rod_data["price"]
@@ -284,14 +295,7 @@ class RodShopView(BackToShopMixin, BaseView):
                 description=f"{price_str} | {rod_data['rarity'].title()}",
                 emoji="🎣"
             ))
-        
-        select = discord.ui.Select(
-            placeholder="Select a rod to purchase...",
-            options=options,
-            row=0
-        )
-        select.callback = self._rod_selected
-        self.add_item(select)
+        return options
     
     async def _rod_selected(self, interaction: discord.Interaction):
         """Handle rod selection."""
@@ -314,12 +318,18 @@ class RodShopView(BackToShopMixin, BaseView):
         conf = self.cog.db.get_conf(self.author.guild)
         user_data = conf.get_user(self.author)
         
+        embed = TEMPLATES.embed(("shop", "rods"), self._build_embed)
+        embed.description = (
+            "Select a rod from the dropdown below.\n\n"
+            f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**"
+        )
+        return embed
+    
+    @staticmethod
+    def _build_embed() -> discord.Embed:
+        """Build the rod listing, everything but the user's balance."""
         embed = discord.Embed(
             title="🎣 Rods",
-            description=(
-                "Select a rod from the dropdown below.\n\n"
-                f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**"
-            ),
             color=discord.Color.green()
         )
         
@@ -365,6 +375,19 @@ class ItemShopView(BackToShopMixin, BaseView):
         user_data = conf.get_user(self.author)
         has_token = user_data.current_fishmaster_tokens > 0
         
+        # Locked FishMaster items are the only per-user part of the options
+        select = discord.ui.Select(
+            placeholder="Select an item to purchase...",
+            options=TEMPLATES.options(
+                ("shop", self.category, has_token),
+                lambda: self._build_item_options(has_token)
+            ),
+            row=0
+        )
+        select.callback = self._item_selected
+        self.add_item(select)
+    
+    def _build_item_options(self, has_token: bool) -> List[discord.SelectOption]:
         options = []
         for item_id, item_data in self.items.items():
             price = item_data["price"]
@@ -392,14 +415,7 @@ class ItemShopView(BackToShopMixin, BaseView):
                     description=desc,
                     emoji=emoji
                 ))
-        
-        select = discord.ui.Select(
-            placeholder="Select an item to purchase...",
-            options=options,
-            row=0
-        )
-        select.callback = self._item_selected
-        self.add_item(select)
+        return options
     
     async def _item_selected(self, interaction: discord.Interaction):
         """Handle item selection."""
@@ -446,13 +462,18 @@ class ItemShopView(BackToShopMixin, BaseView):
         user_data = conf.get_user(self.author)
         has_token = user_data.current_fishmaster_tokens > 0
         
+        embed = TEMPLATES.embed(("shop", self.category, has_token), lambda: self._build_embed(has_token))
+        embed.description = (
+            "Select an item from the dropdown below.\n\n"
+            f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**\n"
+            f"🏆 FishMaster Tokens: **{user_data.current_fishmaster_tokens}**"
+        )
+        return embed
+    
+    def _build_embed(self, has_token: bool) -> discord.Embed:
+        """Build the item listing for this category, everything but the user's balances."""
         embed = discord.Embed(
             title=f"🛒 {self.category}",
-            description=(
-                "Select an item from the dropdown below.\n\n"
-                f"💰 Your FishPoints: **{user_data.total_fishpoints:,}**\n"
-                f"🏆 FishMaster Tokens: **{user_data.current_fishmaster_tokens}**"
-            ),
             color=discord.Color.gold()
         )
         
@@ -645,50 +666,22 @@ class PurchaseConfirmView(BaseView):
             return
         
         # Deduct cost
-        user_data.total_fishpoints -= self.total_cost
+        user_data.add_stat("total_fishpoints", -self.total_cost)
         if self.token_cost > 0:
             user_data.current_fishmaster_tokens -= self.token_cost
         
         # Add item(s) to inventory
         if self.slot == "rod":
             # Add rod with full durability
-            user_data.current_rod_inventory.append({
-                "rod_id": self.item_id,
-                "durability": self.item_data["durability"],
-                "equipped": False
-            })
+            user_data.add_rod(self.item_id, durability=self.item_data["durability"])
         elif self.slot == "lure":
-            # Check if we already have this lure and add to quantity
-            existing = None
-            for lure in user_data.current_lure_inventory:
-                if lure.get("lure_id") == self.item_id:
-                    existing = lure
-                    break
-            
-            # Get lure info for uses
+            # Adds to the existing stack of this lure if there is one
             from ..databases.items import LURES_DATABASE
-            lure_info = LURES_DATABASE.get(self.item_id, {})
-            uses_per_item = lure_info.get("uses", 1)
-            
-            if existing:
-                existing["quantity"] = existing.get("quantity", 1) + self.quantity
-                existing["remaining_uses"] = existing.get("remaining_uses", 0) + (self.quantity * uses_per_item)
-                existing["uses_per_item"] = uses_per_item
-            else:
-                user_data.current_lure_inventory.append({
-                    "lure_id": self.item_id,
-                    "quantity": self.quantity,
-                    "remaining_uses": self.quantity * uses_per_item,
-                    "uses_per_item": uses_per_item,
-                    "equipped": False
-                })
+            uses_per_item = LURES_DATABASE.get(self.item_id, {}).get("uses", 1)
+            user_data.add_lures(self.item_id, self.quantity, uses_per_item)
         elif self.slot in ["hat", "coat", "boots"]:
             # Add clothing item
-            user_data.current_clothing_inventory.append({
-                "clothing_id": self.item_id,
-                "slot": self.slot,
-                "equipped": False
-            })
+            user_data.add_clothing(self.item_id, self.slot)
         
         # Save changes
         self.cog.save()
@@ -722,66 +715,106 @@ class PurchaseConfirmView(BaseView):
 # ==================== SELL FISH CONFIRMATION ====================
 
 class SellFishConfirmView(BaseView):
-    """View for confirming selling all fish."""
+    """View for choosing which fish to sell and confirming the sale."""
+    
+    # Select option value -> (species, trophy) filter, species options are "species:<fish_id>"
+    SELECTIONS = {
+        "all": (None, None),
+        "no_trophies": (None, False),
+        "trophies": (None, True),
+    }
     
     def __init__(
         self,
         cog: "GreenacresFishing",
         author: discord.Member,
-        fish_count: int,
-        total_value: int
+        selection: str = "all"
     ):
         super().__init__(cog=cog, author=author)
-        self.fish_count = fish_count
-        self.total_value = total_value
+        self.selection = selection
+        self._add_selection_select()
+    
+    @property
+    def ledger(self):
+        return self.cog.db.get_conf(self.author.guild).get_user(self.author).fish_ledger
+    
+    def _filters(self) -> tuple:
+        if self.selection.startswith("species:"):
+            return self.selection.split(":", 1)[1], None
+        return self.SELECTIONS.get(self.selection, (None, None))
+    
+    def _add_selection_select(self):
+        """Add the dropdown for picking which fish to sell."""
+        from ..databases.fish import FISH_DATABASE
+        ledger = self.ledger
+        
+        options = []
+        for value, label, emoji in (
+            ("all", "All fish", "🐟"),
+            ("no_trophies", "All but trophies", "🎣"),
+            ("trophies", "Trophies only", "🏆"),
+        ):
+            count, total = ledger.selection(*self.SELECTIONS[value])
+            options.append(discord.SelectOption(
+                label=label,
+                value=value,
+                emoji=emoji,
+                description=f"{count:,} fish for {total:,} FP",
+                default=(self.selection == value)
+            ))
+        # One option per species, most caught first (Discord allows 25 options)
+        for fish_id, count in ledger.by_count()[:22]:
+            _, total = ledger.selection(fish_id)
+            value = f"species:{fish_id}"
+            options.append(discord.SelectOption(
+                label=FISH_DATABASE.get(fish_id, {}).get("name", fish_id.replace("_", " ").title())[:100],
+                value=value,
+                description=f"{count:,} fish for {total:,} FP",
+                default=(self.selection == value)
+            ))
+        
+        select = discord.ui.Select(placeholder="Choose which fish to sell...", options=options, row=1)
+        select.callback = self._selection_changed
+        self.add_item(select)
+    
+    async def _selection_changed(self, interaction: discord.Interaction):
+        view = SellFishConfirmView(cog=self.cog, author=self.author, selection=interaction.data["values"][0])
+        await self.stop_and_update(interaction, view, view.create_embed())
     
     def create_embed(self) -> discord.Embed:
+        ledger = self.ledger
+        total_count, total_value = ledger.selection()
+        count, value = ledger.selection(*self._filters())
         embed = discord.Embed(
-            title="💰 Sell All Fish",
+            title="💰 Sell Fish",
             description=(
-                f"You have **{self.fish_count}** fish in your inventory.\n"
-                f"Total value: **{self.total_value:,} FishPoints**\n\n"
-                "Do you want to sell all your fish?"
+                f"You have **{total_count:,}** fish worth **{total_value:,} FishPoints**.\n\n"
+                f"Selected: **{count:,}** fish for **{value:,} FishPoints**\n\n"
+                "Pick what to sell below, then confirm."
             ),
             color=discord.Color.gold()
         )
         return embed
     
-    @discord.ui.button(label="Sell All", style=discord.ButtonStyle.success, emoji="💰", row=0)
+    @discord.ui.button(label="Sell", style=discord.ButtonStyle.success, emoji="💰", row=0)
     async def confirm_sell(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Confirm and sell all fish."""
+        """Confirm and sell the selected fish."""
         conf = self.cog.db.get_conf(interaction.guild)
         user_data = conf.get_user(self.author)
         
-        # Calculate value again (in case inventory changed)
-        # Look up fishpoints from database if not stored in fish entry (backward compatibility)
-        from ..databases.fish import FISH_DATABASE
-        total_value = 0
-        for f in user_data.current_fish_inventory:
-            if "fishpoints" in f:
-                total_value += f["fishpoints"]
-            else:
-                # Legacy fish without stored fishpoints - look up from database
-                fish_data = FISH_DATABASE.get(f.get("fish_id", ""), {})
-                total_value += fish_data.get("base_fishpoints", 10)
-        fish_count = len(user_data.current_fish_inventory)
+        # Totals come from the live inventory, in case it changed since the embed was drawn
+        fish_count, total_value = user_data.take_fish(*self._filters())
         
         if fish_count == 0:
             await interaction.response.send_message(
-                "❌ You don't have any fish to sell!",
+                "❌ You don't have any of those fish to sell!",
                 ephemeral=True
             )
             return
         
-        # Add FishPoints and clear inventory
-        user_data.total_fishpoints += total_value
-        user_data.total_fish_sold += fish_count
-        
-        # Update most fishpoints ever
-        if user_data.total_fishpoints > user_data.most_fishpoints_ever:
-            user_data.most_fishpoints_ever = user_data.total_fishpoints
-        
-        user_data.current_fish_inventory.clear()
+        # Add FishPoints
+        user_data.add_fishpoints(total_value)
+        user_data.add_stat("total_fish_sold", fish_count)
         
         # Save changes
         self.cog.save()
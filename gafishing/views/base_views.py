@@ -7,6 +7,8 @@ import asyncio
 import discord
 from typing import Optional, TYPE_CHECKING
 
+from ..common.view_registry import DEFAULT_MAX_VIEWS_PER_USER
+
 if TYPE_CHECKING:
     from ..main import GreenacresFishing
 
@@ -30,21 +32,32 @@ class BaseView(discord.ui.View):
         super().__init__(timeout=timeout)
         self.cog = cog
         self.author = author
-        self.message: Optional[discord.Message] = None
+        self._message: Optional[discord.Message] = None
         self._timeout_duration = timeout  # Store original timeout for reset
         self._is_stopped = False  # Track if view has been stopped/timed out
         
-        # Register this view with the cog for tracking
-        if hasattr(cog, 'active_views'):
-            cog.active_views.add(self)
-        
-        # Register this view with the cog for tracking
+        # Register this view with the cog, the menu limit is applied once it has a message
         if hasattr(cog, 'active_views'):
-            cog.active_views.add(self)
-        
-        # Register this view with the cog
-        if hasattr(cog, 'active_views'):
-            cog.active_views.add(self)
+            guild = getattr(author, "guild", None)
+            cog.active_views.add((guild.id if guild else 0, author.id), self)
+    
+    @property
+    def message(self) -> Optional[discord.Message]:
+        return self._message
+    
+    @message.setter
+    def message(self, message: Optional[discord.Message]) -> None:
+        """Attach the view to its message, stopping the author's oldest menus past the server's limit."""
+        self._message = message
+        if message is None or not hasattr(self.cog, 'active_views'):
+            return
+        guild = getattr(self.author, "guild", None)
+        limit = self.cog.db.get_conf(guild).max_views_per_user if guild else DEFAULT_MAX_VIEWS_PER_USER
+        self.cog.active_views.attach(self, message, limit=limit)
+    
+    def can_evict(self) -> bool:
+        """Whether the view registry may close this view to make room for a newer one."""
+        return True
     
     def is_active(self) -> bool:
         """Check if the view is still active (not stopped or timed out)."""
@@ -219,24 +232,8 @@ class MainMenuView(BaseView):
             lure_name = "Grubs"
             uses_per_item = 1
         
-        # Add to inventory (check if they already have this lure type)
-        found_existing = False
-        for lure in user_data.current_lure_inventory:
-            if lure.get("lure_id") == lure_id:
-                lure["quantity"] = lure.get("quantity", 0) + qty
-                lure["remaining_uses"] = lure.get("remaining_uses", 0) + (qty * uses_per_item)
-                lure["uses_per_item"] = uses_per_item
-                found_existing = True
-                break
-        
-        if not found_existing:
-            # Add new lure entry
-            user_data.current_lure_inventory.append({
-                "lure_id": lure_id,
-                "quantity": qty,
-                "remaining_uses": qty * uses_per_item,
-                "uses_per_item": uses_per_item
-            })
+        # Add to inventory (stacks onto this lure type if they already have it)
+        user_data.add_lures(lure_id, qty, uses_per_item)
         
         # Update cooldown
         user_data.last_scavenge_timestamp = current_time
@@ -3,7 +3,8 @@ FishInfo View - View for displaying user fishing profile with currency conversio
 """
 
 import discord
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 from redbot.core import bank
 
 if TYPE_CHECKING:
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
 
 from .base_views import BaseView
 from ..databases.fish import FISH_DATABASE
+from ..common.templates import TEMPLATES
 
 
 class FishInfoView(BaseView):
@@ -256,7 +258,7 @@ class ConvertFPModal(discord.ui.Modal):
     ):
         """Process the FP to currency conversion."""
         # Deduct FP
-        user_data.total_fishpoints -= fp_to_deduct
+        user_data.add_stat("total_fishpoints", -fp_to_deduct)
         self.cog.save()
         
         try:
@@ -272,7 +274,7 @@ class ConvertFPModal(discord.ui.Modal):
             )
         except Exception as e:
             # Rollback if bank fails
-            user_data.total_fishpoints += fp_to_deduct
+            user_data.add_stat("total_fishpoints", fp_to_deduct)
             self.cog.save()
             
             await interaction.response.send_message(
@@ -486,7 +488,7 @@ class ConvertConfirmView(discord.ui.View):
                 return
             
             # Deduct FP
-            user_data.total_fishpoints -= self.amount_to_deduct
+            user_data.add_stat("total_fishpoints", -self.amount_to_deduct)
             self.cog.save()
             
             try:
@@ -505,7 +507,7 @@ class ConvertConfirmView(discord.ui.View):
                 )
             except Exception as e:
                 # Rollback if bank fails
-                user_data.total_fishpoints += self.amount_to_deduct
+                user_data.add_stat("total_fishpoints", self.amount_to_deduct)
                 self.cog.save()
                 
                 await interaction.response.edit_message(
@@ -536,11 +538,7 @@ class ConvertConfirmView(discord.ui.View):
                 await bank.withdraw_credits(self.author, self.amount_to_deduct)
                 
                 # Add FP
-                user_data.total_fishpoints += self.amount_to_receive
-                
-                # Update most FP ever if needed
-                if user_data.total_fishpoints > user_data.most_fishpoints_ever:
-                    user_data.most_fishpoints_ever = user_data.total_fishpoints
+                user_data.add_fishpoints(self.amount_to_receive)
                 
                 self.cog.save()
                 
@@ -577,6 +575,23 @@ class ConvertConfirmView(discord.ui.View):
         pass
 
 
+@lru_cache(maxsize=1)
+def _fish_by_water_type() -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Fish names sorted by name and split into (freshwater, saltwater, both)."""
+    freshwater, saltwater, hybrid = [], [], []
+    for fish_id, fish_data in sorted(FISH_DATABASE.items(), key=lambda x: x[1]["name"]):
+        fish_name = fish_data["name"]
+        water_type = fish_data["water_type"]
+        
+        if water_type == "freshwater":
+            freshwater.append(fish_name)
+        elif water_type == "saltwater":
+            saltwater.append(fish_name)
+        elif water_type == "both":
+            hybrid.append(fish_name)
+    return tuple(freshwater), tuple(saltwater), tuple(hybrid)
+
+
 class FishInfoHelpView(BaseView):
     """Help view for fishinfo command with multiple information pages."""
     
@@ -603,28 +618,41 @@ class FishInfoHelpView(BaseView):
     
     def _build_fish_lists(self):
         """Build categorized fish lists for display."""
-        self.freshwater_fish = []
-        self.saltwater_fish = []
-        self.hybrid_fish = []
-        
-        for fish_id, fish_data in sorted(FISH_DATABASE.items(), key=lambda x: x[1]["name"]):
-            fish_name = fish_data["name"]
-            water_type = fish_data["water_type"]
-            
-            if water_type == "freshwater":
-                self.freshwater_fish.append(fish_name)
-            elif water_type == "saltwater":
-                self.saltwater_fish.append(fish_name)
-            elif water_type == "both":
-                self.hybrid_fish.append(fish_name)
+        self.freshwater_fish, self.saltwater_fish, self.hybrid_fish = _fish_by_water_type()
         
         # Calculate total pages needed (15 fish per page)
         self.fish_per_page = 15
         all_fish = self.freshwater_fish + self.hybrid_fish + self.saltwater_fish
         self.total_fish_pages = max(1, (len(all_fish) + self.fish_per_page - 1) // self.fish_per_page)
     
+    # Help pages are static (apart from the command prefix), so each is built once
+    # per process and copied from the template cache afterwards
     def get_main_help_embed(self) -> discord.Embed:
         """Generate the main help menu embed."""
+        return TEMPLATES.embed(("help", "main"), self._build_main_help_embed)
+    
+    def get_getting_started_embed(self) -> discord.Embed:
+        """Generate the Getting Started embed."""
+        return TEMPLATES.embed(("help", "getting_started", self.prefix), self._build_getting_started_embed)
+    
+    def get_bait_shop_embed(self) -> discord.Embed:
+        """Generate the Bait Shop Info embed."""
+        return TEMPLATES.embed(("help", "bait_shop"), self._build_bait_shop_embed)
+    
+    def get_fishpoints_tokens_embed(self) -> discord.Embed:
+        """Generate the FishPoints/Tokens info embed."""
+        return TEMPLATES.embed(("help", "fishpoints"), self._build_fishpoints_tokens_embed)
+    
+    def get_search_garbage_embed(self) -> discord.Embed:
+        """Generate the Search Garbage info embed."""
+        return TEMPLATES.embed(("help", "garbage"), self._build_search_garbage_embed)
+    
+    def get_fish_list_embed(self, page: int = 0) -> discord.Embed:
+        """Generate the Fish List embed with pagination."""
+        return TEMPLATES.embed(("help", "fish_list", page), lambda: self._build_fish_list_embed(page))
+    
+    def _build_main_help_embed(self) -> discord.Embed:
+        """Build the main help menu embed."""
         embed = discord.Embed(
             title="🎣 Greenacres Fishing Info",
             description=(
@@ -638,8 +666,8 @@ class FishInfoHelpView(BaseView):
         embed.set_footer(text="Select a topic to learn more")
         return embed
     
-    def get_getting_started_embed(self) -> discord.Embed:
-        """Generate the Getting Started embed."""
+    def _build_getting_started_embed(self) -> discord.Embed:
+        """Build the Getting Started embed."""
         embed = discord.Embed(
             title="🎯 Getting Started with Fishing",
             color=discord.Color.green()
@@ -679,6 +707,7 @@ class FishInfoHelpView(BaseView):
             value=(
                 "• Different baits attract different fish\n"
                 "• Weather and season affect what fish appear\n"
+                f"• Use `{self.prefix}fishforecast` to plan around the weather\n"
                 "• Better rods help land bigger fish!\n"
                 "• Notice - Rods can be damaged by mistakes during fish-fighting. Be careful or you may have to replace them"
             ),
@@ -687,8 +716,8 @@ class FishInfoHelpView(BaseView):
         
         return embed
     
-    def get_bait_shop_embed(self) -> discord.Embed:
-        """Generate the Bait Shop Info embed."""
+    def _build_bait_shop_embed(self) -> discord.Embed:
+        """Build the Bait Shop Info embed."""
         embed = discord.Embed(
             title="🏪 Bait Shop Information",
             description="The Bait Shop is your one-stop shop for all your fishing needs!",
@@ -730,8 +759,8 @@ class FishInfoHelpView(BaseView):
         
         return embed
     
-    def get_fishpoints_tokens_embed(self) -> discord.Embed:
-        """Generate the FishPoints/Tokens info embed."""
+    def _build_fishpoints_tokens_embed(self) -> discord.Embed:
+        """Build the FishPoints/Tokens info embed."""
         embed = discord.Embed(
             title="💰 FishPoints & FishMaster Tokens",
             color=discord.Color.gold()
@@ -775,8 +804,8 @@ class FishInfoHelpView(BaseView):
         
         return embed
     
-    def get_search_garbage_embed(self) -> discord.Embed:
-        """Generate the Search Garbage info embed."""
+    def _build_search_garbage_embed(self) -> discord.Embed:
+        """Build the Search Garbage info embed."""
         embed = discord.Embed(
             title="🗑️ Searching Garbage for Supplies",
             description="Sometimes fortune favors the resourceful! Search through garbage to find free fishing supplies.",
@@ -816,8 +845,8 @@ class FishInfoHelpView(BaseView):
         
         return embed
     
-    def get_fish_list_embed(self, page: int = 0) -> discord.Embed:
-        """Generate the Fish List embed with pagination."""
+    def _build_fish_list_embed(self, page: int) -> discord.Embed:
+        """Build the Fish List embed with pagination."""
         # Combine all fish into one list for pagination
         all_fish = []
         
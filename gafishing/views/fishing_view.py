@@ -2,7 +2,6 @@
 Fishing view - Where the actual fishing happens.
 """
 
-import asyncio
 import discord
 import time
 from typing import TYPE_CHECKING, Optional
@@ -12,8 +11,7 @@ if TYPE_CHECKING:
 
 from .base_views import BaseView, BackToMenuMixin
 from ..commands.helper_functions import (
-    get_game_calendar,
-    get_game_time_of_day,
+    get_environment,
     FishingSession,
     FishingPhase,
     create_fishing_session,
@@ -28,7 +26,7 @@ from ..commands.helper_functions import (
     handle_line_snap,
     calculate_gear_luck_bonus,
 )
-from ..common.weather import get_weather_for_guild, get_weather_display
+from ..common.weather import get_weather_display
 from ..databases.items import LURES_DATABASE
 
 
@@ -64,6 +62,20 @@ FISHING_LOCATIONS = {
     }
 }
 
+# Phase indicator shown on the active fishing embed
+PHASE_DISPLAY = {
+    FishingPhase.IDLE: "🔵 Ready",
+    FishingPhase.CASTING: "🟡 Casting...",
+    FishingPhase.WAITING: "🟡 Waiting for bite...",
+    FishingPhase.RETRIEVING: "🟡 Retrieving...",
+    FishingPhase.FISH_FOLLOWING: "🟠 Something following!",
+    FishingPhase.FISH_STRIKE: "🔴 FISH ON! Set the hook!",
+    FishingPhase.FIGHTING: "🔴 Fighting fish!",
+    FishingPhase.TENSION_HIGH: "⚠️ HIGH TENSION - Don't reel!",
+    FishingPhase.LANDED: "🟢 Fish Landed!",
+    FishingPhase.ESCAPED: "⚫ Fish Escaped...",
+}
+
 
 class LocationSelectView(BackToMenuMixin, BaseView):
     """View for selecting a fishing location."""
@@ -81,15 +93,7 @@ class LocationSelectView(BackToMenuMixin, BaseView):
         user_data = conf.get_user(self.author)
         
         # Get game time and weather
-        calendar = get_game_calendar(self.cog.db, guild)
-        time_of_day = get_game_time_of_day(self.cog.db, guild)
-        weather = get_weather_for_guild(
-            self.cog.db, 
-            guild, 
-            calendar['season'], 
-            time_of_day['name'],
-            calendar['total_game_days']
-        )
+        weather = get_environment(self.cog.db, guild)['weather']
         
         embed = discord.Embed(
             title="🎣 Choose Your Fishing Spot",
@@ -165,15 +169,7 @@ class FishingView(BackToMenuMixin, BaseView):
         user_data = conf.get_user(self.author)
         
         # Get game time and weather
-        calendar = get_game_calendar(self.cog.db, guild)
-        time_of_day = get_game_time_of_day(self.cog.db, guild)
-        weather = get_weather_for_guild(
-            self.cog.db, 
-            guild, 
-            calendar['season'], 
-            time_of_day['name'],
-            calendar['total_game_days']
-        )
+        weather = get_environment(self.cog.db, guild)['weather']
         
         embed = discord.Embed(
             title=f"{self.location_data['emoji']} {self.location_data['name']}",
@@ -280,7 +276,7 @@ class FishingView(BackToMenuMixin, BaseView):
         luck_bonus = calculate_gear_luck_bonus(user_data)
         
         # Increment fishing attempts counter
-        user_data.total_fishing_attempts += 1
+        user_data.add_stat("total_fishing_attempts", 1)
         self.cog.save()
         
         # Start active fishing!
@@ -424,21 +420,21 @@ class SelectRodView(BaseView):
         from ..databases.items import RODS_DATABASE
         
         options = []
-        for idx, rod in enumerate(user_data.current_rod_inventory):
+        for item_id, rod in user_data.current_rod_inventory.items():
             rod_id = rod.get("rod_id", "")
             rod_info = RODS_DATABASE.get(rod_id, {})
             rod_name = rod_info.get("name", "Unknown Rod")
             durability = rod.get("durability", 0)
             max_dur = rod_info.get("durability", 100)
             
-            is_equipped = user_data.equipped_rod_index == idx
+            is_equipped = user_data.equipped_rod_id == item_id
             label = f"{rod_name} ({durability}/{max_dur})"
             if is_equipped:
                 label = f"✓ {label}"
             
             options.append(discord.SelectOption(
                 label=label[:100],
-                value=str(idx),
+                value=item_id,
                 description=f"Power: {rod_info.get('power', 'N/A')} | Action: {rod_info.get('action', 'N/A')}",
                 default=is_equipped
             ))
@@ -473,8 +469,7 @@ class SelectRodView(BaseView):
         conf = self.cog.db.get_conf(interaction.guild)
         user_data = conf.get_user(self.author)
         
-        selected_idx = int(interaction.data["values"][0])
-        user_data.equip_rod(selected_idx)
+        user_data.equip_rod(interaction.data["values"][0])
         self.cog.save()
         
         # Go back to gear view
@@ -512,8 +507,7 @@ class SelectLureView(BaseView):
         from ..commands.helper_functions import ensure_lure_uses
         
         options = []
-        for idx, lure in enumerate(user_data.current_lure_inventory):
-            lure_id = lure.get("lure_id", "")
+        for lure_id, lure in user_data.current_lure_inventory.items():
             lure_info = LURES_DATABASE.get(lure_id, {})
             lure_name = lure_info.get("name", "Unknown Lure")
             
@@ -523,7 +517,7 @@ class SelectLureView(BaseView):
             uses_per_item = lure.get("uses_per_item", 1)
             max_uses = lure.get("quantity", 0) * uses_per_item
             
-            is_equipped = user_data.equipped_lure_index == idx
+            is_equipped = user_data.equipped_lure_id == lure_id
             label = f"{lure_name} ({remaining_uses}/{max_uses})"
             if is_equipped:
                 label = f"✓ {label}"
@@ -531,7 +525,7 @@ class SelectLureView(BaseView):
             water_type = lure_info.get("water_type", "universal")
             options.append(discord.SelectOption(
                 label=label[:100],
-                value=str(idx),
+                value=lure_id,
                 description=f"Water: {water_type.title()} | Type: {lure_info.get('type', 'N/A')}",
                 default=is_equipped
             ))
@@ -566,8 +560,7 @@ class SelectLureView(BaseView):
         conf = self.cog.db.get_conf(interaction.guild)
         user_data = conf.get_user(self.author)
         
-        selected_idx = int(interaction.data["values"][0])
-        user_data.equip_lure(selected_idx)
+        user_data.equip_lure(interaction.data["values"][0])
         self.cog.save()
         
         # Go back to gear view
@@ -617,7 +610,8 @@ class ActiveFishingView(BaseView):
             location=location,
             water_type=self.location_data.get("water_type", "freshwater"),
             luck_bonus=luck_bonus,
-            rod_id=rod_id
+            rod_id=rod_id,
+            trace=user_data.debug_mode
         )
         
         # Timing control
@@ -638,11 +632,9 @@ class ActiveFishingView(BaseView):
         # Store latest interaction for auto-updates
         self._latest_interaction: Optional[discord.Interaction] = None
         
-        # Task tracking for proper cancellation
-        self._bite_task: Optional[asyncio.Task] = None
-        self._hook_task: Optional[asyncio.Task] = None
-        self._fight_task: Optional[asyncio.Task] = None
-        self._tension_task: Optional[asyncio.Task] = None
+        # Bite checks, hook timeouts, fight events and tension releases are
+        # deadlines on the cog's shared scheduler, keyed by this view.
+        # Only one of them is ever pending at a time.
         
         # Initialize buttons
         self._update_buttons()
@@ -661,24 +653,31 @@ class ActiveFishingView(BaseView):
             return True
         return False
     
+    def _schedule(self, delay: float, callback) -> None:
+        """Schedule this session's next automatic event, replacing any pending one."""
+        self.cog.scheduler.schedule(self, delay, callback)
+    
     def _cancel_all_tasks(self):
-        """Cancel all running async tasks to prevent them from continuing after view closes."""
-        tasks_to_cancel = [
-            self._bite_task,
-            self._hook_task,
-            self._fight_task,
-            self._tension_task
-        ]
-        
-        for task in tasks_to_cancel:
-            if task and not task.done():
-                task.cancel()
-        
-        # Clear references
-        self._bite_task = None
-        self._hook_task = None
-        self._fight_task = None
-        self._tension_task = None
+        """Cancel the pending scheduled event so nothing fires after the view closes."""
+        self.cog.scheduler.cancel(self)
+    
+    def stop(self) -> None:
+        """Stop the view and drop its pending scheduled event."""
+        self._cancel_all_tasks()
+        super().stop()
+    
+    async def _render(self, interaction: Optional[discord.Interaction] = None, **kwargs) -> bool:
+        """
+        Push an update to the fishing message through the cog's edit coalescer.
+        Uses the interaction when given, otherwise the edit is paced per channel
+        and may be merged with later renders.
+        """
+        message = self.message or (interaction.message if interaction else None)
+        if message is None:
+            return False
+        conf = self.cog.db.get_conf(self.author.guild)
+        interval = conf.get_edit_interval(message.channel.id)
+        return await self.cog.edits.submit(message, interval, interaction=interaction, **kwargs)
     
     def _should_timeout_from_inactivity(self) -> bool:
         """Check if user has been inactive for too long."""
@@ -695,12 +694,8 @@ class ActiveFishingView(BaseView):
             if isinstance(item, discord.ui.Button):
                 item.disabled = True
         
-        # Update the message to show disabled buttons
-        if self.message:
-            try:
-                await self.message.edit(view=self)
-            except (discord.NotFound, discord.HTTPException):
-                pass
+        # Update the message to show disabled buttons (merges with any parked render)
+        await self._render(view=self)
         
         # Now stop the view
         self.stop()
@@ -737,7 +732,7 @@ class ActiveFishingView(BaseView):
         
         # Status section - show recent messages
         if self.session.status_messages:
-            status_text = "\n".join(self.session.status_messages[-3:])
+            status_text = "\n".join(self.session.recent_messages(3))
         else:
             status_text = "*Ready to cast your line...*"
         
@@ -753,19 +748,7 @@ class ActiveFishingView(BaseView):
         embed.add_field(name="📊 Status", value=stats_text, inline=True)
         
         # Phase indicator
-        phase_names = {
-            FishingPhase.IDLE: "🔵 Ready",
-            FishingPhase.CASTING: "🟡 Casting...",
-            FishingPhase.WAITING: "🟡 Waiting for bite...",
-            FishingPhase.RETRIEVING: "🟡 Retrieving...",
-            FishingPhase.FISH_FOLLOWING: "🟠 Something following!",
-            FishingPhase.FISH_STRIKE: "🔴 FISH ON! Set the hook!",
-            FishingPhase.FIGHTING: "🔴 Fighting fish!",
-            FishingPhase.TENSION_HIGH: "⚠️ HIGH TENSION - Don't reel!",
-            FishingPhase.LANDED: "🟢 Fish Landed!",
-            FishingPhase.ESCAPED: "⚫ Fish Escaped...",
-        }
-        phase_display = phase_names.get(self.session.phase, "Unknown")
+        phase_display = PHASE_DISPLAY.get(self.session.phase, "Unknown")
         embed.add_field(name="🎯 Phase", value=phase_display, inline=True)
         
         return embed
@@ -880,7 +863,7 @@ class ActiveFishingView(BaseView):
         """Refresh the embed and buttons."""
         self._update_buttons()
         embed = await self.create_fishing_embed(interaction.guild)
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self._render(interaction, embed=embed, view=self)
     
     async def _on_cast_line(self, interaction: discord.Interaction):
         """Handle Cast Line button."""
@@ -900,7 +883,7 @@ class ActiveFishingView(BaseView):
             equipped_lure = user_data.get_equipped_lure()
             if not equipped_lure or equipped_lure.get("quantity", 0) <= 0:
                 # No bait! Unequip and send back to location
-                user_data.equipped_lure_index = None
+                user_data.unequip_lure()
                 self.cog.save()
                 
                 await interaction.response.send_message(
@@ -910,6 +893,7 @@ class ActiveFishingView(BaseView):
                 
                 # Return to location view
                 self.stop()
+                self.cog.edits.discard(self.message)
                 new_view = FishingView(cog=self.cog, author=self.author, location=self.location)
                 embed = await new_view.create_fishing_embed(interaction.guild)
                 new_view.message = self.message
@@ -917,7 +901,7 @@ class ActiveFishingView(BaseView):
                 return
             
             # Increment fishing attempts counter
-            user_data.total_fishing_attempts += 1
+            user_data.add_stat("total_fishing_attempts", 1)
             self.cog.save()
             
             # Cast the line
@@ -926,21 +910,17 @@ class ActiveFishingView(BaseView):
             # Update view
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await self._render(interaction, embed=embed, view=self)
             
             # Start waiting for bite (10 second delay)
-            # Cancel any existing bite task first
-            if self._bite_task and not self._bite_task.done():
-                self._bite_task.cancel()
-            
             self._waiting_for_bite = True
-            self._bite_task = asyncio.create_task(self._wait_for_bite(interaction))
+            self._schedule(10, self._wait_for_bite)
         finally:
             self._processing = False
     
-    async def _wait_for_bite(self, interaction: discord.Interaction):
-        """Wait for a fish to show interest."""
-        await asyncio.sleep(10)  # 10 second wait
+    async def _wait_for_bite(self):
+        """Check whether a fish shows interest (runs 10 seconds after the cast or last check)."""
+        guild = self.author.guild
         
         # Check if view is still active
         if not self.is_active():
@@ -952,17 +932,9 @@ class ActiveFishingView(BaseView):
         self._waiting_for_bite = False
         
         # Get game conditions
-        conf = self.cog.db.get_conf(interaction.guild)
+        conf = self.cog.db.get_conf(guild)
         user_data = conf.get_user(self.author)
-        calendar = get_game_calendar(self.cog.db, interaction.guild)
-        time_of_day = get_game_time_of_day(self.cog.db, interaction.guild)
-        weather = get_weather_for_guild(
-            self.cog.db,
-            interaction.guild,
-            calendar['season'],
-            time_of_day['name'],
-            calendar['total_game_days']
-        )
+        env = get_environment(self.cog.db, guild)
         
         equipped_lure = user_data.get_equipped_lure()
         bait_id = equipped_lure.get("lure_id", "") if equipped_lure else ""
@@ -970,8 +942,8 @@ class ActiveFishingView(BaseView):
         # Check for bite
         interested, msg = check_for_bite(
             self.session,
-            calendar['season'],
-            weather['type'].value if hasattr(weather['type'], 'value') else str(weather['type']),
+            env['season'],
+            env['weather']['type'],
             bait_id
         )
         
@@ -981,22 +953,14 @@ class ActiveFishingView(BaseView):
         
         # Update display
         self._update_buttons()
-        embed = await self.create_fishing_embed(interaction.guild)
-        try:
-            await self.message.edit(embed=embed, view=self)
-        except discord.NotFound:
-            return
-        except discord.HTTPException:
+        embed = await self.create_fishing_embed(guild)
+        if not await self._render(embed=embed, view=self):
             return
         
         # If nothing biting, automatically wait and check again
         if not interested and self.session.phase == FishingPhase.WAITING and self.is_active():
-            # Cancel any existing bite task before starting a new one
-            if self._bite_task and not self._bite_task.done():
-                self._bite_task.cancel()
-            
             self._waiting_for_bite = True
-            self._bite_task = asyncio.create_task(self._wait_for_bite(interaction))
+            self._schedule(10, self._wait_for_bite)
     
     async def _on_retrieve(self, interaction: discord.Interaction):
         """Handle Retrieve button (no fish following)."""
@@ -1017,18 +981,13 @@ class ActiveFishingView(BaseView):
             
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await self._render(interaction, embed=embed, view=self)
             
             # If still waiting phase, restart the timer
             if self.session.phase in (FishingPhase.WAITING, FishingPhase.RETRIEVING):
                 self.session.phase = FishingPhase.WAITING
-                
-                # Cancel any existing bite task before starting a new one
-                if self._bite_task and not self._bite_task.done():
-                    self._bite_task.cancel()
-                
                 self._waiting_for_bite = True
-                self._bite_task = asyncio.create_task(self._wait_for_bite(interaction))
+                self._schedule(10, self._wait_for_bite)
         finally:
             self._processing = False
     
@@ -1048,15 +1007,7 @@ class ActiveFishingView(BaseView):
             # Get game conditions for fish strike
             conf = self.cog.db.get_conf(interaction.guild)
             user_data = conf.get_user(self.author)
-            calendar = get_game_calendar(self.cog.db, interaction.guild)
-            time_of_day = get_game_time_of_day(self.cog.db, interaction.guild)
-            weather = get_weather_for_guild(
-                self.cog.db,
-                interaction.guild,
-                calendar['season'],
-                time_of_day['name'],
-                calendar['total_game_days']
-            )
+            env = get_environment(self.cog.db, interaction.guild)
             
             equipped_lure = user_data.get_equipped_lure()
             bait_id = equipped_lure.get("lure_id", "") if equipped_lure else ""
@@ -1064,38 +1015,28 @@ class ActiveFishingView(BaseView):
             # Check if fish strikes (50/50)
             fish_id, fish_data, msg = fish_strikes(
                 self.session,
-                calendar['season'],
-                weather['type'].value if hasattr(weather['type'], 'value') else str(weather['type']),
+                env['season'],
+                env['weather']['type'],
                 bait_id
             )
             
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await self._render(interaction, embed=embed, view=self)
             
             # If fish struck, start the hook timeout
             if fish_id and self.is_active():
-                # Cancel any existing hook task before starting a new one
-                if self._hook_task and not self._hook_task.done():
-                    self._hook_task.cancel()
-                
                 self._waiting_for_strike = True
-                self._hook_task = asyncio.create_task(self._wait_for_hook_set(interaction))
+                self._schedule(5, self._wait_for_hook_set)
             elif self.session.phase == FishingPhase.WAITING and self.is_active():
                 # Fish swam away - restart waiting for bite
-                # Cancel any existing bite task before starting a new one
-                if self._bite_task and not self._bite_task.done():
-                    self._bite_task.cancel()
-                
                 self._waiting_for_bite = True
-                self._bite_task = asyncio.create_task(self._wait_for_bite(interaction))
+                self._schedule(10, self._wait_for_bite)
         finally:
             self._processing = False
     
-    async def _wait_for_hook_set(self, interaction: discord.Interaction):
-        """Wait for player to set hook (5 second timeout)."""
-        await asyncio.sleep(5)
-        
+    async def _wait_for_hook_set(self):
+        """Player didn't set the hook within 5 seconds of the strike."""
         # Check if view is still active
         if not self.is_active():
             return
@@ -1108,7 +1049,6 @@ class ActiveFishingView(BaseView):
         # Player didn't set hook in time!
         self.session.phase = FishingPhase.WAITING
         self.session.fish_id = None
-        self.session.fish_data = None
         self.session.timeout_seconds = 3.0
         self.session.add_message("*Too slow! The fish spits out the hook and swims away.*")
         
@@ -1117,13 +1057,8 @@ class ActiveFishingView(BaseView):
             return
         
         self._update_buttons()
-        embed = await self.create_fishing_embed(interaction.guild)
-        try:
-            await self.message.edit(embed=embed, view=self)
-        except discord.NotFound:
-            pass
-        except discord.HTTPException:
-            pass
+        embed = await self.create_fishing_embed(self.author.guild)
+        await self._render(embed=embed, view=self)
     
     async def _on_set_hook(self, interaction: discord.Interaction):
         """Handle Set Hook button."""
@@ -1142,10 +1077,8 @@ class ActiveFishingView(BaseView):
         try:
             self._waiting_for_strike = False
             
-            # Cancel hook timeout task if it's running
-            if self._hook_task and not self._hook_task.done():
-                self._hook_task.cancel()
-                self._hook_task = None
+            # Cancel the pending hook timeout
+            self._cancel_all_tasks()
             
             # Get user data for spawn checking
             conf = self.cog.db.get_conf(interaction.guild)
@@ -1163,45 +1096,22 @@ class ActiveFishingView(BaseView):
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
             
-            message_updated = False
-            try:
-                await interaction.edit_original_response(embed=embed, view=self)
-                message_updated = True
-            except (discord.NotFound, discord.HTTPException):
-                # Interaction failed, try direct message edit
-                try:
-                    await self.message.edit(embed=embed, view=self)
-                    message_updated = True
-                except (discord.NotFound, discord.HTTPException):
-                    pass
+            # Falls back to a paced message edit if the interaction failed
+            message_updated = await self._render(interaction, embed=embed, view=self)
             
             # Only start fight sequence if message was updated successfully and hook was set
             if success and message_updated:
-                # Cancel any existing fight task before starting a new one
-                if self._fight_task and not self._fight_task.done():
-                    self._fight_task.cancel()
-                
-                # Start the fight!
-                self._fight_task = asyncio.create_task(self._start_fight_sequence(interaction))
+                # Start the fight! Brief pause so the first event doesn't collide with user clicks
+                self._schedule(3.5, self._start_fight_sequence)
         finally:
             self._processing = False
     
-    async def _start_fight_sequence(self, interaction: discord.Interaction):
-        """Start the fish fighting sequence."""
-        # Store reference to this task so we can check if we've been superseded
-        my_task = asyncio.current_task()
-        
-        await asyncio.sleep(3.5)  # Brief pause - increased from 2s to reduce collision with user clicks
-        
+    async def _start_fight_sequence(self):
+        """Run the next fish fight event (scheduled 3.5 seconds after the previous one)."""
         # Check if view is still active
         if not self.is_active():
-            self.session.add_message("DEBUG: Fight stopped - view not active")
             return
         
-        # Check if we've been replaced by a newer task
-        if self._fight_task != my_task:
-            return  # A newer fight task has been started, exit quietly
-        
         # Check if user has been inactive too long
         if self._should_timeout_from_inactivity():
             self.session.add_message("*You've been idle too long. The fish escapes!*")
@@ -1219,27 +1129,11 @@ class ActiveFishingView(BaseView):
             # Fish is landed - no more auto-events
             return
         
-        # Wait for any user interactions to complete before updating
-        max_wait = 30  # Maximum 3 seconds wait - increased for better user priority
-        wait_count = 0
-        while self._processing and wait_count < max_wait:
-            await asyncio.sleep(0.1)
-            wait_count += 1
-        
-        # If still processing after 3 seconds, skip this auto-update to avoid conflicts
+        # A user click is being handled, give it priority and try again shortly
         if self._processing:
-            # Reschedule for later
-            if self.is_active():
-                self._fight_task = asyncio.create_task(self._start_fight_sequence(self._latest_interaction or interaction))
-            return
-        
-        if not self.is_active():
+            self._schedule(0.5, self._start_fight_sequence)
             return
         
-        # Check again if we've been superseded (player might have clicked during wait)
-        if self._fight_task != my_task:
-            return  # Exit quietly, newer task will handle it
-        
         # Get next fight event
         phase, msg, should_reel = get_fight_event(self.session)
         
@@ -1248,40 +1142,28 @@ class ActiveFishingView(BaseView):
             return
         
         self._update_buttons()
-        embed = await self.create_fishing_embed(interaction.guild)
+        embed = await self.create_fishing_embed(self.author.guild)
         
         # Try to update the message, but don't stop the fight if it fails
-        try:
-            await self.message.edit(embed=embed, view=self)
-        except (discord.NotFound, discord.HTTPException):
-            pass  # Continue fighting even if UI update fails
+        await self._render(embed=embed, view=self)
+        
+        # A click may have scheduled something newer while we were editing
+        if self.cog.scheduler.time_left(self) is not None or not self.is_active():
+            return
         
         # If tension high, wait for timeout then process
-        if phase == FishingPhase.TENSION_HIGH and self.is_active():
-            # Cancel any existing tension task before starting a new one
-            if self._tension_task and not self._tension_task.done():
-                self._tension_task.cancel()
-            
-            self._tension_task = asyncio.create_task(self._wait_for_tension_release(interaction))
-        elif phase == FishingPhase.FIGHTING and self.is_active():
-            # Continue the fight sequence - just create new task, don't cancel current one
-            self._fight_task = asyncio.create_task(self._start_fight_sequence(interaction))
+        if phase == FishingPhase.TENSION_HIGH:
+            self._schedule(3, self._wait_for_tension_release)
+        elif phase == FishingPhase.FIGHTING:
+            # Continue the fight sequence
+            self._schedule(3.5, self._start_fight_sequence)
     
-    async def _wait_for_tension_release(self, interaction: discord.Interaction):
-        """Wait during high tension phase."""
-        # Store reference to this task so we can check if we've been superseded
-        my_task = asyncio.current_task()
-        
-        await asyncio.sleep(3)  # 3 second wait
-        
+    async def _wait_for_tension_release(self):
+        """Player waited out the high tension phase (scheduled 3 seconds after it began)."""
         # Check if view is still active
         if not self.is_active():
             return
         
-        # Check if we've been replaced by a newer task
-        if self._tension_task != my_task:
-            return  # A newer tension task has been started, exit quietly
-        
         # Check if user has been inactive too long
         if self._should_timeout_from_inactivity():
             self.session.add_message("*You've been idle too long. The fish escapes!*")
@@ -1293,27 +1175,11 @@ class ActiveFishingView(BaseView):
         if self.session.phase != FishingPhase.TENSION_HIGH:
             return
         
-        # Wait for any user interactions to complete before updating
-        max_wait = 30  # Maximum 3 seconds wait - increased for better user priority
-        wait_count = 0
-        while self._processing and wait_count < max_wait:
-            await asyncio.sleep(0.1)
-            wait_count += 1
-        
-        # If still processing after 3 seconds, skip this auto-update to avoid conflicts
+        # A user click is being handled, give it priority and try again shortly
         if self._processing:
-            # Reschedule for later
-            if self.is_active():
-                self._tension_task = asyncio.create_task(self._wait_for_tension_release(self._latest_interaction or interaction))
-            return
-        
-        if not self.is_active():
+            self._schedule(0.5, self._wait_for_tension_release)
             return
         
-        # Check again if we've been superseded (player might have clicked during wait)
-        if self._tension_task != my_task:
-            return  # Exit quietly, newer task will handle it
-        
         # Player waited correctly
         success, msg, landed = process_reel_attempt(self.session, did_reel=False)
         
@@ -1322,15 +1188,16 @@ class ActiveFishingView(BaseView):
             return
         
         self._update_buttons()
-        embed = await self.create_fishing_embed(interaction.guild)
-        try:
-            await self.message.edit(embed=embed, view=self)
-        except (discord.NotFound, discord.HTTPException):
+        embed = await self.create_fishing_embed(self.author.guild)
+        if not await self._render(embed=embed, view=self):
+            return
+        
+        if self.cog.scheduler.time_left(self) is not None or not self.is_active():
             return
         
-        if self.session.phase == FishingPhase.FIGHTING and self.is_active():
-            # Continue fight - use latest interaction if available
-            self._fight_task = asyncio.create_task(self._start_fight_sequence(self._latest_interaction or interaction))
+        if self.session.phase == FishingPhase.FIGHTING:
+            # Continue fight
+            self._schedule(3.5, self._start_fight_sequence)
     
     async def _on_reel_during_tension(self, interaction: discord.Interaction):
         """Handle Reel In button during high tension - this is a MISTAKE!"""
@@ -1357,10 +1224,8 @@ class ActiveFishingView(BaseView):
         await interaction.response.defer()
         
         try:
-            # Cancel tension task if player clicked during it
-            if self._tension_task and not self._tension_task.done():
-                self._tension_task.cancel()
-                self._tension_task = None
+            # Cancel the pending tension release, the player acted first
+            self._cancel_all_tasks()
             
             conf = self.cog.db.get_conf(interaction.guild)
             user_data = conf.get_user(self.author)
@@ -1380,28 +1245,15 @@ class ActiveFishingView(BaseView):
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
             
-            message_updated = False
-            try:
-                await interaction.edit_original_response(embed=embed, view=self)
-                message_updated = True
-            except (discord.NotFound, discord.HTTPException):
-                # Interaction failed, try direct message edit
-                try:
-                    await self.message.edit(embed=embed, view=self)
-                    message_updated = True
-                except (discord.NotFound, discord.HTTPException):
-                    pass
+            # Falls back to a paced message edit if the interaction failed
+            message_updated = await self._render(interaction, embed=embed, view=self)
             
-            # Restart fight sequence if still fighting (player interaction canceled the auto-task)
+            # Restart fight sequence if still fighting (player interaction replaces the pending event)
             if message_updated and self.is_active():
                 if self.session.phase == FishingPhase.FIGHTING:
-                    if self._fight_task and not self._fight_task.done():
-                        self._fight_task.cancel()
-                    self._fight_task = asyncio.create_task(self._start_fight_sequence(interaction))
+                    self._schedule(3.5, self._start_fight_sequence)
                 elif self.session.phase == FishingPhase.TENSION_HIGH:
-                    if self._tension_task and not self._tension_task.done():
-                        self._tension_task.cancel()
-                    self._tension_task = asyncio.create_task(self._wait_for_tension_release(interaction))
+                    self._schedule(3, self._wait_for_tension_release)
         finally:
             self._processing = False
     
@@ -1436,12 +1288,23 @@ class ActiveFishingView(BaseView):
             success, msg, landed = process_reel_attempt(self.session, did_reel=True)
             
             if landed:
-                # Fish is landed!
+                # Fish is landed! Note the bait before landing it uses it up
+                equipped_lure = user_data.get_equipped_lure()
+                bait_id = equipped_lure.get("lure_id", "") if equipped_lure else ""
                 land_msg, is_record, earned_token, debug_info = land_the_fish(
                     self.session, user_data, 
                     debug_log=self.cog.debug_log, 
                     user_obj=self.author
                 )
+                derby = self.cog.derbies.get(interaction.guild.id)
+                if derby is not None:
+                    derby.record_catch(
+                        self.author.id, self.location, self.session.fish_id,
+                        self.session.fish_weight_oz, self.session.fish_data.get("base_fishpoints", 10)
+                    )
+                if conf.catch_history_enabled:
+                    weather = get_environment(self.cog.db, interaction.guild)['weather']['type']
+                    self.cog.record_catch_history(interaction.guild, self.author.id, self.session, weather, bait_id)
                 self.cog.save()
                 
                 # Send debug info if user has debug mode enabled
@@ -1460,7 +1323,8 @@ class ActiveFishingView(BaseView):
                         f"Length: {l} in / {max_l} in {length_status}\n"
                         f"Token Awarded: {'Yes ✅' if debug_info['earned_token'] else 'No'}\n"
                         f"Perfect Trophy: {'Yes 🌟' if debug_info['earned_perfect_trophy'] else 'No'}\n"
-                        f"Total Tokens: {debug_info['total_tokens']}"
+                        f"Total Tokens: {debug_info['total_tokens']}\n"
+                        f"Session Seed: `{debug_info['seed']}`"
                     )
                     try:
                         await interaction.followup.send(debug_msg, ephemeral=True)
@@ -1479,28 +1343,15 @@ class ActiveFishingView(BaseView):
             self._update_buttons()
             embed = await self.create_fishing_embed(interaction.guild)
             
-            message_updated = False
-            try:
-                await interaction.edit_original_response(embed=embed, view=self)
-                message_updated = True
-            except (discord.NotFound, discord.HTTPException):
-                # Interaction failed, try direct message edit
-                try:
-                    await self.message.edit(embed=embed, view=self)
-                    message_updated = True
-                except (discord.NotFound, discord.HTTPException):
-                    pass
+            # Falls back to a paced message edit if the interaction failed
+            message_updated = await self._render(interaction, embed=embed, view=self)
             
-            # Restart fight sequence if still fighting (player interaction canceled the auto-task)
+            # Restart fight sequence if still fighting (player interaction replaces the pending event)
             if message_updated and self.is_active():
                 if self.session.phase == FishingPhase.FIGHTING:
-                    if self._fight_task and not self._fight_task.done():
-                        self._fight_task.cancel()
-                    self._fight_task = asyncio.create_task(self._start_fight_sequence(interaction))
+                    self._schedule(3.5, self._start_fight_sequence)
                 elif self.session.phase == FishingPhase.TENSION_HIGH:
-                    if self._tension_task and not self._tension_task.done():
-                        self._tension_task.cancel()
-                    self._tension_task = asyncio.create_task(self._wait_for_tension_release(interaction))
+                    self._schedule(3, self._wait_for_tension_release)
         finally:
             self._processing = False
     
@@ -1513,7 +1364,7 @@ class ActiveFishingView(BaseView):
         equipped_lure = user_data.get_equipped_lure()
         if not equipped_lure or equipped_lure.get("quantity", 0) <= 0:
             # No bait! Unequip and send back to location
-            user_data.equipped_lure_index = None
+            user_data.unequip_lure()
             self.cog.save()
             
             await interaction.response.send_message(
@@ -1523,22 +1374,26 @@ class ActiveFishingView(BaseView):
             
             # Return to location view
             self.stop()
+            self.cog.edits.discard(self.message)
             new_view = FishingView(cog=self.cog, author=self.author, location=self.location)
             embed = await new_view.create_fishing_embed(interaction.guild)
             new_view.message = self.message
             await self.message.edit(embed=embed, view=new_view)
             return
         
-        # Reset session for new cast (keep same luck bonus)
-        self.session = create_fishing_session(
+        # Reuse the session for the new cast (keep same luck bonus and current rod)
+        equipped_rod = user_data.get_equipped_rod()
+        self.session.reset(
             location=self.location,
             water_type=self.location_data.get("water_type", "freshwater"),
-            luck_bonus=self.luck_bonus
+            luck_bonus=self.luck_bonus,
+            rod_id=equipped_rod.get("rod_id", "") if equipped_rod else None,
+            trace=user_data.debug_mode
         )
         
         self._update_buttons()
         embed = await self.create_fishing_embed(interaction.guild)
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self._render(interaction, embed=embed, view=self)
     
     async def _on_stop_fishing(self, interaction: discord.Interaction):
         """Handle Stop Fishing button - return to location."""
@@ -1549,6 +1404,7 @@ class ActiveFishingView(BaseView):
         self._cancel_all_tasks()
         
         self.stop()
+        self.cog.edits.discard(self.message)
         new_view = FishingView(cog=self.cog, author=self.author, location=self.location)
         embed = await new_view.create_fishing_embed(interaction.guild)
         new_view.message = self.message
@@ -1558,6 +1414,10 @@ class ActiveFishingView(BaseView):
         """Return to the fishing location view."""
         await self._on_stop_fishing(interaction)
     
+    def can_evict(self) -> bool:
+        """Only close a session for being over the menu limit when no line is out."""
+        return self.session.phase in (FishingPhase.IDLE, FishingPhase.LANDED, FishingPhase.ESCAPED)
+    
     async def on_timeout(self):
         """Handle view timeout."""
         self._waiting_for_bite = False
@@ -4,6 +4,7 @@ Inventory view - View and manage your fishing gear and catches.
 
 import discord
 from typing import TYPE_CHECKING, Optional
+import math
 
 if TYPE_CHECKING:
     from ..main import GreenacresFishing
@@ -14,6 +15,8 @@ from ..databases.items import RODS_DATABASE, LURES_DATABASE, HATS_DATABASE, COAT
 # Combined clothing lookup
 CLOTHING_DATABASE = {**HATS_DATABASE, **COATS_DATABASE, **BOOTS_DATABASE}
 
+FISH_PER_PAGE = 15
+
 
 class InventoryView(BaseView):
     """View for the player's inventory."""
@@ -26,12 +29,15 @@ class InventoryView(BaseView):
     ):
         super().__init__(cog=cog, author=author)
         self.category = category
+        self.fish_page = 0
         
         # Initialize the view with all buttons
         if self.category == "clothing":
             self._add_clothing_selects()
         self._add_back_button()
         self._add_category_buttons()
+        if self.category == "fish":
+            self._add_fish_page_buttons()
     
     async def create_inventory_embed(self) -> discord.Embed:
         """Create the inventory embed based on current category."""
@@ -59,7 +65,7 @@ class InventoryView(BaseView):
         
         # Count items in each category
         rod_count = len(user_data.current_rod_inventory)
-        lure_count = sum(item.get("quantity", 1) for item in user_data.current_lure_inventory)
+        lure_count = sum(item.get("quantity", 1) for item in user_data.current_lure_inventory.values())
         clothing_count = len(user_data.current_clothing_inventory)
         fish_count = len(user_data.current_fish_inventory)
         
@@ -98,13 +104,13 @@ class InventoryView(BaseView):
             embed.description = "You don't have any rods! Visit the Bait Shop to buy one."
         else:
             rod_lines = []
-            for idx, rod in enumerate(user_data.current_rod_inventory):
+            for item_id, rod in user_data.current_rod_inventory.items():
                 rod_id = rod.get("rod_id")
                 durability = rod.get("durability", 0)
                 rod_info = RODS_DATABASE.get(rod_id, {})
                 name = rod_info.get("name", rod_id)
                 max_durability = rod_info.get("durability", 100)
-                is_equipped = user_data.equipped_rod_index == idx
+                is_equipped = user_data.equipped_rod_id == item_id
                 equipped = " ✅ *Equipped*" if is_equipped else ""
                 rod_lines.append(f"**{name}** - {durability}/{max_durability} durability{equipped}")
             
@@ -125,8 +131,7 @@ class InventoryView(BaseView):
         else:
             from ..commands.helper_functions import ensure_lure_uses
             lure_lines = []
-            for idx, lure in enumerate(user_data.current_lure_inventory):
-                lure_id = lure.get("lure_id")
+            for lure_id, lure in user_data.current_lure_inventory.items():
                 
                 # Ensure uses tracking
                 ensure_lure_uses(lure)
@@ -137,7 +142,7 @@ class InventoryView(BaseView):
                 
                 lure_info = LURES_DATABASE.get(lure_id, {})
                 name = lure_info.get("name", lure_id)
-                is_equipped = user_data.equipped_lure_index == idx
+                is_equipped = user_data.equipped_lure_id == lure_id
                 equipped = " ✅ *Equipped*" if is_equipped else ""
                 lure_lines.append(f"**{name}** ({remaining_uses}/{max_uses} uses){equipped}")
             
@@ -161,7 +166,7 @@ class InventoryView(BaseView):
             coats = []
             boots = []
             
-            for idx, item in enumerate(user_data.current_clothing_inventory):
+            for key, item in user_data.current_clothing_inventory.items():
                 item_id = item.get("clothing_id")
                 item_info = CLOTHING_DATABASE.get(item_id, {})
                 name = item_info.get("name", item_id)
@@ -169,13 +174,7 @@ class InventoryView(BaseView):
                 luck = item_info.get("luck_bonus", 0)
                 
                 # Check if this item is equipped based on its slot
-                is_equipped = False
-                if slot == "hat" and user_data.equipped_hat_index == idx:
-                    is_equipped = True
-                elif slot == "coat" and user_data.equipped_coat_index == idx:
-                    is_equipped = True
-                elif slot == "boots" and user_data.equipped_boots_index == idx:
-                    is_equipped = True
+                is_equipped = user_data.get_equipped_clothing_id(slot) == key
                 
                 equipped = " ✅" if is_equipped else ""
                 item_line = f"**{name}**{equipped} (+{luck} luck)"
@@ -233,9 +232,15 @@ class InventoryView(BaseView):
         if not user_data.current_fish_inventory:
             embed.description = "You haven't caught any fish yet! Go fishing to fill your bucket."
         else:
+            # Only the fish on this page are formatted
+            total_pages = self._fish_page_count(user_data)
+            self.fish_page = min(self.fish_page, total_pages - 1)
+            start_idx = self.fish_page * FISH_PER_PAGE
+            page_fish = user_data.current_fish_inventory[start_idx:start_idx + FISH_PER_PAGE]
+            
             # Show individual fish with length and weight
             fish_lines = []
-            for fish in user_data.current_fish_inventory:
+            for fish in page_fish:
                 fish_id = fish.get("fish_id", "unknown")
                 display_name = fish_id.replace("_", " ").title()
                 
@@ -257,19 +262,28 @@ class InventoryView(BaseView):
                 
                 fish_lines.append(f"{trophy}**{display_name}** • {length_display} • {weight_display}")
             
-            # Limit display to avoid embed limits
-            if len(fish_lines) > 15:
-                embed.description = "\n".join(fish_lines[:15])
-                embed.description += f"\n\n*...and {len(fish_lines) - 15} more fish*"
-            else:
-                embed.description = "\n".join(fish_lines) if fish_lines else "No fish in inventory."
+            embed.description = "\n".join(fish_lines)
             
-            # Summary
+            # Summary from the running totals
+            ledger = user_data.fish_ledger
+            count, value = ledger.selection()
+            trophies, _ = ledger.selection(trophy=True)
+            top_species = ", ".join(
+                f"{fish_id.replace('_', ' ').title()} ×{n:,}" for fish_id, n in ledger.by_count()[:3]
+            )
             embed.add_field(
                 name="📊 Summary",
-                value=f"Total fish: **{len(user_data.current_fish_inventory)}**",
+                value=(
+                    f"Total fish: **{count:,}** ({trophies:,} 🏆)\n"
+                    f"Sell value: **{value:,} FP**\n"
+                    f"Most caught: {top_species}"
+                ),
                 inline=False
             )
+            
+            if total_pages > 1:
+                embed.set_footer(text=f"Page {self.fish_page + 1}/{total_pages} • Sell your fish at the Bait Shop!")
+                return embed
         
         embed.set_footer(text="Sell your fish at the Bait Shop!")
         return embed
@@ -284,17 +298,17 @@ class InventoryView(BaseView):
         coats = []
         boots = []
         
-        for idx, item in enumerate(user_data.current_clothing_inventory):
+        for key, item in user_data.current_clothing_inventory.items():
             item_id = item.get("clothing_id")
             item_info = CLOTHING_DATABASE.get(item_id, {})
             slot = item.get("slot", item_info.get("slot", "unknown"))
             
             if slot == "hat":
-                hats.append((idx, item, item_info))
+                hats.append((key, item, item_info))
             elif slot == "coat":
-                coats.append((idx, item, item_info))
+                coats.append((key, item, item_info))
             elif slot == "boots":
-                boots.append((idx, item, item_info))
+                boots.append((key, item, item_info))
         
         # Add hat selector
         if hats:
@@ -302,17 +316,17 @@ class InventoryView(BaseView):
                 label="None (Unequip)",
                 value="none",
                 emoji="❌",
-                default=(user_data.equipped_hat_index is None)
+                default=(user_data.equipped_hat_id is None)
             )]
             
-            for idx, item, item_info in hats:
+            for key, item, item_info in hats:
                 name = item_info.get("name", "Unknown Hat")
                 luck = item_info.get("luck_bonus", 0)
-                is_equipped = user_data.equipped_hat_index == idx
+                is_equipped = user_data.equipped_hat_id == key
                 
                 hat_options.append(discord.SelectOption(
                     label=name[:100],
-                    value=str(idx),
+                    value=key,
                     description=f"+{luck} luck",
                     emoji="✅" if is_equipped else "🎩",
                     default=is_equipped
@@ -332,17 +346,17 @@ class InventoryView(BaseView):
                 label="None (Unequip)",
                 value="none",
                 emoji="❌",
-                default=(user_data.equipped_coat_index is None)
+                default=(user_data.equipped_coat_id is None)
             )]
             
-            for idx, item, item_info in coats:
+            for key, item, item_info in coats:
                 name = item_info.get("name", "Unknown Coat")
                 luck = item_info.get("luck_bonus", 0)
-                is_equipped = user_data.equipped_coat_index == idx
+                is_equipped = user_data.equipped_coat_id == key
                 
                 coat_options.append(discord.SelectOption(
                     label=name[:100],
-                    value=str(idx),
+                    value=key,
                     description=f"+{luck} luck",
                     emoji="✅" if is_equipped else "🧥",
                     default=is_equipped
@@ -362,17 +376,17 @@ class InventoryView(BaseView):
                 label="None (Unequip)",
                 value="none",
                 emoji="❌",
-                default=(user_data.equipped_boots_index is None)
+                default=(user_data.equipped_boots_id is None)
             )]
             
-            for idx, item, item_info in boots:
+            for key, item, item_info in boots:
                 name = item_info.get("name", "Unknown Boots")
                 luck = item_info.get("luck_bonus", 0)
-                is_equipped = user_data.equipped_boots_index == idx
+                is_equipped = user_data.equipped_boots_id == key
                 
                 boots_options.append(discord.SelectOption(
                     label=name[:100],
-                    value=str(idx),
+                    value=key,
                     description=f"+{luck} luck",
                     emoji="✅" if is_equipped else "👢",
                     default=is_equipped
@@ -396,8 +410,7 @@ class InventoryView(BaseView):
         if selected_value == "none":
             user_data.unequip_clothing("hat")
         else:
-            idx = int(selected_value)
-            user_data.equip_clothing(idx)
+            user_data.equip_clothing(selected_value)
         
         self.cog.save()
         
@@ -420,8 +433,7 @@ class InventoryView(BaseView):
         if selected_value == "none":
             user_data.unequip_clothing("coat")
         else:
-            idx = int(selected_value)
-            user_data.equip_clothing(idx)
+            user_data.equip_clothing(selected_value)
         
         self.cog.save()
         
@@ -444,8 +456,7 @@ class InventoryView(BaseView):
         if selected_value == "none":
             user_data.unequip_clothing("boots")
         else:
-            idx = int(selected_value)
-            user_data.equip_clothing(idx)
+            user_data.equip_clothing(selected_value)
         
         self.cog.save()
         
@@ -485,6 +496,35 @@ class InventoryView(BaseView):
         clothing_btn.callback = self.show_clothing
         self.add_item(clothing_btn)
     
+    def _fish_page_count(self, user_data) -> int:
+        return max(1, math.ceil(len(user_data.current_fish_inventory) / FISH_PER_PAGE))
+    
+    def _add_fish_page_buttons(self):
+        """Add page buttons under the fish list when it doesn't fit on one page."""
+        user_data = self.cog.db.get_conf(self.author.guild).get_user(self.author)
+        if self._fish_page_count(user_data) <= 1:
+            return
+        prev_btn = discord.ui.Button(label="◀", style=discord.ButtonStyle.primary, row=2)
+        prev_btn.callback = self.prev_fish_page
+        self.add_item(prev_btn)
+        next_btn = discord.ui.Button(label="▶", style=discord.ButtonStyle.primary, row=2)
+        next_btn.callback = self.next_fish_page
+        self.add_item(next_btn)
+    
+    async def _turn_fish_page(self, interaction: discord.Interaction, step: int):
+        user_data = self.cog.db.get_conf(interaction.guild).get_user(self.author)
+        self.fish_page = (self.fish_page + step) % self._fish_page_count(user_data)
+        embed = await self.create_inventory_embed()
+        await interaction.response.edit_message(embed=embed, view=self)
+    
+    async def prev_fish_page(self, interaction: discord.Interaction, button: discord.ui.Button = None):
+        """Go to previous page of fish (wraps to last)."""
+        await self._turn_fish_page(interaction, -1)
+    
+    async def next_fish_page(self, interaction: discord.Interaction, button: discord.ui.Button = None):
+        """Go to next page of fish (wraps to first)."""
+        await self._turn_fish_page(interaction, 1)
+    
     def _add_back_button(self):
         """Add the back button."""
         # Back button goes on same row as Overview/Fish, but is added last so it appears on the right
@@ -503,6 +543,9 @@ class InventoryView(BaseView):
             self._add_clothing_selects()
         self._add_back_button()
         self._add_category_buttons()
+        if category == "fish":
+            self.fish_page = 0
+            self._add_fish_page_buttons()
         
         embed = await self.create_inventory_embed()
         await interaction.response.edit_message(embed=embed, view=self)
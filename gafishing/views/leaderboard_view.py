@@ -3,7 +3,7 @@ Leaderboard view - View server fishing rankings.
 """
 
 import discord
-from typing import TYPE_CHECKING, List, Tuple, Optional
+from typing import TYPE_CHECKING, List, Optional
 import math
 
 if TYPE_CHECKING:
@@ -13,6 +13,34 @@ from .base_views import BaseView, BackToMenuMixin
 from ..databases.fish import FISH_DATABASE
 
 USERS_PER_PAGE = 20
+SPECIES_PER_PAGE = 10
+MEDALS = ("🥇", "🥈", "🥉")
+
+
+def format_record_value(value: float, sort_by: str) -> str:
+    """Format a weight (stored in oz) or length (inches) record for display."""
+    if sort_by == "weight":
+        # Weight is stored in oz, convert to lbs for display
+        if value >= 16:
+            return f"{value / 16:.2f} lbs"
+        return f"{value:.2f} oz"
+    # Length is in inches
+    return f"{value:.2f} in"
+
+
+def world_angler_name(cog: "GreenacresFishing", guild_id: int, user_id: int) -> str:
+    """An angler on the world boards, with the server they fish in (hidden if it has since opted out)."""
+    conf = cog.db.configs.get(guild_id)
+    if conf is None or not conf.world_records_public:
+        return "An angler (another server)"
+    guild = cog.bot.get_guild(guild_id)
+    member = guild.get_member(user_id) if guild else None
+    name = member.display_name if member else f"User {user_id}"
+    return f"{name} ({guild.name if guild else 'another server'})"
+
+
+def rank_prefix(rank: int) -> str:
+    return MEDALS[rank - 1] if rank <= len(MEDALS) else f"**{rank}.**"
 
 
 class LeaderboardView(BackToMenuMixin, BaseView):
@@ -39,11 +67,11 @@ class LeaderboardView(BackToMenuMixin, BaseView):
             color=discord.Color.gold()
         )
         
-        # Get recent catches from all users (last 5 fish caught across the server)
-        # We'll need to track this - for now show stats summary
-        total_fish = sum(u.total_fish_ever_caught for u in conf.users.values())
-        total_sold = sum(u.total_fish_sold for u in conf.users.values())
-        total_anglers = len([u for u in conf.users.values() if u.first_join])
+        # Running totals, kept up to date as users catch and sell
+        boards = conf.boards
+        total_fish = boards.total("total_fish_ever_caught")
+        total_sold = boards.total("total_fish_sold")
+        total_anglers = boards.anglers
         
         embed.add_field(
             name="📊 Server Stats",
@@ -127,6 +155,13 @@ class LeaderboardView(BackToMenuMixin, BaseView):
         view = FishTypeSelectView(cog=self.cog, author=self.author)
         embed = view.create_embed()
         await self.stop_and_update(interaction, view, embed)
+    
+    @discord.ui.button(label="World Records", style=discord.ButtonStyle.secondary, emoji="🌍", row=1)
+    async def world_records(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """View the record holders for every species across all servers."""
+        view = WorldRecordsView(cog=self.cog, author=self.author)
+        embed = view.create_embed()
+        await self.stop_and_update(interaction, view, embed)
 
 
 class BackToLeaderboardMixin:
@@ -187,25 +222,16 @@ class PaginatedLeaderboardView(BackToLeaderboardMixin, BaseView):
         self.board_type = board_type
         self.guild = guild
         self.page = 0
-        self.data: List[Tuple[int, int]] = []
-        self._load_data()
+        self.field = self.BOARD_CONFIG.get(board_type, {}).get("field", "total_fish_ever_caught")
     
-    def _load_data(self):
-        """Load and sort leaderboard data."""
-        conf = self.cog.db.get_conf(self.guild)
-        config = self.BOARD_CONFIG.get(self.board_type, {})
-        field = config.get("field", "total_fish_ever_caught")
-        
-        self.data = [
-            (uid, getattr(user, field, 0))
-            for uid, user in conf.users.items()
-            if getattr(user, field, 0) > 0
-        ]
-        self.data.sort(key=lambda x: x[1], reverse=True)
+    @property
+    def boards(self):
+        """The guild's stat board index (kept sorted as stats change)."""
+        return self.cog.db.get_conf(self.guild).boards
     
     @property
     def total_pages(self) -> int:
-        return max(1, math.ceil(len(self.data) / USERS_PER_PAGE))
+        return max(1, math.ceil(self.boards.count(self.field) / USERS_PER_PAGE))
     
     async def create_embed(self, guild: discord.Guild) -> discord.Embed:
         """Create the paginated leaderboard embed."""
@@ -216,13 +242,14 @@ class PaginatedLeaderboardView(BackToLeaderboardMixin, BaseView):
             color=config.get("color", discord.Color.gold())
         )
         
-        if not self.data:
+        # Boards may have moved on since the last page was drawn
+        self.page = min(self.page, self.total_pages - 1)
+        start_idx = self.page * USERS_PER_PAGE
+        page_data = self.boards.page(self.field, start_idx, USERS_PER_PAGE)
+        
+        if not page_data:
             embed.description = "*No data yet - be the first to fish!*"
         else:
-            start_idx = self.page * USERS_PER_PAGE
-            end_idx = start_idx + USERS_PER_PAGE
-            page_data = self.data[start_idx:end_idx]
-            
             lines = []
             for i, (user_id, value) in enumerate(page_data, start=start_idx + 1):
                 member = guild.get_member(user_id)
@@ -357,12 +384,21 @@ class FishSelectView(BackToLeaderboardMixin, BaseView):
         end_idx = start_idx + self.FISH_PER_PAGE
         page_fish = self.all_fish[start_idx:end_idx]
         
+        records = self.cog.db.get_conf(self.author.guild).records
+        
         options = []
         for fish_id, fish_data in page_fish:
+            description = f"{fish_data['rarity'].title()} | {fish_data['water_type'].title()}"
+            holder = records.holder(fish_id, "weight")
+            if holder:
+                user_id, value = holder
+                member = self.author.guild.get_member(user_id)
+                name = member.display_name if member else f"User {user_id}"
+                description += f" | 🏆 {format_record_value(value, 'weight')} by {name}"
             options.append(discord.SelectOption(
                 label=fish_data["name"],
                 value=fish_id,
-                description=f"{fish_data['rarity'].title()} | {fish_data['water_type'].title()}"
+                description=description[:100]
             ))
         
         if not options:
@@ -544,26 +580,15 @@ class FishRecordLeaderboardView(BackToLeaderboardMixin, BaseView):
         self.guild = guild
         self.page = 0
         self.fish_name = FISH_DATABASE.get(fish_id, {}).get("name", fish_id)
-        self.data: List[Tuple[int, float]] = []
-        self._load_data()
     
-    def _load_data(self):
-        """Load and sort fish record data."""
-        conf = self.cog.db.get_conf(self.guild)
-        
-        field = f"max_{self.sort_by}"
-        
-        self.data = []
-        for uid, user in conf.users.items():
-            record = user.fish_records.get(self.fish_id)
-            if record and record.get(field, 0) > 0:
-                self.data.append((uid, record[field]))
-        
-        self.data.sort(key=lambda x: x[1], reverse=True)
+    @property
+    def records(self):
+        """The guild's per-species record index (kept sorted as records are set)."""
+        return self.cog.db.get_conf(self.guild).records
     
     @property
     def total_pages(self) -> int:
-        return max(1, math.ceil(len(self.data) / USERS_PER_PAGE))
+        return max(1, math.ceil(self.records.count(self.fish_id, self.sort_by) / USERS_PER_PAGE))
     
     async def create_embed(self, guild: discord.Guild) -> discord.Embed:
         """Create the paginated fish record embed."""
@@ -574,13 +599,14 @@ class FishRecordLeaderboardView(BackToLeaderboardMixin, BaseView):
             color=discord.Color.gold()
         )
         
-        if not self.data:
+        # Records index may have moved on since the last page was drawn
+        self.page = min(self.page, self.total_pages - 1)
+        start_idx = self.page * USERS_PER_PAGE
+        page_data = self.records.page(self.fish_id, self.sort_by, start_idx, USERS_PER_PAGE)
+        
+        if not page_data:
             embed.description = f"*No one has caught a {self.fish_name} yet!*"
         else:
-            start_idx = self.page * USERS_PER_PAGE
-            end_idx = start_idx + USERS_PER_PAGE
-            page_data = self.data[start_idx:end_idx]
-            
             lines = []
             for i, (user_id, value) in enumerate(page_data, start=start_idx + 1):
                 member = guild.get_member(user_id)
@@ -596,17 +622,7 @@ class FishRecordLeaderboardView(BackToLeaderboardMixin, BaseView):
                 else:
                     prefix = f"**{i}.**"
                 
-                # Format value based on sort type
-                if self.sort_by == "weight":
-                    # Weight is stored in oz, convert to lbs for display
-                    if value >= 16:
-                        display_value = f"{value / 16:.2f} lbs"
-                    else:
-                        display_value = f"{value:.2f} oz"
-                else:
-                    # Length is in inches
-                    display_value = f"{value:.2f} in"
-                
+                display_value = format_record_value(value, self.sort_by)
                 lines.append(f"{prefix} {name}  -  **{display_value}**")
             
             embed.description = "\n".join(lines)
@@ -631,3 +647,150 @@ class FishRecordLeaderboardView(BackToLeaderboardMixin, BaseView):
         """Go to next page (wraps to first)."""
         self.page = (self.page + 1) % self.total_pages
         await self._update_page(interaction)
+
+
+class WorldRecordsView(BackToLeaderboardMixin, BaseView):
+    """World record holder for every species, across all servers."""
+    
+    def __init__(self, cog: "GreenacresFishing", author: discord.Member, sort_by: str = "weight"):
+        super().__init__(cog=cog, author=author)
+        self.sort_by = sort_by
+        self.page = 0
+        self.species_select: Optional[discord.ui.Select] = None
+    
+    @property
+    def species(self) -> List[str]:
+        """Species with a world record, by name."""
+        fish_ids = self.cog.world_records.species(self.sort_by)
+        return sorted(fish_ids, key=lambda fish_id: FISH_DATABASE.get(fish_id, {}).get("name", fish_id))
+    
+    def create_embed(self) -> discord.Embed:
+        sort_emoji = "⚖️" if self.sort_by == "weight" else "📏"
+        embed = discord.Embed(
+            title=f"🌍 World Records - {sort_emoji} {self.sort_by.title()}",
+            color=discord.Color.gold()
+        )
+        
+        species = self.species
+        total_pages = max(1, math.ceil(len(species) / SPECIES_PER_PAGE))
+        self.page = min(self.page, total_pages - 1)
+        page_species = species[self.page * SPECIES_PER_PAGE:(self.page + 1) * SPECIES_PER_PAGE]
+        
+        if not page_species:
+            embed.description = "*No records have been set anywhere yet!*"
+        else:
+            lines = []
+            for fish_id in page_species:
+                guild_id, user_id, value = self.cog.world_records.holder(fish_id, self.sort_by)
+                fish_name = FISH_DATABASE.get(fish_id, {}).get("name", fish_id)
+                name = world_angler_name(self.cog, guild_id, user_id)
+                lines.append(f"🏆 **{fish_name}**  -  **{format_record_value(value, self.sort_by)}** by {name}")
+            embed.description = "\n".join(lines)
+        
+        self._set_species_select(page_species)
+        embed.set_footer(
+            text=f"Page {self.page + 1}/{total_pages} | Pick a species to see its top anglers | "
+            f"Servers join with fishset worldrecords"
+        )
+        return embed
+    
+    def _set_species_select(self, page_species: List[str]):
+        """Swap in a dropdown for the species on the current page."""
+        if self.species_select is not None:
+            self.remove_item(self.species_select)
+            self.species_select = None
+        if not page_species:
+            return
+        self.species_select = discord.ui.Select(
+            placeholder="View a species' world rankings...",
+            options=[
+                discord.SelectOption(label=FISH_DATABASE.get(fish_id, {}).get("name", fish_id), value=fish_id)
+                for fish_id in page_species
+            ],
+            row=1
+        )
+        self.species_select.callback = self._species_selected
+        self.add_item(self.species_select)
+    
+    async def _update_page(self, interaction: discord.Interaction):
+        embed = self.create_embed()
+        await interaction.response.edit_message(embed=embed, view=self)
+    
+    async def _species_selected(self, interaction: discord.Interaction):
+        fish_id = interaction.data["values"][0]
+        view = WorldFishRecordsView(cog=self.cog, author=self.author, fish_id=fish_id, sort_by=self.sort_by)
+        embed = view.create_embed()
+        await self.stop_and_update(interaction, view, embed)
+    
+    @discord.ui.button(label="By Weight", style=discord.ButtonStyle.primary, emoji="⚖️", row=0)
+    async def sort_by_weight(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.sort_by = "weight"
+        self.page = 0
+        await self._update_page(interaction)
+    
+    @discord.ui.button(label="By Length", style=discord.ButtonStyle.primary, emoji="📏", row=0)
+    async def sort_by_length(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.sort_by = "length"
+        self.page = 0
+        await self._update_page(interaction)
+    
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.primary, row=2)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Go to previous page (wraps to last)."""
+        total_pages = max(1, math.ceil(len(self.species) / SPECIES_PER_PAGE))
+        self.page = (self.page - 1) % total_pages
+        await self._update_page(interaction)
+    
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.primary, row=2)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Go to next page (wraps to first)."""
+        total_pages = max(1, math.ceil(len(self.species) / SPECIES_PER_PAGE))
+        self.page = (self.page + 1) % total_pages
+        await self._update_page(interaction)
+
+
+class WorldFishRecordsView(BackToLeaderboardMixin, BaseView):
+    """Top anglers across all servers for one species."""
+    
+    def __init__(self, cog: "GreenacresFishing", author: discord.Member, fish_id: str, sort_by: str):
+        super().__init__(cog=cog, author=author)
+        self.fish_id = fish_id
+        self.sort_by = sort_by
+        self.fish_name = FISH_DATABASE.get(fish_id, {}).get("name", fish_id)
+    
+    def create_embed(self) -> discord.Embed:
+        sort_emoji = "⚖️" if self.sort_by == "weight" else "📏"
+        embed = discord.Embed(
+            title=f"🌍 {sort_emoji} {self.fish_name} - World {self.sort_by.title()} Records",
+            color=discord.Color.gold()
+        )
+        board = self.cog.world_records.board(self.fish_id, self.sort_by)
+        if not board:
+            embed.description = f"*No one has caught a {self.fish_name} yet!*"
+        else:
+            embed.description = "\n".join(
+                f"{rank_prefix(rank)} {world_angler_name(self.cog, guild_id, user_id)}  -  "
+                f"**{format_record_value(value, self.sort_by)}**"
+                for rank, (guild_id, user_id, value) in enumerate(board, start=1)
+            )
+        embed.set_footer(text=f"Requested by {self.author.display_name}")
+        return embed
+    
+    async def _show(self, interaction: discord.Interaction, sort_by: str):
+        self.sort_by = sort_by
+        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+    
+    @discord.ui.button(label="By Weight", style=discord.ButtonStyle.primary, emoji="⚖️", row=0)
+    async def sort_by_weight(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, "weight")
+    
+    @discord.ui.button(label="By Length", style=discord.ButtonStyle.primary, emoji="📏", row=0)
+    async def sort_by_length(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, "length")
+    
+    @discord.ui.button(label="World Records", style=discord.ButtonStyle.secondary, emoji="🌍", row=3)
+    async def back_to_world(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Return to the world record holders."""
+        view = WorldRecordsView(cog=self.cog, author=self.author, sort_by=self.sort_by)
+        embed = view.create_embed()
+        await self.stop_and_update(interaction, view, embed)
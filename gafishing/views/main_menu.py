@@ -8,12 +8,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..main import GreenacresFishing
 
-from ..commands.helper_functions import (
-    get_game_calendar,
-    get_game_time_of_day,
-    get_game_time_display,
-)
-from ..common.weather import get_weather_for_guild, get_weather_display, get_weather_fishing_message
+from ..commands.helper_functions import get_environment
+from ..common.weather import get_weather_display, get_weather_fishing_message
 
 
 async def create_main_menu_embed(
@@ -37,19 +33,10 @@ async def create_main_menu_embed(
     conf = cog.db.get_conf(guild)
     user_data = conf.get_user(user)
     
-    # Get game time info
-    calendar = get_game_calendar(cog.db, guild)
-    time_of_day = get_game_time_of_day(cog.db, guild)
-    time_display = get_game_time_display(cog.db, guild)
-    
-    # Get weather info
-    weather = get_weather_for_guild(
-        cog.db, 
-        guild, 
-        calendar['season'], 
-        time_of_day['name'],
-        calendar['total_game_days']
-    )
+    # Get game time and weather info
+    env = get_environment(cog.db, guild)
+    time_display = env['time_display']
+    weather = env['weather']
     weather_display = get_weather_display(weather)
     fishing_conditions = get_weather_fishing_message(weather)
     